@@ -0,0 +1,72 @@
+"""
+Gunicorn configuration for the production web server.
+
+Every setting is read from the environment so containers can be tuned
+without rebuilding:
+
+    GUNICORN_BIND                 0.0.0.0:8000
+    GUNICORN_WORKER_CLASS         gthread, or uvicorn.workers.UvicornWorker for ASGI
+    GUNICORN_WORKERS              2 x CPU cores + 1
+    GUNICORN_THREADS              4 (gthread only)
+    GUNICORN_KEEPALIVE            5 seconds
+    GUNICORN_TIMEOUT              30 seconds
+    GUNICORN_GRACEFUL_TIMEOUT     30 seconds
+    GUNICORN_MAX_REQUESTS         1000 (0 disables recycling)
+    GUNICORN_MAX_REQUESTS_JITTER  100
+    GUNICORN_PRELOAD              1
+
+Usage:
+    gunicorn
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker GUNICORN_BIND=0.0.0.0:8001 gunicorn
+"""
+
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def _env_bool(name, default):
+    return os.environ.get(name, default).lower() in ("1", "true", "yes", "on")
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "youtube_api.settings")
+
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+# uvicorn workers serve the ASGI application, so the async views run natively
+wsgi_app = (
+    "youtube_api.asgi:application"
+    if "uvicorn" in worker_class.lower()
+    else "youtube_api.wsgi:application"
+)
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = _env_int("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1)
+threads = _env_int("GUNICORN_THREADS", 4)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+timeout = _env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Recycle workers after a jittered number of requests to cap slow memory
+# growth without restarting them all at once
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("GUNICORN_MAX_REQUESTS_JITTER", 100)
+
+# Import Django once in the master and fork workers from it: faster worker
+# (re)starts and shared memory pages. Startup does no database work, so no
+# connection is inherited across the fork.
+preload_app = _env_bool("GUNICORN_PRELOAD", "1")
+
+accesslog = os.environ.get("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+# Avoid stalls on a disk-backed /tmp in containers
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def post_fork(server, worker):
+    # Defensive: never share a connection opened while preloading
+    from django.db import connections
+
+    connections.close_all()
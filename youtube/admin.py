@@ -1,9 +1,25 @@
 from django.contrib import admin
 from .models import Video, Comment, TaskLog
+from .services.search_service import SearchService
+
+
+class FullTextSearchMixin:
+    """Use the full-text index for the changelist search box."""
+
+    search_type = ""
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        results = SearchService().search(
+            query=search_term, search_type=self.search_type, queryset=queryset
+        )
+        return results, False
 
 
 @admin.register(Video)
-class VideoAdmin(admin.ModelAdmin):
+class VideoAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    search_type = "video"
     list_display = ["title", "view_count", "like_count", "created_at"]
     list_filter = ["created_at"]
     search_fields = ["title", "description"]
@@ -11,7 +27,8 @@ class VideoAdmin(admin.ModelAdmin):
 
 
 @admin.register(Comment)
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    search_type = "comment"
     list_display = ["author", "video", "like_count", "created_at"]
     list_filter = ["created_at", "video"]
     search_fields = ["author", "content"]
@@ -0,0 +1,3 @@
+"""
+Benchmark helpers used by the ``benchmark_*`` management commands.
+"""
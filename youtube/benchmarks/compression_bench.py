@@ -0,0 +1,140 @@
+"""
+Benchmarks for response compression: bandwidth saved versus CPU spent.
+
+For each available encoding and level the payload is compressed and
+decompressed repeatedly. The results show the compressed size and ratio,
+the server's compression cost, the client's decompression cost and the
+time to transfer the body over a link of the given speed, so levels can be
+compared on total time to deliver a response.
+"""
+
+import statistics
+import time
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from django.test import Client
+from django.utils import timezone
+
+from youtube.compression import LEVELS, available_encodings, compress, decompress
+from youtube.renderers import ORJSONRenderer
+
+# Levels measured by default; each is clamped to what the encoding supports
+DEFAULT_LEVELS = {"gzip": [1, 6, 9], "br": [1, 4, 6, 11], "zstd": [1, 3, 9, 19]}
+
+
+def synthetic_list_page(rows: int = 100) -> bytes:
+    """Render a video list page shaped like ``GET /api/videos/``."""
+    now = timezone.now()
+    results = [
+        {
+            "id": index,
+            "title": f"Video {index}: benchmark payload",
+            "description": f"Description of video {index} " * 4,
+            "url": f"https://youtube.com/watch?v=bench{index:06d}",
+            "thumbnail_url": f"https://img.youtube.com/vi/bench{index:06d}/0.jpg",
+            "duration": 60 + index % 3600,
+            "view_count": index * 137,
+            "like_count": index * 7,
+            "comments_count": index % 50,
+            "created_at": now - timedelta(minutes=index),
+            "updated_at": now,
+        }
+        for index in range(rows)
+    ]
+    return ORJSONRenderer().render(
+        {"count": rows, "next": None, "previous": None, "results": results}
+    )
+
+
+def fetch_payload(path: str) -> bytes:
+    """Fetch ``path`` from this project's API without compression."""
+    response = Client().get(path, HTTP_ACCEPT_ENCODING="identity")
+    if response.status_code != 200:
+        raise ValueError(f"GET {path} returned {response.status_code}")
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def measure_level(
+    payload: bytes,
+    encoding: str,
+    level: int,
+    *,
+    iterations: int,
+    link_mbps: float,
+) -> Dict[str, Any]:
+    compress_times: List[float] = []
+    decompress_times: List[float] = []
+
+    for _ in range(iterations):
+        started = time.perf_counter()
+        compressed = compress(payload, encoding, level)
+        compress_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        decompress(compressed, encoding)
+        decompress_times.append(time.perf_counter() - started)
+
+    compress_ms = statistics.median(compress_times) * 1000
+    decompress_ms = statistics.median(decompress_times) * 1000
+    transfer_ms = len(compressed) * 8 / (link_mbps * 1_000_000) * 1000
+
+    return {
+        "encoding": encoding,
+        "level": level,
+        "bytes": len(compressed),
+        "ratio": round(len(payload) / len(compressed), 2),
+        "saved_percent": round(100 - len(compressed) * 100 / len(payload), 1),
+        "compress_ms": round(compress_ms, 3),
+        "decompress_ms": round(decompress_ms, 3),
+        "compress_mb_per_second": round(len(payload) / 1e6 / (compress_ms / 1000), 1),
+        "transfer_ms": round(transfer_ms, 3),
+        "total_ms": round(compress_ms + transfer_ms + decompress_ms, 3),
+    }
+
+
+def run_compression_benchmarks(
+    payload: bytes,
+    *,
+    encodings: Optional[Sequence[str]] = None,
+    levels: Optional[Sequence[int]] = None,
+    iterations: int = 20,
+    link_mbps: float = 50.0,
+) -> Dict[str, Dict[str, Any]]:
+    """Measure ``payload`` for every encoding/level, keyed ``"<encoding>-<level>"``.
+
+    ``"identity"`` is included as the uncompressed baseline.
+    """
+    transfer_ms = len(payload) * 8 / (link_mbps * 1_000_000) * 1000
+    results: Dict[str, Dict[str, Any]] = {
+        "identity": {
+            "encoding": "identity",
+            "level": None,
+            "bytes": len(payload),
+            "ratio": 1.0,
+            "saved_percent": 0.0,
+            "compress_ms": 0.0,
+            "decompress_ms": 0.0,
+            "compress_mb_per_second": None,
+            "transfer_ms": round(transfer_ms, 3),
+            "total_ms": round(transfer_ms, 3),
+        }
+    }
+
+    for encoding in encodings or available_encodings():
+        supported = LEVELS[encoding]
+        wanted = levels or DEFAULT_LEVELS[encoding]
+        for level in sorted(
+            {min(max(level, supported[0]), supported[-1]) for level in wanted}
+        ):
+            results[f"{encoding}-{level}"] = measure_level(
+                payload,
+                encoding,
+                level,
+                iterations=iterations,
+                link_mbps=link_mbps,
+            )
+
+    return results
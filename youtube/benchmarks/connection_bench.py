@@ -0,0 +1,95 @@
+"""
+Benchmarks for database connection setup versus reuse.
+
+Each scenario simulates short requests the way Django serves them: old
+connections are closed when a request starts and ends, and one small query
+runs in between. Scenarios differ only in their connection settings, so the
+difference in time per request is the cost of connecting.
+"""
+
+import statistics
+import time
+from typing import Any, Dict, List
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.utils import load_backend
+
+
+def connection_scenarios(alias: str = "default") -> Dict[str, Dict[str, Any]]:
+    """Return settings overrides keyed by scenario name for ``alias``."""
+    scenarios: Dict[str, Dict[str, Any]] = {
+        "new connection per request": {"CONN_MAX_AGE": 0},
+        "persistent connection": {"CONN_MAX_AGE": None, "CONN_HEALTH_CHECKS": False},
+        "persistent connection + health checks": {
+            "CONN_MAX_AGE": None,
+            "CONN_HEALTH_CHECKS": True,
+        },
+    }
+
+    if connections[alias].vendor == "postgresql":
+        try:
+            import psycopg_pool  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            options = dict(connections.settings[alias].get("OPTIONS", {}))
+            options.setdefault("pool", True)
+            scenarios["psycopg pool"] = {"CONN_MAX_AGE": 0, "OPTIONS": options}
+
+    return scenarios
+
+
+def measure_requests(
+    settings_dict: Dict[str, Any], *, alias: str, requests: int
+) -> Dict[str, Any]:
+    """Run ``requests`` simulated requests on a private connection."""
+    backend = load_backend(settings_dict["ENGINE"])
+    conn = backend.DatabaseWrapper(settings_dict, f"{alias}_connection_bench")
+    connects = 0
+
+    def count_connect(sender, connection, **kwargs):
+        nonlocal connects
+        if connection is conn:
+            connects += 1
+
+    connection_created.connect(count_connect)
+    timings: List[float] = []
+
+    try:
+        for _ in range(requests):
+            started = time.perf_counter()
+            # request_started / request_finished both run close_old_connections
+            conn.close_if_unusable_or_obsolete()
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            conn.close_if_unusable_or_obsolete()
+            timings.append(time.perf_counter() - started)
+    finally:
+        connection_created.disconnect(count_connect)
+        conn.close()
+        if hasattr(conn, "close_pool"):
+            conn.close_pool()
+
+    return {
+        "requests": requests,
+        "connects": connects,
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "mean_ms": round(statistics.mean(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+        "total_ms": round(sum(timings) * 1000, 3),
+    }
+
+
+def run_connection_benchmarks(
+    *, alias: str = "default", requests: int = 200
+) -> Dict[str, Dict[str, Any]]:
+    """Measure every scenario from ``connection_scenarios`` against ``alias``."""
+    results = {}
+
+    for name, overrides in connection_scenarios(alias).items():
+        settings_dict = {**connections.settings[alias], **overrides}
+        results[name] = measure_requests(settings_dict, alias=alias, requests=requests)
+
+    return results
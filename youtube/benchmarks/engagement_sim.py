@@ -0,0 +1,270 @@
+"""
+Large-scale engagement simulation for load generation.
+
+Traffic follows a Zipf distribution over the whole catalogue (the video at
+popularity rank r receives a share proportional to ``r ** -s``) and a
+diurnal rate that peaks at ``peak_hour`` and averages ``rate`` views per
+second over a day, with ``like_rate`` likes per view. Each tick covers
+``tick_seconds`` of simulated time.
+
+Videos are walked in id order with keyset pagination, ``chunk_size`` at a
+time. The views and likes sampled for a chunk are aggregated per video and
+applied by a sink: ``DatabaseSink`` writes them with one UPDATE per distinct
+delta, ``HttpSink`` replays them as requests to the counter endpoints.
+"""
+
+import math
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from django.urls import reverse
+from django.utils import timezone
+
+from youtube.models import Video
+from youtube.services import EngagementService, VideoService
+
+from .http_load import run_scenario
+
+Deltas = Dict[int, Tuple[int, int]]
+
+# Ranks summed exactly before the tail is approximated by an integral
+EXACT_NORM_TERMS = 10000
+
+
+def zipf_norm(n: int, s: float) -> float:
+    """Return ``sum(r ** -s for r in 1..n)``, approximating the tail for large n."""
+    exact = min(n, EXACT_NORM_TERMS)
+    total = math.fsum(r**-s for r in range(1, exact + 1))
+    if n > exact:
+        lower, upper = exact + 0.5, n + 0.5
+        if s == 1:
+            total += math.log(upper / lower)
+        else:
+            total += (upper ** (1 - s) - lower ** (1 - s)) / (1 - s)
+    return total
+
+
+def poisson(rng: random.Random, lam: float) -> int:
+    """Sample a Poisson count; large means use the normal approximation."""
+    if lam <= 0:
+        return 0
+    if lam > 30:
+        return max(0, round(rng.gauss(lam, math.sqrt(lam))))
+
+    limit, count, product = math.exp(-lam), 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+class DatabaseSink:
+    """Apply aggregated deltas directly through the services."""
+
+    name = "db"
+
+    def __init__(self):
+        self.video_service = VideoService()
+        self.engagement_service = EngagementService()
+
+    def apply(self, deltas: Deltas, at: datetime) -> Dict[str, int]:
+        applied = self.video_service.add_engagement(deltas=deltas)
+        self.engagement_service.record_many(deltas=deltas, at=at)
+        return {"events": applied["views"] + applied["likes"], "errors": 0}
+
+    def close(self) -> None:
+        pass
+
+
+class HttpSink:
+    """Replay aggregated deltas as increment_views and like requests."""
+
+    name = "http"
+
+    def __init__(self, transport, *, concurrency: int = 8, seed: Optional[int] = None):
+        self.transport = transport
+        self.concurrency = concurrency
+        self.random = random.Random(seed)
+
+    def apply(self, deltas: Deltas, at: datetime) -> Dict[str, int]:
+        requests = []
+        for video_id, (views, likes) in deltas.items():
+            requests += [
+                ("POST", reverse("video-increment-views", args=[video_id]))
+            ] * views
+            requests += [("POST", reverse("video-like", args=[video_id]))] * likes
+        if not requests:
+            return {"events": 0, "errors": 0}
+
+        # Interleave videos the way real traffic arrives
+        self.random.shuffle(requests)
+        summary = run_scenario(
+            self.transport,
+            lambda index: (*requests[index], None),
+            total=len(requests),
+            concurrency=self.concurrency,
+        )
+        return {
+            "events": summary["requests"] - summary["errors"],
+            "errors": summary["errors"],
+        }
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class EngagementSimulator:
+    """Sample Zipf/diurnal engagement over the catalogue and feed a sink."""
+
+    def __init__(
+        self,
+        sink,
+        *,
+        rate: float = 100.0,
+        zipf_s: float = 1.1,
+        amplitude: float = 0.5,
+        peak_hour: float = 20.0,
+        like_rate: float = 0.04,
+        chunk_size: int = 5000,
+        seed: Optional[int] = None,
+    ):
+        if not 0 <= amplitude <= 1:
+            raise ValueError("amplitude must be between 0 and 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.sink = sink
+        self.rate = rate
+        self.zipf_s = zipf_s
+        self.amplitude = amplitude
+        self.peak_hour = peak_hour
+        self.like_rate = like_rate
+        self.chunk_size = chunk_size
+        self.random = random.Random(seed)
+        # (catalogue size, stride) fixed on the first tick so popularity
+        # ranks stay stable for the whole run
+        self.ranking: Optional[Tuple[int, int]] = None
+
+    def diurnal_factor(self, at: datetime) -> float:
+        """Rate multiplier at ``at``; averages 1 over a day."""
+        local = timezone.localtime(at)
+        hour = local.hour + local.minute / 60 + local.second / 3600
+        return 1 + self.amplitude * math.cos(2 * math.pi * (hour - self.peak_hour) / 24)
+
+    def iter_chunks(self) -> Iterator[List[int]]:
+        """Yield video ids in id order, ``chunk_size`` at a time."""
+        last_id = 0
+        while True:
+            ids = list(
+                Video.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[: self.chunk_size]
+            )
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def rank_stride(self, catalogue_size: int) -> int:
+        """Pick a stride coprime with ``catalogue_size``.
+
+        Position p in id order gets rank ``(p * stride) % n + 1``, a
+        permutation that decouples popularity from id without loading ids.
+        """
+        if catalogue_size < 2:
+            return 1
+        while True:
+            stride = self.random.randrange(1, catalogue_size)
+            if math.gcd(stride, catalogue_size) == 1:
+                return stride
+
+    def tick(self, at: datetime, seconds: float) -> Dict[str, Any]:
+        """Simulate ``seconds`` of traffic starting at ``at``."""
+        catalogue_size = Video.objects.count()
+        expected = self.rate * seconds * self.diurnal_factor(at)
+        result = {
+            "at": at.isoformat(),
+            "expected_events": round(expected * (1 + self.like_rate), 1),
+            "events": 0,
+            "errors": 0,
+            "chunks": 0,
+        }
+        if not catalogue_size:
+            return result
+
+        if self.ranking is None:
+            self.ranking = (catalogue_size, self.rank_stride(catalogue_size))
+        ranked, stride = self.ranking
+        norm = zipf_norm(catalogue_size, self.zipf_s)
+        position = 0
+
+        for ids in self.iter_chunks():
+            weights = []
+            for _ in ids:
+                if position < ranked:
+                    rank = position * stride % ranked + 1
+                else:
+                    # Videos created since the first tick join the tail
+                    rank = position + 1
+                weights.append(rank**-self.zipf_s)
+                position += 1
+
+            # Poisson splitting: sample the chunk's total, then place events
+            share = expected * math.fsum(weights) / norm
+            views = Counter(
+                self.random.choices(ids, weights, k=poisson(self.random, share))
+            )
+            likes = Counter(
+                self.random.choices(
+                    ids, weights, k=poisson(self.random, share * self.like_rate)
+                )
+            )
+            deltas = {
+                video_id: (views[video_id], likes[video_id])
+                for video_id in views.keys() | likes.keys()
+            }
+
+            outcome = self.sink.apply(deltas, at)
+            result["events"] += outcome["events"]
+            result["errors"] += outcome["errors"]
+            result["chunks"] += 1
+
+        return result
+
+    def run(
+        self,
+        *,
+        ticks: int,
+        tick_seconds: float = 60.0,
+        start: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Run ``ticks`` consecutive ticks as fast as the sink allows."""
+        at = start or timezone.now()
+        rows = []
+
+        started = time.perf_counter()
+        try:
+            for _ in range(ticks):
+                tick_started = time.perf_counter()
+                row = self.tick(at, tick_seconds)
+                elapsed = time.perf_counter() - tick_started
+                row["elapsed_seconds"] = round(elapsed, 4)
+                row["events_per_second"] = round(row["events"] / (elapsed or 1e-9), 2)
+                rows.append(row)
+                at += timedelta(seconds=tick_seconds)
+        finally:
+            self.sink.close()
+        elapsed = time.perf_counter() - started
+
+        events = sum(row["events"] for row in rows)
+        return {
+            "events": events,
+            "errors": sum(row["errors"] for row in rows),
+            "simulated_seconds": ticks * tick_seconds,
+            "elapsed_seconds": round(elapsed, 4),
+            "events_per_second": round(events / (elapsed or 1e-9), 2),
+            "ticks": rows,
+        }
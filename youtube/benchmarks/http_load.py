@@ -0,0 +1,248 @@
+"""
+Concurrent HTTP load generation against the REST API.
+
+Requests are sent either in-process through ``django.test.Client`` (no
+server needed) or over the network to a running server with ``requests``.
+"""
+
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+
+from .stats import summarize
+
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+def _default_host() -> str:
+    """Pick a concrete host name accepted by ``ALLOWED_HOSTS``."""
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*" and not host.startswith("."):
+            return host
+    return "localhost"
+
+
+class DjangoClientTransport:
+    """Send requests through the full Django stack without a server."""
+
+    def __init__(self, host: Optional[str] = None):
+        self.host = host or _default_host()
+        self._local = threading.local()
+
+    def _client(self) -> Client:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = Client(HTTP_HOST=self.host, raise_request_exception=False)
+            self._local.client = client
+        return client
+
+    def request(
+        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, int]:
+        client = self._client()
+        if method == "GET":
+            response = client.get(path)
+        else:
+            response = client.generic(
+                method,
+                path,
+                json.dumps(data or {}),
+                content_type="application/json",
+            )
+        return response.status_code, len(response.content)
+
+    def close(self) -> None:
+        connections.close_all()
+
+
+class HttpTransport:
+    """Send requests to a running server, one keep-alive session per thread."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def request(
+        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, int]:
+        response = self._session().request(
+            method, f"{self.base_url}{path}", json=data, timeout=self.timeout
+        )
+        return response.status_code, len(response.content)
+
+    def close(self) -> None:
+        session = getattr(self._local, "session", None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+
+
+def build_scenarios(
+    video_ids: List[int], *, page_size: int = 20
+) -> Dict[str, Callable[[int], RequestSpec]]:
+    """Return request builders keyed by scenario name.
+
+    Each builder maps a request index to ``(method, path, json_body)`` and is
+    deterministic for a given index so runs are comparable.
+    """
+    run_prefix = uuid.uuid4().hex[:8]
+
+    def pick_video(index: int) -> int:
+        return random.Random(index).choice(video_ids)
+
+    def list_videos(
+        prefix: str = "", size: int = page_size
+    ) -> Callable[[int], RequestSpec]:
+        pages = max(1, len(video_ids) // size)
+
+        def build(index: int) -> RequestSpec:
+            page = index % pages + 1
+            path = reverse(f"{prefix}video-list")
+            return ("GET", f"{path}?page={page}&page_size={size}", None)
+
+        return build
+
+    def video_action(name: str, method: str) -> Callable[[int], RequestSpec]:
+        def build(index: int) -> RequestSpec:
+            return (method, reverse(name, args=[pick_video(index)]), None)
+
+        return build
+
+    def create_video(index: int) -> RequestSpec:
+        video_id = f"load-{run_prefix}-{index}"
+        return (
+            "POST",
+            reverse("video-list"),
+            {
+                "title": f"Load test video {index}",
+                "description": "Created by the API benchmark",
+                "url": f"https://youtube.com/watch?v={video_id}",
+                "duration": 600,
+            },
+        )
+
+    return {
+        # No database work; measures the server and middleware overhead alone
+        "health": lambda index: ("GET", reverse("healthz"), None),
+        "list": list_videos(),
+        # Large pages, where JSON rendering dominates; compare bytes/sec
+        "list_page_100": list_videos(size=100),
+        "detail": video_action("video-detail", "GET"),
+        "create": create_video,
+        "increment_views": video_action("video-increment-views", "POST"),
+        "like": video_action("video-like", "POST"),
+        # Native async views, meant to be compared under an ASGI server
+        "async_list": list_videos("async-"),
+        "async_detail": video_action("async-video-detail", "GET"),
+        "async_increment_views": video_action("async-video-increment-views", "POST"),
+        "async_like": video_action("async-video-like", "POST"),
+    }
+
+
+def run_scenario(
+    transport,
+    build_request: Callable[[int], RequestSpec],
+    *,
+    total: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """Send ``total`` requests using ``concurrency`` client threads."""
+    counter = itertools.count()
+    threaded = concurrency > 1
+
+    def worker() -> Tuple[List[float], int, int]:
+        latencies: List[float] = []
+        errors = 0
+        total_bytes = 0
+
+        try:
+            while (index := next(counter)) < total:
+                method, path, data = build_request(index)
+                started = time.perf_counter()
+                try:
+                    status, size = transport.request(method, path, data)
+                except Exception:
+                    status, size = 0, 0
+                duration = time.perf_counter() - started
+
+                if 200 <= status < 300:
+                    latencies.append(duration)
+                    total_bytes += size
+                else:
+                    errors += 1
+        finally:
+            # Worker threads own their DB connections / sessions
+            if threaded:
+                transport.close()
+
+        return latencies, errors, total_bytes
+
+    started = time.perf_counter()
+    if threaded:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            outcomes = [
+                f.result() for f in [pool.submit(worker) for _ in range(concurrency)]
+            ]
+    else:
+        outcomes = [worker()]
+    elapsed = time.perf_counter() - started
+
+    latencies = [value for outcome in outcomes for value in outcome[0]]
+    return summarize(
+        latencies,
+        errors=sum(outcome[1] for outcome in outcomes),
+        elapsed=elapsed,
+        total_bytes=sum(outcome[2] for outcome in outcomes),
+    )
+
+
+def run_load(
+    transport,
+    video_ids: List[int],
+    *,
+    scenarios: List[str],
+    requests_per_scenario: int,
+    concurrency_levels: List[int],
+) -> Dict[str, Dict[str, Any]]:
+    """Run each named scenario at each concurrency level and return summaries.
+
+    Results are keyed by scenario name, or ``"<name>@c<level>"`` when more
+    than one concurrency level is requested.
+    """
+    builders = build_scenarios(video_ids)
+    unknown = set(scenarios) - set(builders)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in scenarios:
+        for level in concurrency_levels:
+            key = name if len(concurrency_levels) == 1 else f"{name}@c{level}"
+            summary = run_scenario(
+                transport,
+                builders[name],
+                total=requests_per_scenario,
+                concurrency=level,
+            )
+            results[key] = {**summary, "concurrency": level}
+
+    return results
@@ -0,0 +1,150 @@
+"""
+Microbenchmarks for service-layer hot paths at growing data sizes.
+
+All rows are written inside one transaction that is rolled back at the end,
+so the benchmark leaves the database untouched.
+"""
+
+import random
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ..models import Video
+from ..services import (
+    CommentService,
+    ContentPopulationService,
+    SyntheticDataService,
+    VideoService,
+)
+from .stubs import StubOpenAIClient
+
+PAGE_SIZE = 20
+
+
+def measure(func: Callable[[], Any], *, repeat: int) -> Dict[str, Any]:
+    """Time ``func`` ``repeat`` times and count the queries of the last run."""
+    timings: List[float] = []
+    queries = 0
+
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        queries = len(captured.captured_queries)
+
+    return {
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "max_ms": round(max(timings) * 1000, 3),
+        "queries": queries,
+    }
+
+
+def build_cases(video_ids: List[int], rng: random.Random) -> Dict[str, Callable]:
+    """Return the service calls under test keyed by case name."""
+    video_service = VideoService()
+    comment_service = CommentService()
+    content_service = ContentPopulationService(openai_client=StubOpenAIClient())
+
+    def first_page(queryset):
+        # What the list endpoint does: one COUNT plus one page of rows
+        queryset.count()
+        list(queryset[:PAGE_SIZE])
+
+    return {
+        # Reference point without the Count("comments") annotation
+        "Video.objects.all (page)": lambda: first_page(Video.objects.all()),
+        "VideoService.get_all (page)": lambda: first_page(video_service.get_all()),
+        "VideoService.get_by_id": lambda: video_service.get_by_id(
+            video_id=rng.choice(video_ids)
+        ),
+        "VideoService.increment_views": lambda: video_service.increment_views(
+            video_id=rng.choice(video_ids)
+        ),
+        "CommentService.create": lambda: comment_service.create(
+            video_id=rng.choice(video_ids),
+            author="BenchUser",
+            content="Benchmark comment",
+        ),
+        "simulate_engagement_for_videos": lambda: (
+            content_service.simulate_engagement_for_videos(video_count=5)
+        ),
+        "get_engagement_statistics": content_service.get_engagement_statistics,
+        "generate_comments_for_video (stub LLM)": lambda: (
+            content_service.generate_comments_for_video(rng.choice(video_ids), 3)
+        ),
+    }
+
+
+def run_service_benchmarks(
+    sizes: List[int],
+    *,
+    comments_per_video: int = 10,
+    repeat: int = 5,
+    seed: int = 0,
+    on_size: Callable[[int], None] = lambda size: None,
+) -> Dict[str, Dict[str, Any]]:
+    """Grow the dataset through ``sizes`` (comment counts) and time each case.
+
+    Returns rows keyed by ``"<case>@<size>"``.
+    """
+    rng = random.Random(seed)
+    data_service = SyntheticDataService(seed=seed)
+    results: Dict[str, Dict[str, Any]] = {}
+
+    with transaction.atomic():
+        video_ids: List[int] = []
+        comment_total = 0
+
+        for size in sorted(sizes):
+            on_size(size)
+
+            target_videos = max(1, size // comments_per_video)
+            new_videos = Video.objects.bulk_create(
+                data_service.build_videos(target_videos - len(video_ids)),
+                batch_size=1000,
+            )
+            data_service.statistics_service.add_videos(new_videos)
+            video_ids.extend(video.id for video in new_videos)
+            comment_total += data_service.seed_comments(
+                video_ids=video_ids, comment_count=size - comment_total
+            )
+
+            for name, func in build_cases(video_ids, rng).items():
+                row = measure(func, repeat=repeat)
+                row.update(case=name, comments=size, videos=len(video_ids))
+                results[f"{name}@{size}"] = row
+
+        transaction.set_rollback(True)
+
+    return results
+
+
+def render_scaling_curves(results: Dict[str, Dict[str, Any]], width: int = 40) -> str:
+    """Render median time per case and size as bars scaled to the case's slowest run."""
+    by_case: Dict[str, List[Dict[str, Any]]] = {}
+    for row in results.values():
+        by_case.setdefault(row["case"], []).append(row)
+
+    lines = []
+
+    for case, rows in by_case.items():
+        rows.sort(key=lambda row: row["comments"])
+        slowest = max(row["median_ms"] for row in rows) or 1
+        lines.append(case)
+        for row in rows:
+            bar = "#" * max(1, round(row["median_ms"] / slowest * width))
+            lines.append(
+                f"  {row['comments']:>9} comments {row['median_ms']:>10.2f} ms "
+                f"{row['queries']:>3}q {bar}"
+            )
+        if len(rows) > 1 and rows[0]["median_ms"]:
+            growth = rows[-1]["median_ms"] / rows[0]["median_ms"]
+            lines.append(f"  growth x{growth:.1f}")
+
+    return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""
+Process startup benchmarks: import time, wall time and peak RSS.
+
+Each target is started in a fresh interpreter with ``python -X importtime``,
+the same way the web server and Celery workers load the project, so the
+numbers include everything a new process has to import.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from django.conf import settings
+
+STARTUP_SCRIPTS = {
+    # What a WSGI/ASGI worker loads before serving its first request
+    "web": (
+        "from django.core.wsgi import get_wsgi_application\n"
+        "get_wsgi_application()\n"
+        "from django.urls import get_resolver\n"
+        "get_resolver().url_patterns\n"
+    ),
+    # What a Celery worker loads before consuming its first task
+    "worker": (
+        "import django\n"
+        "django.setup()\n"
+        "from youtube_api.celery import app\n"
+        "app.loader.import_default_modules()\n"
+    ),
+}
+
+# Appended to every script; the last stdout line is the peak RSS in KiB
+RSS_PROBE = (
+    "import resource\nprint(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+# Packages the web tier should never need to import
+LLM_MODULES = ["openai", "pydantic"]
+
+
+def parse_importtime(output: str) -> Dict[str, int]:
+    """Map each imported module to its self time in microseconds."""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        try:
+            modules[name.strip()] = int(self_us)
+        except ValueError:
+            # Header row
+            continue
+    return modules
+
+
+def run_startup(target: str) -> Dict[str, Any]:
+    """Start ``target`` once and return its import profile and peak RSS."""
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "youtube_api.settings"
+        ),
+    }
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPTS[target] + RSS_PROBE],
+        capture_output=True,
+        text=True,
+        cwd=settings.BASE_DIR,
+        env=env,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+
+    modules = parse_importtime(completed.stderr)
+    return {
+        "wall_ms": elapsed * 1000,
+        "import_ms": sum(modules.values()) / 1000,
+        "rss_kb": int(completed.stdout.strip().splitlines()[-1]),
+        "modules": modules,
+    }
+
+
+def run_startup_benchmarks(
+    targets: List[str], *, repeat: int = 5
+) -> Dict[str, Dict[str, Any]]:
+    """Start each target ``repeat`` times and report medians."""
+    results = {}
+    for target in targets:
+        runs = [run_startup(target) for _ in range(repeat)]
+        modules = runs[-1]["modules"]
+        results[target] = {
+            "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 1),
+            "import_ms": round(statistics.median(run["import_ms"] for run in runs), 1),
+            "rss_mb": round(statistics.median(run["rss_kb"] for run in runs) / 1024, 1),
+            "modules": len(modules),
+            "llm_modules": [name for name in LLM_MODULES if name in modules],
+        }
+    return results
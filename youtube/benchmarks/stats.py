@@ -0,0 +1,114 @@
+"""
+Statistics helpers shared by the benchmark commands.
+"""
+
+import json
+import math
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile of ``values`` using linear interpolation."""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+
+    if lower == upper:
+        return ordered[lower]
+
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(
+    latencies: List[float], *, errors: int, elapsed: float, total_bytes: int = 0
+) -> Dict[str, Any]:
+    """Summarize per-request latencies (in seconds) into a result row."""
+    requests = len(latencies) + errors
+    elapsed = elapsed or 1e-9
+
+    return {
+        "requests": requests,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 4),
+        "requests_per_second": round(requests / elapsed, 2),
+        "bytes_per_second": round(total_bytes / elapsed, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3)
+        if latencies
+        else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3) if latencies else 0.0,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Return the current git commit hash, if available."""
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def default_output_path(name: str) -> Path:
+    """Build ``benchmark_results/<name>-<timestamp>-<commit>.json``."""
+    stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+    commit = git_commit() or "nogit"
+    return (
+        Path(settings.BASE_DIR) / "benchmark_results" / f"{name}-{stamp}-{commit}.json"
+    )
+
+
+def write_results(path: Path, results: Dict[str, Any]) -> Path:
+    """Write benchmark results as pretty-printed JSON."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, default=str))
+    return path
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], metrics: List[str]
+) -> List[Dict[str, Any]]:
+    """Compare scenario metrics against a baseline result file."""
+    rows = []
+
+    for name, row in current.get("scenarios", {}).items():
+        base_row = baseline.get("scenarios", {}).get(name)
+        if not base_row:
+            continue
+
+        for metric in metrics:
+            before = base_row.get(metric)
+            after = row.get(metric)
+            if before is None or after is None:
+                continue
+
+            change = ((after - before) / before * 100) if before else 0.0
+            rows.append(
+                {
+                    "scenario": name,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change_percent": round(change, 2),
+                }
+            )
+
+    return rows
@@ -0,0 +1,44 @@
+"""
+Offline stand-ins for external clients used during benchmarks.
+"""
+
+import re
+from types import SimpleNamespace
+
+
+class StubOpenAIClient:
+    """Mimic the parts of ``openai.OpenAI`` the services call, without network."""
+
+    CANNED_COMMENT = "Really clear walkthrough, thanks for sharing!"
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self._parse))
+        )
+
+    def _create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=self.CANNED_COMMENT)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    def _parse(self, *, messages, response_format, **kwargs):
+        self.calls += 1
+        match = re.search(r"Generate (\d+)", messages[-1]["content"])
+        count = int(match.group(1)) if match else 5
+
+        parsed = response_format.model_validate(
+            {
+                "comments": [
+                    {
+                        "content": self.CANNED_COMMENT,
+                        "tone": "friendly",
+                        "author_style": "casual",
+                    }
+                    for _ in range(count)
+                ]
+            }
+        )
+        message = SimpleNamespace(parsed=parsed)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
@@ -0,0 +1,44 @@
+"""
+System checks and runtime guards for settings the app depends on.
+
+Leases (``LeaseService``) and comment request coalescing
+(``CommentRequestService``) keep their state in the default cache, so every
+web and worker process must share it. Without ``CACHE_URL`` each process
+gets its own local-memory cache: overlapping periodic runs are not excluded
+and requests from different processes are never merged.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Tags, register
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_MESSAGE = "The default cache is local to each process."
+SHARED_CACHE_HINT = (
+    "Set CACHE_URL to a cache every web and worker process shares, e.g. "
+    "redis://redis:6379/1. Leases and comment request coalescing need it."
+)
+
+
+def cache_is_shared(alias: str = DEFAULT_CACHE_ALIAS) -> bool:
+    return not isinstance(caches[alias], (LocMemCache, DummyCache))
+
+
+def require_shared_cache() -> None:
+    """Raise when ``REQUIRE_SHARED_CACHE`` is set and the cache is per-process."""
+    if settings.REQUIRE_SHARED_CACHE and not cache_is_shared():
+        logger.error(f"{SHARED_CACHE_MESSAGE} {SHARED_CACHE_HINT}")
+        raise ImproperlyConfigured(f"{SHARED_CACHE_MESSAGE} {SHARED_CACHE_HINT}")
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    if settings.REQUIRE_SHARED_CACHE and not cache_is_shared():
+        return [Error(SHARED_CACHE_MESSAGE, hint=SHARED_CACHE_HINT, id="youtube.E001")]
+    return []
@@ -0,0 +1,147 @@
+"""
+Content codings shared by CompressionMiddleware, the export command and the
+compression benchmark.
+
+gzip is always available; brotli ("br") and zstd are used when the
+``brotli`` and ``zstandard`` packages are installed (the "compression" extra).
+"""
+
+import zlib
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # optional, installed with the "compression" extra
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional, installed with the "compression" extra
+    zstandard = None
+
+# Server preference between encodings the client accepts equally
+PREFERENCE = ["zstd", "br", "gzip"]
+
+# Valid levels per encoding (brotli calls them quality)
+LEVELS = {"gzip": range(1, 10), "br": range(0, 12), "zstd": range(1, 23)}
+
+
+def available_encodings() -> List[str]:
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [encoding for encoding in PREFERENCE if installed[encoding]]
+
+
+def default_level(encoding: str) -> int:
+    return settings.COMPRESSION_LEVELS[encoding]
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate(header: str, encodings: Optional[List[str]] = None) -> Optional[str]:
+    """Return the best available encoding for ``header``, or None for identity."""
+    accepted = parse_accept_encoding(header or "")
+    best, best_quality = None, 0.0
+
+    for encoding in available_encodings() if encodings is None else encodings:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class StreamCompressor:
+    """Incremental compressor with the same interface for every encoding.
+
+    ``compress`` may buffer; ``flush`` emits everything written so far as a
+    decodable block so streamed responses make progress; ``finish`` ends
+    the stream.
+    """
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        level = default_level(encoding) if level is None else level
+
+        if encoding == "gzip":
+            # wbits=31 writes a gzip header and trailer around the deflate stream
+            compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self.compress = compressor.compress
+            self.flush = lambda: compressor.flush(zlib.Z_SYNC_FLUSH)
+            self.finish = compressor.flush
+        elif encoding == "br" and brotli is not None:
+            compressor = brotli.Compressor(quality=level)
+            self.compress = compressor.process
+            self.flush = compressor.flush
+            self.finish = compressor.finish
+        elif encoding == "zstd" and zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=level).compressobj()
+            self.compress = compressor.compress
+            self.flush = lambda: compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+            self.finish = compressor.flush
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    compressor = StreamCompressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return zlib.decompress(data, 31)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(data)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def compress_stream(
+    chunks: Iterable[bytes], encoding: str, level: Optional[int] = None
+) -> Iterator[bytes]:
+    """Compress ``chunks``, flushing after each one."""
+    compressor = StreamCompressor(encoding, level)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_stream(
+    chunks: AsyncIterable[bytes], encoding: str, level: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    compressor = StreamCompressor(encoding, level)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
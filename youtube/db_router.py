@@ -0,0 +1,63 @@
+"""
+Database router sending selected reads to read replicas.
+
+Reads go to a replica only inside ``read_from_replica()`` (entered by
+``ReplicaRoutingMiddleware`` for views with ``read_replica = True``), only
+when ``settings.DATABASE_REPLICAS`` is non-empty, and never while the primary
+connection is inside a transaction. Everything else uses ``default``.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_read_from_replica: ContextVar[bool] = ContextVar("read_from_replica", default=False)
+
+
+@contextmanager
+def read_from_replica(enabled: bool = True):
+    """Route ORM reads in this block (and tasks it awaits) to a replica."""
+    token = _read_from_replica.set(enabled)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def enable_read_replica():
+    """Start routing reads to a replica; pass the token to ``reset_read_replica``."""
+    return _read_from_replica.set(True)
+
+
+def reset_read_replica(token: Token) -> None:
+    try:
+        _read_from_replica.reset(token)
+    except ValueError:
+        # Under ASGI, sync middleware hooks run in separate copies of the
+        # request's context, so the token belongs to another copy
+        previous = token.old_value
+        _read_from_replica.set(False if previous is Token.MISSING else previous)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or not _read_from_replica.get():
+            return DEFAULT_DB_ALIAS
+        # Reads inside a transaction must see its own uncommitted writes
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return True
@@ -0,0 +1,193 @@
+"""
+Django management command to load-test the REST API.
+
+Seeds synthetic videos and comments, drives the list, detail, create,
+increment_views and like endpoints with concurrent clients, and stores
+p50/p95/p99 latency and throughput as JSON for comparison across commits.
+
+Usage:
+    USE_SQLITE=1 python manage.py benchmark_api --videos 500 --comments 5000
+    python manage.py benchmark_api --base-url http://127.0.0.1:8000
+    python manage.py benchmark_api --baseline benchmark_results/api-<...>.json
+    python manage.py benchmark_api --scenarios list_page_100 --videos 1000
+    python manage.py benchmark_api --base-url http://127.0.0.1:8001 \
+        --scenarios async_list,async_detail --concurrency 1,16,64
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from youtube.benchmarks.http_load import (
+    DjangoClientTransport,
+    HttpTransport,
+    run_load,
+)
+from youtube.benchmarks.stats import (
+    compare_results,
+    default_output_path,
+    git_commit,
+    write_results,
+)
+from youtube.models import Video
+from youtube.services import SyntheticDataService
+
+DEFAULT_SCENARIOS = "list,detail,create,increment_views,like"
+
+
+class Command(BaseCommand):
+    help = """
+    Load-test the video API endpoints and report latency percentiles.
+
+    Requests run in-process through the Django test client by default. Pass
+    --base-url to target a running server instead; seeding always writes to
+    the database configured in settings, so point both at the same database.
+
+    To compare WSGI and ASGI concurrency limits, sweep --concurrency against
+    a WSGI server with the sync scenarios and against uvicorn with the
+    async_* scenarios.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--videos", type=int, default=200)
+        parser.add_argument("--comments", type=int, default=2000)
+        parser.add_argument(
+            "--skip-seed",
+            action="store_true",
+            help="Benchmark against existing rows instead of seeding new ones",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Requests per scenario",
+        )
+        parser.add_argument(
+            "--concurrency",
+            default="8",
+            help="Client threads, or a comma-separated sweep such as 1,16,64",
+        )
+        parser.add_argument(
+            "--scenarios",
+            default=DEFAULT_SCENARIOS,
+            help=f"Comma-separated scenarios (default: {DEFAULT_SCENARIOS})",
+        )
+        parser.add_argument(
+            "--base-url",
+            help="Send requests to a running server instead of in-process",
+        )
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument(
+            "--baseline",
+            help="Previous results file to compare against",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            concurrency_levels = [
+                int(level) for level in str(options["concurrency"]).split(",")
+            ]
+        except ValueError:
+            raise CommandError("--concurrency must be an integer or a list of integers")
+
+        video_ids = self._prepare_data(options)
+        scenarios = [name.strip() for name in options["scenarios"].split(",")]
+
+        if options["base_url"]:
+            transport = HttpTransport(options["base_url"])
+        else:
+            transport = DjangoClientTransport()
+
+        self.stdout.write(
+            f"Running {', '.join(scenarios)} with {options['concurrency']} clients "
+            f"x {options['requests']} requests each..."
+        )
+
+        try:
+            scenario_results = run_load(
+                transport,
+                video_ids,
+                scenarios=scenarios,
+                requests_per_scenario=options["requests"],
+                concurrency_levels=concurrency_levels,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        results = {
+            "meta": {
+                "benchmark": "api",
+                "git_commit": git_commit(),
+                "database": connection.vendor,
+                "transport": "http" if options["base_url"] else "in-process",
+                "concurrency": concurrency_levels,
+                "requests_per_scenario": options["requests"],
+                "videos": len(video_ids),
+            },
+            "scenarios": scenario_results,
+        }
+
+        self._print_results(scenario_results)
+
+        output = (
+            Path(options["output"]) if options["output"] else default_output_path("api")
+        )
+        write_results(output, results)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+        if options["baseline"]:
+            self._print_comparison(results, options["baseline"])
+
+    def _prepare_data(self, options):
+        """Seed synthetic rows, or collect existing video ids."""
+        if options["skip_seed"]:
+            video_ids = list(Video.objects.values_list("id", flat=True)[:10000])
+            if not video_ids:
+                raise CommandError("No videos found; run without --skip-seed")
+            return video_ids
+
+        self.stdout.write(
+            f"Seeding {options['videos']} videos and {options['comments']} comments..."
+        )
+        result = SyntheticDataService().seed(
+            video_count=options["videos"], comment_count=options["comments"]
+        )
+        if not result["video_ids"]:
+            raise CommandError("--videos must be at least 1")
+        return result["video_ids"]
+
+    def _print_results(self, scenario_results):
+        header = (
+            f"\n{'scenario':<28}{'req/s':>10}{'MB/s':>10}{'p50 ms':>10}"
+            f"{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}"
+        )
+        self.stdout.write(header)
+        for name, row in scenario_results.items():
+            self.stdout.write(
+                f"{name:<28}{row['requests_per_second']:>10.1f}"
+                f"{row['bytes_per_second'] / 1e6:>10.2f}{row['p50_ms']:>10.2f}"
+                f"{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}{row['errors']:>8}"
+            )
+
+    def _print_comparison(self, results, baseline_path):
+        try:
+            baseline = json.loads(Path(baseline_path).read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read baseline: {e}")
+
+        rows = compare_results(
+            results,
+            baseline,
+            ["requests_per_second", "bytes_per_second", "p95_ms", "p99_ms"],
+        )
+        self.stdout.write(
+            f"\nCompared with {baseline.get('meta', {}).get('git_commit')}:"
+        )
+        for row in rows:
+            self.stdout.write(
+                f"  {row['scenario']:<28}{row['metric']:<22}"
+                f"{row['baseline']:>10} -> {row['current']:<10}"
+                f"({row['change_percent']:+.1f}%)"
+            )
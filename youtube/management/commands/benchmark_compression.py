@@ -0,0 +1,141 @@
+"""
+Django management command to compare response compression levels.
+
+Compresses a sample response with every available encoding (gzip, and br
+and zstd with the "compression" extra) at several levels, and reports the
+size saved against the CPU spent compressing and decompressing, plus the
+transfer time over a link of ``--link-mbps``.
+
+The payload is a synthetic 100-row video list page unless ``--path``
+fetches a real endpoint from the current database.
+
+Usage:
+    python manage.py benchmark_compression
+    python manage.py benchmark_compression --rows 1000 --link-mbps 10
+    python manage.py benchmark_compression --path "/api/videos/?page_size=100"
+    python manage.py benchmark_compression --encoding gzip --level 1 --level 6
+    python manage.py benchmark_compression --baseline benchmark_results/compression-<...>.json
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from youtube.benchmarks.compression_bench import (
+    fetch_payload,
+    run_compression_benchmarks,
+    synthetic_list_page,
+)
+from youtube.benchmarks.stats import (
+    compare_results,
+    default_output_path,
+    git_commit,
+    write_results,
+)
+from youtube.compression import available_encodings
+
+
+class Command(BaseCommand):
+    help = "Benchmark bandwidth and CPU per compression encoding and level"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--path", help="API path to fetch as the payload")
+        parser.add_argument(
+            "--encoding",
+            action="append",
+            choices=["gzip", "br", "zstd"],
+            help="Encoding to measure (repeatable, default: all available)",
+        )
+        parser.add_argument(
+            "--level",
+            action="append",
+            type=int,
+            help="Level to measure (repeatable, default: a spread per encoding)",
+        )
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--link-mbps", type=float, default=50.0)
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument(
+            "--baseline",
+            help="Previous results file to compare against",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+        if options["link_mbps"] <= 0:
+            raise CommandError("--link-mbps must be positive")
+        missing = set(options["encoding"] or []) - set(available_encodings())
+        if missing:
+            raise CommandError(
+                f"Not installed: {', '.join(sorted(missing))} "
+                '(install the "compression" extra)'
+            )
+
+        if options["path"]:
+            try:
+                payload = fetch_payload(options["path"])
+            except ValueError as e:
+                raise CommandError(str(e))
+        else:
+            payload = synthetic_list_page(options["rows"])
+
+        results = run_compression_benchmarks(
+            payload,
+            encodings=options["encoding"],
+            levels=options["level"],
+            iterations=options["iterations"],
+            link_mbps=options["link_mbps"],
+        )
+
+        self.stdout.write(
+            f"Payload: {len(payload)} bytes, link: {options['link_mbps']} Mbit/s\n"
+        )
+        self.stdout.write(
+            f"{'scenario':<12}{'bytes':>10}{'ratio':>8}{'compress':>12}"
+            f"{'decompress':>12}{'transfer':>12}{'total':>12}"
+        )
+        for name, row in results.items():
+            self.stdout.write(
+                f"{name:<12}{row['bytes']:>10}{row['ratio']:>8.2f}"
+                f"{row['compress_ms']:>9.3f} ms{row['decompress_ms']:>9.3f} ms"
+                f"{row['transfer_ms']:>9.3f} ms{row['total_ms']:>9.3f} ms"
+            )
+
+        report = {
+            "meta": {
+                "benchmark": "compression",
+                "git_commit": git_commit(),
+                "payload": options["path"]
+                or f"synthetic list page ({options['rows']} rows)",
+                "payload_bytes": len(payload),
+                "iterations": options["iterations"],
+                "link_mbps": options["link_mbps"],
+            },
+            "scenarios": results,
+        }
+
+        output = (
+            Path(options["output"])
+            if options["output"]
+            else default_output_path("compression")
+        )
+        write_results(output, report)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline: {e}")
+
+            for row in compare_results(
+                report, baseline, ["bytes", "compress_ms", "total_ms"]
+            ):
+                self.stdout.write(
+                    f"  {row['scenario']:<12}{row['metric']:<12}"
+                    f"{row['baseline']:>10} -> {row['current']:<10}"
+                    f"({row['change_percent']:+.1f}%)"
+                )
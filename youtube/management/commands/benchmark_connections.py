@@ -0,0 +1,86 @@
+"""
+Django management command to measure database connection reuse savings.
+
+Simulates short requests that each run one query and compares opening a
+new connection per request (CONN_MAX_AGE=0) with persistent connections,
+with and without health checks, and the psycopg pool when it is installed.
+
+Usage:
+    python manage.py benchmark_connections
+    python manage.py benchmark_connections --requests 500 --database replica_1
+    python manage.py benchmark_connections --baseline benchmark_results/connections-<...>.json
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from youtube.benchmarks.connection_bench import run_connection_benchmarks
+from youtube.benchmarks.stats import (
+    compare_results,
+    default_output_path,
+    git_commit,
+    write_results,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-request connection setup against connection reuse"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument(
+            "--baseline",
+            help="Previous results file to compare against",
+        )
+
+    def handle(self, *args, **options):
+        alias = options["database"]
+        if alias not in connections:
+            raise CommandError(f"Unknown database alias: {alias}")
+        if options["requests"] < 1:
+            raise CommandError("--requests must be at least 1")
+
+        results = run_connection_benchmarks(alias=alias, requests=options["requests"])
+
+        for name, row in results.items():
+            self.stdout.write(
+                f"{name:<40}{row['median_ms']:>10.3f} ms/request "
+                f"{row['connects']:>5} connects"
+            )
+
+        payload = {
+            "meta": {
+                "benchmark": "connections",
+                "git_commit": git_commit(),
+                "database": connections[alias].vendor,
+                "alias": alias,
+                "requests": options["requests"],
+            },
+            "scenarios": results,
+        }
+
+        output = (
+            Path(options["output"])
+            if options["output"]
+            else default_output_path("connections")
+        )
+        write_results(output, payload)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline: {e}")
+
+            for row in compare_results(payload, baseline, ["median_ms", "connects"]):
+                self.stdout.write(
+                    f"  {row['scenario']:<40}{row['metric']:<10}"
+                    f"{row['baseline']:>10} -> {row['current']:<10}"
+                    f"({row['change_percent']:+.1f}%)"
+                )
@@ -0,0 +1,97 @@
+"""
+Django management command to microbenchmark service-layer hot paths.
+
+Grows a synthetic dataset through several comment counts, times the video,
+comment and engagement services with a stubbed OpenAI client, and records
+wall time and query count per call. Everything runs inside a transaction
+that is rolled back, so the database is left unchanged.
+
+Usage:
+    python manage.py benchmark_services
+    python manage.py benchmark_services --sizes 1000,100000,1000000 --repeat 3
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from youtube.benchmarks.service_bench import (
+    render_scaling_curves,
+    run_service_benchmarks,
+)
+from youtube.benchmarks.stats import (
+    compare_results,
+    default_output_path,
+    git_commit,
+    write_results,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark service-layer hot paths at several data sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="1000,100000,1000000",
+            help="Comma-separated total comment counts (default: 1k, 100k, 1M)",
+        )
+        parser.add_argument("--comments-per-video", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument(
+            "--baseline",
+            help="Previous results file to compare against",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",")]
+        except ValueError:
+            raise CommandError("--sizes must be a comma-separated list of integers")
+
+        results = run_service_benchmarks(
+            sizes,
+            comments_per_video=options["comments_per_video"],
+            repeat=options["repeat"],
+            on_size=lambda size: self.stdout.write(
+                f"Benchmarking at {size} comments..."
+            ),
+        )
+
+        self.stdout.write("\n" + render_scaling_curves(results))
+
+        payload = {
+            "meta": {
+                "benchmark": "services",
+                "git_commit": git_commit(),
+                "database": connection.vendor,
+                "sizes": sizes,
+                "comments_per_video": options["comments_per_video"],
+                "repeat": options["repeat"],
+            },
+            "scenarios": results,
+        }
+
+        output = (
+            Path(options["output"])
+            if options["output"]
+            else default_output_path("services")
+        )
+        write_results(output, payload)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline: {e}")
+
+            for row in compare_results(payload, baseline, ["median_ms", "queries"]):
+                self.stdout.write(
+                    f"  {row['scenario']:<50}{row['metric']:<10}"
+                    f"{row['baseline']:>10} -> {row['current']:<10}"
+                    f"({row['change_percent']:+.1f}%)"
+                )
@@ -0,0 +1,92 @@
+"""
+Django management command to measure process startup cost.
+
+Starts the web and worker entrypoints in fresh interpreters with
+``python -X importtime`` and reports median wall time, import time, peak
+RSS, the number of modules loaded and whether the LLM stack (openai,
+pydantic) was imported.
+
+Usage:
+    python manage.py benchmark_startup
+    python manage.py benchmark_startup --target web --repeat 10
+    python manage.py benchmark_startup --baseline benchmark_results/startup-<...>.json
+"""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from youtube.benchmarks.startup_bench import STARTUP_SCRIPTS, run_startup_benchmarks
+from youtube.benchmarks.stats import (
+    compare_results,
+    default_output_path,
+    git_commit,
+    write_results,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark web and worker startup time and memory"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target",
+            action="append",
+            choices=list(STARTUP_SCRIPTS),
+            help="Process to start (repeatable, default: all)",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--output", help="Path of the JSON results file")
+        parser.add_argument(
+            "--baseline",
+            help="Previous results file to compare against",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1")
+
+        targets = options["target"] or list(STARTUP_SCRIPTS)
+        scenario_results = run_startup_benchmarks(targets, repeat=options["repeat"])
+
+        self.stdout.write(
+            f"\n{'target':<10}{'wall ms':>10}{'import ms':>12}{'RSS MB':>10}"
+            f"{'modules':>10}  LLM modules"
+        )
+        for name, row in scenario_results.items():
+            self.stdout.write(
+                f"{name:<10}{row['wall_ms']:>10.1f}{row['import_ms']:>12.1f}"
+                f"{row['rss_mb']:>10.1f}{row['modules']:>10}  "
+                f"{', '.join(row['llm_modules']) or '-'}"
+            )
+
+        results = {
+            "meta": {
+                "benchmark": "startup",
+                "git_commit": git_commit(),
+                "repeat": options["repeat"],
+            },
+            "scenarios": scenario_results,
+        }
+        output = (
+            Path(options["output"])
+            if options["output"]
+            else default_output_path("startup")
+        )
+        write_results(output, results)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text())
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline: {e}")
+            for row in compare_results(
+                results, baseline, ["wall_ms", "import_ms", "rss_mb"]
+            ):
+                self.stdout.write(
+                    f"  {row['scenario']:<10}{row['metric']:<12}"
+                    f"{row['baseline']:>10} -> {row['current']:<10}"
+                    f"({row['change_percent']:+.1f}%)"
+                )
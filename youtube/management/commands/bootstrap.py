@@ -0,0 +1,96 @@
+"""
+Django management command for one-time deployment setup.
+
+Waits until the database accepts connections and every migration is
+applied, then runs each bootstrap step at most once across all replicas
+(see ``BootstrapService``). Meant for container entrypoints; web startup
+itself does no database work.
+
+Steps:
+    initial_content  Queue populate_initial_content if there are no videos
+
+Usage:
+    python manage.py bootstrap
+    python manage.py bootstrap --wait 120 --target 50
+    python manage.py bootstrap --reset initial_content
+"""
+
+import time
+
+from celery.utils import uuid
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from youtube.models import Video
+from youtube.services import BootstrapService
+from youtube.tasks import populate_initial_content
+
+
+class Command(BaseCommand):
+    help = "Run one-time bootstrap steps once the database is ready"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--wait",
+            type=float,
+            default=60.0,
+            help="Seconds to wait for the database and migrations (default: 60)",
+        )
+        parser.add_argument(
+            "--target", type=int, help="Videos to populate (default: 5-10)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Videos generated per subtask (default: POPULATE_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--reset",
+            action="append",
+            default=[],
+            metavar="STEP",
+            help="Run STEP again even if it already ran (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        for name in ("target", "batch_size"):
+            if options[name] is not None and options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be at least 1")
+
+        service = BootstrapService()
+        self._wait_until_ready(service, options["wait"])
+
+        steps = {"initial_content": lambda: self._initial_content(options)}
+        unknown = set(options["reset"]) - set(steps)
+        if unknown:
+            raise CommandError(f"Unknown steps: {', '.join(sorted(unknown))}")
+        for name in options["reset"]:
+            service.reset(name)
+
+        for name, step in steps.items():
+            result = service.run_once(name, step)
+            if result is None:
+                self.stdout.write(f"{name}: already done")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{name}: {result}"))
+
+    def _wait_until_ready(self, service, timeout):
+        deadline = time.monotonic() + timeout
+        while (reason := service.readiness()) is not None:
+            if time.monotonic() >= deadline:
+                raise CommandError(f"Database not ready: {reason}")
+            self.stdout.write(f"Waiting for the database ({reason})...")
+            time.sleep(1)
+
+    def _initial_content(self, options):
+        if Video.objects.exists():
+            return {"queued": False, "reason": "videos already exist"}
+
+        task_id = uuid()
+        kwargs = {"target": options["target"], "batch_size": options["batch_size"]}
+        # Queue only once the step's marker commits, so a rolled-back run
+        # queues nothing and the next bootstrap does not queue it twice
+        transaction.on_commit(
+            lambda: populate_initial_content.apply_async(kwargs=kwargs, task_id=task_id)
+        )
+        return {"queued": True, "task_id": task_id}
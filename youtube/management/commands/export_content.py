@@ -0,0 +1,71 @@
+"""
+Management command to stream videos or comments to a file as NDJSON or CSV.
+
+Usage:
+    python manage.py export_content videos --output videos.ndjson
+    python manage.py export_content comments --format csv --gzip --output comments.csv.gz
+    python manage.py export_content videos --since 2025-08-14T00:00:00Z > delta.ndjson
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from youtube.services.export_service import ExportService
+
+
+class Command(BaseCommand):
+    help = "Stream videos or comments as NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=sorted(ExportService.MODELS))
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=ExportService.FORMATS,
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only rows updated at or after this ISO 8601 timestamp",
+        )
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Rows fetched per round trip (default: EXPORT_CHUNK_SIZE)",
+        )
+        parser.add_argument("--output", help="File path (default: stdout)")
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError(f"Invalid --since timestamp: {options['since']}")
+
+        chunks = ExportService().stream(
+            resource=options["resource"],
+            export_format=options["export_format"],
+            since=since,
+            chunk_size=options["chunk_size"],
+            compress=options["gzip"],
+        )
+
+        if not options["output"]:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        written = 0
+        with open(options["output"], "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+
+        self.stderr.write(
+            self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}")
+        )
@@ -0,0 +1,35 @@
+"""
+Management command to rebuild the running engagement statistics from scratch.
+
+Recomputes the sharded totals and per-video comment tallies from the video and
+comment tables, and reports any drift from the previous values.
+
+Usage:
+    python manage.py rebuild_statistics
+"""
+
+from django.core.management.base import BaseCommand
+
+from youtube.services.statistics_service import StatisticsService
+
+
+class Command(BaseCommand):
+    help = "Rebuild running engagement statistics from the base tables"
+
+    def handle(self, *args, **options):
+        self.stdout.write("Rebuilding engagement statistics...")
+
+        result = StatisticsService().rebuild()
+
+        drift = 0
+        for section in ("video_stats", "comment_stats"):
+            for key, after in result["after"][section].items():
+                before = result["before"][section][key]
+                if before != after:
+                    drift += 1
+                    self.stdout.write(f"  {section}.{key}: {before} -> {after}")
+
+        if drift:
+            self.stdout.write(self.style.WARNING(f"Corrected {drift} drifted values"))
+        else:
+            self.stdout.write(self.style.SUCCESS("Statistics were already in sync"))
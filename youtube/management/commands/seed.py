@@ -0,0 +1,153 @@
+"""
+Django management command to seed large volumes of synthetic data.
+
+Inserts videos and comments built from ContentPopulationService's templates
+and authors (no OpenAI calls) in batches, split across worker processes,
+and reports rows/sec. Video URLs are ``<prefix>-<n>`` with each worker
+owning its own range of n, so they never collide; a prefix can only be
+seeded once.
+
+Usage:
+    python manage.py seed --videos 100000
+    python manage.py seed --videos 1000000 --comments 10000000 --workers 8
+    python manage.py seed --videos 1000000 --copy --batch-size 10000
+    python manage.py seed --videos 1000 --prefix load-test-1 --seed 42
+"""
+
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from youtube.models import Video
+from youtube.services import SyntheticDataService
+
+
+def seed_chunk(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Seed one worker's range; runs in a child process (or in-process)."""
+    started = time.perf_counter()
+    result = SyntheticDataService(seed=options["seed"]).seed_range(
+        prefix=options["prefix"],
+        start=options["start"],
+        video_count=options["video_count"],
+        comment_count=options["comment_count"],
+        batch_size=options["batch_size"],
+        use_copy=options["use_copy"],
+    )
+    connection.close()
+    return {**result, "elapsed_seconds": time.perf_counter() - started}
+
+
+def init_worker() -> None:
+    # Needed with the "spawn" start method; a no-op for forked children
+    django.setup()
+
+
+class Command(BaseCommand):
+    help = "Seed millions of synthetic videos and comments"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--videos", type=int, default=10000)
+        parser.add_argument(
+            "--comments", type=int, help="Total comments (default: 10 per video)"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (default: one per core)",
+        )
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="Load rows with PostgreSQL COPY instead of bulk INSERT",
+        )
+        parser.add_argument("--prefix", help="Video URL prefix (default: random)")
+        parser.add_argument(
+            "--seed", type=int, help="Random seed for reproducible rows"
+        )
+
+    def handle(self, *args, **options):
+        videos = options["videos"]
+        comments = videos * 10 if options["comments"] is None else options["comments"]
+        workers = min(options["workers"], videos) or 1
+
+        if videos < 1 or options["workers"] < 1 or options["batch_size"] < 1:
+            raise CommandError(
+                "--videos, --workers and --batch-size must be at least 1"
+            )
+        if comments < 0:
+            raise CommandError("--comments cannot be negative")
+        if options["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy needs PostgreSQL")
+        if connection.vendor == "sqlite" and workers > 1:
+            # SQLite has a single writer, so extra processes only add locking
+            self.stderr.write("SQLite allows one writer; using --workers 1")
+            workers = 1
+
+        prefix = options["prefix"] or f"seed-{uuid.uuid4().hex[:8]}"
+        if Video.objects.filter(
+            url__startswith=f"https://youtube.com/watch?v={prefix}-"
+        ).exists():
+            raise CommandError(f"Prefix {prefix!r} was already seeded")
+
+        chunks = []
+        for index in range(workers):
+            start = videos * index // workers
+            end = videos * (index + 1) // workers
+            chunks.append(
+                {
+                    "prefix": prefix,
+                    "start": start,
+                    "video_count": end - start,
+                    "comment_count": comments * end // videos
+                    - comments * start // videos,
+                    "batch_size": options["batch_size"],
+                    "use_copy": options["copy"],
+                    "seed": None
+                    if options["seed"] is None
+                    else options["seed"] + index,
+                }
+            )
+
+        self.stdout.write(
+            f"Seeding {videos} videos and {comments} comments "
+            f"with {workers} worker(s), prefix {prefix!r}..."
+        )
+        started = time.perf_counter()
+
+        if workers == 1:
+            results = [seed_chunk(chunks[0])]
+        else:
+            # Children must not share the parent's database connections
+            connections.close_all()
+            results = []
+            with ProcessPoolExecutor(workers, initializer=init_worker) as pool:
+                futures = [pool.submit(seed_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results.append(result)
+                    rows = result["videos_created"] + result["comments_created"]
+                    self.stdout.write(
+                        f"  worker done: {rows} rows in "
+                        f"{result['elapsed_seconds']:.1f}s "
+                        f"({rows / result['elapsed_seconds']:,.0f} rows/sec)"
+                    )
+
+        elapsed = time.perf_counter() - started
+        videos_created = sum(result["videos_created"] for result in results)
+        comments_created = sum(result["comments_created"] for result in results)
+        rows = videos_created + comments_created
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {videos_created} videos and {comments_created} comments "
+                f"in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/sec)"
+            )
+        )
@@ -22,6 +22,8 @@ class Command(BaseCommand):
     - Generate comments for existing videos (every 10 minutes) 
     - Simulate user engagement (every 5 minutes)
     - Generate engagement statistics (every hour)
+    - Update trending scores (every 5 minutes)
+    - Compact engagement history buckets (every hour)
     - Clean up old data (daily at 2 AM)
     """
 
@@ -136,18 +138,22 @@ class Command(BaseCommand):
         return schedules
 
     def _create_periodic_tasks(self, schedules, options):
-        """Create periodic tasks using the provided schedules."""
+        """Create periodic tasks using the provided schedules.
+
+        Existing tasks are updated in place so older databases pick up
+        renamed task paths and schedules; ``enabled`` is left as the
+        operator set it.
+        """
         self.stdout.write("\nCreating periodic tasks...")
 
         tasks_created = 0
 
         # Task 1: Generate video content every 30 minutes
-        task, created = PeriodicTask.objects.get_or_create(
+        task, created = PeriodicTask.objects.update_or_create(
             name="YouTube: Generate Video Content",
             defaults={
-                "task": "youtube.tasks.generate_video_content",
+                "task": "youtube.tasks.content_generation_tasks.generate_video_content",
                 "interval": schedules["every_30_minutes"],
-                "enabled": True,
                 "description": "Generate new YouTube video content every 30 minutes",
             },
         )
@@ -158,12 +164,11 @@ class Command(BaseCommand):
             tasks_created += 1
 
         # Task 2: Simulate user engagement every 5 minutes
-        task, created = PeriodicTask.objects.get_or_create(
+        task, created = PeriodicTask.objects.update_or_create(
             name="YouTube: Simulate User Engagement",
             defaults={
-                "task": "youtube.tasks.simulate_user_engagement",
+                "task": "youtube.tasks.engagement_tasks.simulate_user_engagement",
                 "interval": schedules["every_5_minutes"],
-                "enabled": True,
                 "description": "Simulate user engagement (views, likes) every 5 minutes",
             },
         )
@@ -174,12 +179,11 @@ class Command(BaseCommand):
             tasks_created += 1
 
         # Task 3: Generate engagement statistics every hour
-        task, created = PeriodicTask.objects.get_or_create(
+        task, created = PeriodicTask.objects.update_or_create(
             name="YouTube: Generate Engagement Stats",
             defaults={
-                "task": "youtube.tasks.generate_engagement_stats",
+                "task": "youtube.tasks.engagement_tasks.generate_engagement_stats",
                 "interval": schedules["every_hour"],
-                "enabled": True,
                 "description": "Generate and log engagement statistics every hour",
             },
         )
@@ -187,6 +191,32 @@ class Command(BaseCommand):
             self.stdout.write("  ✓ Created engagement statistics task (every hour)")
             tasks_created += 1
 
+        # Task 4: Update trending scores every 5 minutes
+        task, created = PeriodicTask.objects.update_or_create(
+            name="YouTube: Update Trending Scores",
+            defaults={
+                "task": "youtube.tasks.trending_tasks.update_trending_scores",
+                "interval": schedules["every_5_minutes"],
+                "description": "Fold recent engagement into trending scores every 5 minutes",
+            },
+        )
+        if created:
+            self.stdout.write("  ✓ Created trending score task (every 5 minutes)")
+            tasks_created += 1
+
+        # Task 5: Compact engagement history buckets every hour
+        task, created = PeriodicTask.objects.update_or_create(
+            name="YouTube: Compact Engagement Buckets",
+            defaults={
+                "task": "youtube.tasks.engagement_tasks.compact_engagement_buckets",
+                "interval": schedules["every_hour"],
+                "description": "Roll old minute/hour engagement buckets into coarser ones",
+            },
+        )
+        if created:
+            self.stdout.write("  ✓ Created engagement compaction task (every hour)")
+            tasks_created += 1
+
         return tasks_created
 
     def _display_task_summary(self):
@@ -0,0 +1,170 @@
+"""
+Django management command to generate engagement load across the catalogue.
+
+Samples views and likes with Zipfian popularity and a diurnal rate for
+every video, a keyset-paginated chunk at a time, and applies the
+aggregated deltas either straight to the database or through the
+increment_views and like endpoints. Reports the achieved events per
+second and stores the per-tick results as JSON.
+
+Usage:
+    python manage.py simulate_engagement --rate 500 --ticks 60
+    python manage.py simulate_engagement --zipf-s 1.3 --amplitude 0.8 --seed 1
+    python manage.py simulate_engagement --target http --concurrency 32
+    python manage.py simulate_engagement --target http \
+        --base-url http://127.0.0.1:8000 --tick-seconds 10
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from youtube.benchmarks.engagement_sim import (
+    DatabaseSink,
+    EngagementSimulator,
+    HttpSink,
+)
+from youtube.benchmarks.http_load import DjangoClientTransport, HttpTransport
+from youtube.benchmarks.stats import default_output_path, git_commit, write_results
+
+
+class Command(BaseCommand):
+    help = """
+    Simulate Zipf/diurnal views and likes over every video.
+
+    --target db (default) applies aggregated deltas in bulk; --target http
+    sends one request per event, in-process or to --base-url. Ticks run as
+    fast as the target allows, so events/sec is the achieved write rate.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=["db", "http"], default="db")
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=100.0,
+            help="Mean simulated views per second over a day",
+        )
+        parser.add_argument("--ticks", type=int, default=10)
+        parser.add_argument(
+            "--tick-seconds",
+            type=float,
+            default=60.0,
+            help="Simulated seconds per tick",
+        )
+        parser.add_argument(
+            "--start",
+            help="Simulated start time in ISO 8601 (default: now)",
+        )
+        parser.add_argument("--zipf-s", type=float, default=1.1)
+        parser.add_argument(
+            "--amplitude",
+            type=float,
+            default=0.5,
+            help="Diurnal swing around the mean rate, 0-1",
+        )
+        parser.add_argument("--peak-hour", type=float, default=20.0)
+        parser.add_argument("--like-rate", type=float, default=0.04)
+        parser.add_argument("--chunk-size", type=int, default=5000)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--base-url",
+            help="With --target http, send requests to a running server",
+        )
+        parser.add_argument("--seed", type=int)
+        parser.add_argument("--output", help="Path of the JSON results file")
+
+    def handle(self, *args, **options):
+        if options["ticks"] < 1:
+            raise CommandError("--ticks must be at least 1")
+        if options["tick_seconds"] <= 0:
+            raise CommandError("--tick-seconds must be positive")
+
+        start = None
+        if options["start"]:
+            try:
+                start = datetime.fromisoformat(options["start"])
+            except ValueError:
+                raise CommandError("--start must be an ISO 8601 datetime")
+            if timezone.is_naive(start):
+                start = timezone.make_aware(start)
+
+        if options["target"] == "http":
+            transport = (
+                HttpTransport(options["base_url"])
+                if options["base_url"]
+                else DjangoClientTransport()
+            )
+            sink = HttpSink(
+                transport, concurrency=options["concurrency"], seed=options["seed"]
+            )
+        else:
+            sink = DatabaseSink()
+
+        try:
+            simulator = EngagementSimulator(
+                sink,
+                rate=options["rate"],
+                zipf_s=options["zipf_s"],
+                amplitude=options["amplitude"],
+                peak_hour=options["peak_hour"],
+                like_rate=options["like_rate"],
+                chunk_size=options["chunk_size"],
+                seed=options["seed"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"Simulating {options['ticks']} x {options['tick_seconds']:g}s ticks "
+            f"at {options['rate']:g} views/s via {options['target']}..."
+        )
+        summary = simulator.run(
+            ticks=options["ticks"], tick_seconds=options["tick_seconds"], start=start
+        )
+
+        self._print_results(summary)
+
+        results = {
+            "meta": {
+                "benchmark": "engagement",
+                "git_commit": git_commit(),
+                "database": connection.vendor,
+                "target": options["target"],
+                "transport": "http" if options["base_url"] else "in-process",
+                "rate": options["rate"],
+                "zipf_s": options["zipf_s"],
+                "amplitude": options["amplitude"],
+                "chunk_size": options["chunk_size"],
+                "seed": options["seed"],
+            },
+            "summary": {key: value for key, value in summary.items() if key != "ticks"},
+            "ticks": summary["ticks"],
+        }
+        output = (
+            Path(options["output"])
+            if options["output"]
+            else default_output_path("engagement")
+        )
+        write_results(output, results)
+        self.stdout.write(self.style.SUCCESS(f"\nResults written to {output}"))
+
+    def _print_results(self, summary):
+        self.stdout.write(
+            f"\n{'tick':<28}{'expected':>10}{'events':>10}{'errors':>8}"
+            f"{'seconds':>10}{'events/s':>12}"
+        )
+        for row in summary["ticks"]:
+            self.stdout.write(
+                f"{row['at'][:19]:<28}{row['expected_events']:>10.0f}"
+                f"{row['events']:>10}{row['errors']:>8}"
+                f"{row['elapsed_seconds']:>10.3f}{row['events_per_second']:>12.1f}"
+            )
+        self.stdout.write(
+            f"\n{summary['events']} events in {summary['elapsed_seconds']:.2f}s "
+            f"({summary['events_per_second']:.1f} events/s, "
+            f"{summary['simulated_seconds']:g}s simulated)"
+        )
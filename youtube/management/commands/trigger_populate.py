@@ -1,20 +1,42 @@
 """
 Management command to manually trigger initial content population.
+
+Usage:
+    python manage.py trigger_populate
+    python manage.py trigger_populate --target 10000 --batch-size 50
 """
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from youtube.tasks import populate_initial_content
 
 
 class Command(BaseCommand):
     help = "Trigger initial content population"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--target", type=int, help="Number of videos to create (default: 5-10)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Videos generated per subtask (default: POPULATE_BATCH_SIZE)",
+        )
+
     def handle(self, *args, **options):
+        for name in ("target", "batch_size"):
+            if options[name] is not None and options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be at least 1")
+
         self.stdout.write("Triggering initial content population...")
 
-        result = populate_initial_content.delay()
+        result = populate_initial_content.delay(
+            target=options["target"], batch_size=options["batch_size"]
+        )
 
         self.stdout.write(
             self.style.SUCCESS(f"Initial population task queued with ID: {result.id}")
         )
-        self.stdout.write("Check the TaskLog in admin to see the results.")
+        self.stdout.write(
+            "Its Celery state reports progress; the TaskLog in admin shows the results."
+        )
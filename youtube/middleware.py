@@ -0,0 +1,112 @@
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from .compression import acompress_stream, compress, compress_stream, negotiate
+from .db_router import enable_read_replica, reset_read_replica
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """Serve safe requests to ``read_replica`` views from a read replica.
+
+    After a successful write the client gets a short-lived cookie that pins
+    its following reads to the primary, so it always sees its own writes
+    despite replication lag.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        token = getattr(request, "_read_replica_token", None)
+        if token is not None:
+            reset_read_replica(token)
+
+        if (
+            settings.DATABASE_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                settings.READ_YOUR_WRITES_COOKIE,
+                "1",
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if (
+            getattr(view_class, "read_replica", False)
+            and request.method in SAFE_METHODS
+            and settings.READ_YOUR_WRITES_COOKIE not in request.COOKIES
+        ):
+            request._read_replica_token = enable_read_replica()
+        return None
+
+
+class CompressionMiddleware:
+    """Compress API responses with the best encoding the client accepts.
+
+    Handles zstd, br and gzip (see ``youtube.compression``) for the content
+    types in ``COMPRESSION_CONTENT_TYPES``. Bodies smaller than
+    ``COMPRESSION_MIN_SIZE`` are sent as-is, streaming responses such as the
+    exports are compressed chunk by chunk, and bodiless statuses (204, 304)
+    and partial content are never touched.
+    """
+
+    SKIP_STATUSES = (204, 206, 304)
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if (
+            response.status_code < 200
+            or response.status_code in self.SKIP_STATUSES
+            or response.has_header("Content-Encoding")
+            or not response.get("Content-Type", "").startswith(
+                tuple(settings.COMPRESSION_CONTENT_TYPES)
+            )
+        ):
+            return response
+
+        patch_vary_headers(response, ["Accept-Encoding"])
+        encoding = negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_stream(
+                    response.streaming_content, encoding
+                )
+            else:
+                response.streaming_content = compress_stream(
+                    response.streaming_content, encoding
+                )
+            del response["Content-Length"]
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The compressed body is no longer byte-identical to the original
+        etag = response.get("ETag")
+        if etag and not etag.startswith("W/"):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,24 @@
+# Generated by Django 6.0.9 on 2026-10-19 16:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0003_tasklog"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["updated_at", "id"], name="youtube_com_updated_aa73ea_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(
+                fields=["updated_at", "id"], name="youtube_vid_updated_efb77a_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+"""
+Full-text search indexes maintained by the database on every write.
+
+PostgreSQL gets a stored, generated ``search_vector`` tsvector column with a
+GIN index on each table. SQLite (tests, local benchmarks) gets FTS5
+external-content tables kept in sync by triggers. Neither is declared on the
+models; ``SearchService`` queries them with raw SQL. A later migration that
+makes SQLite rebuild either table must recreate the triggers.
+"""
+
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE youtube_video ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX youtube_video_search_idx ON youtube_video USING GIN (search_vector)",
+    """
+    ALTER TABLE youtube_comment ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(content, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(author, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX youtube_comment_search_idx ON youtube_comment USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "ALTER TABLE youtube_video DROP COLUMN IF EXISTS search_vector",
+    "ALTER TABLE youtube_comment DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def sqlite_fts_sql(table, columns):
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+        f"content_rowid='id', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+SQLITE_FORWARD = sqlite_fts_sql("youtube_video", ["title", "description"])
+SQLITE_FORWARD += sqlite_fts_sql("youtube_comment", ["content", "author"])
+
+SQLITE_REVERSE = [
+    f"DROP {kind} IF EXISTS {table}_fts{suffix}"
+    for table in ("youtube_video", "youtube_comment")
+    for kind, suffix in (("TRIGGER", "_ai"), ("TRIGGER", "_ad"), ("TRIGGER", "_au"))
+] + [
+    "DROP TABLE IF EXISTS youtube_video_fts",
+    "DROP TABLE IF EXISTS youtube_comment_fts",
+]
+
+
+def run_statements(statements_by_vendor):
+    def run(apps, schema_editor):
+        statements = statements_by_vendor.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0004_export_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_statements({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            run_statements({"postgresql": POSTGRES_REVERSE, "sqlite": SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.9 on 2026-10-19 16:53
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0005_search_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VideoTrendingScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("window", models.CharField(max_length=8)),
+                ("score", models.FloatField()),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                ("like_count", models.PositiveIntegerField(default=0)),
+                ("comment_count", models.PositiveIntegerField(default=0)),
+                (
+                    "computed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "video",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="trending_scores",
+                        to="youtube.video",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["window", "-score"],
+                        name="youtube_vid_window_700845_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("video", "window"),
+                        name="unique_trending_score_per_window",
+                    )
+                ],
+            },
+        ),
+    ]
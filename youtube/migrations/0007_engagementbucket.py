@@ -0,0 +1,63 @@
+# Generated by Django 6.0.9 on 2026-10-19 16:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0006_videotrendingscore"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EngagementBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[
+                            ("minute", "Minute"),
+                            ("hour", "Hour"),
+                            ("day", "Day"),
+                        ],
+                        max_length=6,
+                    ),
+                ),
+                ("bucket_start", models.DateTimeField()),
+                ("views", models.PositiveIntegerField(default=0)),
+                ("likes", models.PositiveIntegerField(default=0)),
+                (
+                    "video",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="engagement_buckets",
+                        to="youtube.video",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["granularity", "bucket_start"],
+                        name="youtube_eng_granula_6f0658_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("video", "granularity", "bucket_start"),
+                        name="unique_engagement_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 6.0.9 on 2026-10-19 16:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Max, Sum
+
+
+def populate_aggregates(apps, schema_editor):
+    """Seed the running totals from existing rows (same as rebuild_statistics)."""
+    Video = apps.get_model("youtube", "Video")
+    Comment = apps.get_model("youtube", "Comment")
+    EngagementAggregate = apps.get_model("youtube", "EngagementAggregate")
+    VideoCommentTally = apps.get_model("youtube", "VideoCommentTally")
+    db_alias = schema_editor.connection.alias
+
+    videos = Video.objects.using(db_alias).aggregate(
+        count=Count("id"),
+        views=Sum("view_count"),
+        likes=Sum("like_count"),
+        max_views=Max("view_count"),
+        max_likes=Max("like_count"),
+    )
+    comments = Comment.objects.using(db_alias).aggregate(
+        count=Count("id"), likes=Sum("like_count")
+    )
+    EngagementAggregate.objects.using(db_alias).create(
+        shard=0,
+        video_count=videos["count"],
+        view_sum=videos["views"] or 0,
+        like_sum=videos["likes"] or 0,
+        view_max=videos["max_views"] or 0,
+        like_max=videos["max_likes"] or 0,
+        comment_count=comments["count"],
+        comment_like_sum=comments["likes"] or 0,
+    )
+
+    tallies = (
+        Comment.objects.using(db_alias)
+        .order_by()
+        .values("video_id")
+        .annotate(count=Count("id"))
+        .iterator(chunk_size=2000)
+    )
+    VideoCommentTally.objects.using(db_alias).bulk_create(
+        (
+            VideoCommentTally(video_id=row["video_id"], comment_count=row["count"])
+            for row in tallies
+        ),
+        batch_size=2000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0007_engagementbucket"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EngagementAggregate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("shard", models.PositiveSmallIntegerField(unique=True)),
+                ("video_count", models.BigIntegerField(default=0)),
+                ("view_sum", models.BigIntegerField(default=0)),
+                ("like_sum", models.BigIntegerField(default=0)),
+                ("view_max", models.BigIntegerField(default=0)),
+                ("like_max", models.BigIntegerField(default=0)),
+                ("comment_count", models.BigIntegerField(default=0)),
+                ("comment_like_sum", models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="VideoCommentTally",
+            fields=[
+                (
+                    "video",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="comment_tally",
+                        serialize=False,
+                        to="youtube.video",
+                    ),
+                ),
+                ("comment_count", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["-comment_count"], name="youtube_vid_comment_3e3132_idx"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.9 on 2026-10-19 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0009_id_sequence"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tasklog",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("SUCCESS", "Success"),
+                    ("FAILURE", "Failure"),
+                    ("RETRY", "Retry"),
+                    ("SKIPPED", "Skipped"),
+                ],
+                default="PENDING",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.9 on 2026-10-19 17:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("youtube", "0010_tasklog_skipped"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BootstrapStep",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("result", models.JSONField(default=dict)),
+                ("completed_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
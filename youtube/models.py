@@ -8,6 +8,7 @@ class TaskLog(models.Model):
         ("SUCCESS", "Success"),
         ("FAILURE", "Failure"),
         ("RETRY", "Retry"),
+        ("SKIPPED", "Skipped"),
     ]
 
     task_name = models.CharField(max_length=200)
@@ -43,6 +44,7 @@ class Video(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["updated_at", "id"])]
 
     def __str__(self):
         return self.title
@@ -58,6 +60,141 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["updated_at", "id"])]
 
     def __str__(self):
         return f"Comment by {self.author} on {self.video.title}"
+
+
+class VideoTrendingScore(models.Model):
+    """Precomputed time-decayed engagement score of a video for one window.
+
+    ``score`` is stored in log space relative to a fixed epoch so that only
+    videos with new activity need updating; see ``TrendingService``.
+    """
+
+    video = models.ForeignKey(
+        Video, on_delete=models.CASCADE, related_name="trending_scores"
+    )
+    window = models.CharField(max_length=8)
+    score = models.FloatField()
+    view_count = models.PositiveIntegerField(default=0)
+    like_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["video", "window"], name="unique_trending_score_per_window"
+            )
+        ]
+        indexes = [models.Index(fields=["window", "-score"])]
+
+    def __str__(self):
+        return f"{self.video_id} ({self.window}): {self.score:.3f}"
+
+
+class EngagementBucket(models.Model):
+    """Views and likes a video received within one time bucket.
+
+    New activity lands in minute buckets, which are later compacted into
+    hour and then day buckets; see ``EngagementService``.
+    """
+
+    GRANULARITY_CHOICES = [
+        ("minute", "Minute"),
+        ("hour", "Hour"),
+        ("day", "Day"),
+    ]
+
+    video = models.ForeignKey(
+        Video, on_delete=models.CASCADE, related_name="engagement_buckets"
+    )
+    granularity = models.CharField(max_length=6, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    likes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["video", "granularity", "bucket_start"],
+                name="unique_engagement_bucket",
+            )
+        ]
+        indexes = [models.Index(fields=["granularity", "bucket_start"])]
+
+    def __str__(self):
+        return f"{self.video_id} {self.granularity} {self.bucket_start}"
+
+
+class EngagementAggregate(models.Model):
+    """One shard of the running totals behind the engagement statistics.
+
+    Writers add deltas to a random shard so concurrent increments do not
+    queue on a single row; readers sum the shards. Individual shards may go
+    negative (a delete can land on a different shard than the create), only
+    the sum is meaningful. Maxima only grow; ``rebuild_statistics`` resets
+    them after deletes.
+    """
+
+    shard = models.PositiveSmallIntegerField(unique=True)
+    video_count = models.BigIntegerField(default=0)
+    view_sum = models.BigIntegerField(default=0)
+    like_sum = models.BigIntegerField(default=0)
+    view_max = models.BigIntegerField(default=0)
+    like_max = models.BigIntegerField(default=0)
+    comment_count = models.BigIntegerField(default=0)
+    comment_like_sum = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"Engagement aggregate shard {self.shard}"
+
+
+class VideoCommentTally(models.Model):
+    """Number of comments per video, indexed for most-commented lookups."""
+
+    video = models.OneToOneField(
+        Video,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="comment_tally",
+    )
+    comment_count = models.BigIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["-comment_count"])]
+
+    def __str__(self):
+        return f"{self.video_id}: {self.comment_count} comments"
+
+
+class IdSequence(models.Model):
+    """Named counter that hands out blocks of values, each used once.
+
+    See ``VideoIdService``.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    next_value = models.BigIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.name}: {self.next_value}"
+
+
+class BootstrapStep(models.Model):
+    """Marks a one-time bootstrap step as done.
+
+    The unique ``name`` makes inserting the row a database-level claim: of
+    several concurrent ``bootstrap`` runs only one can insert it, the rest
+    block until it commits and then see the step as done. See
+    ``BootstrapService``.
+    """
+
+    name = models.CharField(max_length=50, unique=True)
+    result = models.JSONField(default=dict)
+    completed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.name} at {self.completed_at}"
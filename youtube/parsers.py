@@ -0,0 +1,45 @@
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "fast-json" extra
+    orjson = None
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+class ORJSONParser(JSONParser):
+    """JSON parser backed by orjson, with DRF's parser as fallback."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except ValueError as e:
+            raise ParseError(f"JSON parse error - {e}")
+
+
+class NDJSONParser(BaseParser):
+    """Parse newline-delimited JSON into a list, one item per non-blank line."""
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        items = []
+
+        for line_number, raw_line in enumerate(stream, start=1):
+            line = raw_line.decode(encoding).strip()
+            if not line:
+                continue
+            try:
+                items.append(json_loads(line))
+            except ValueError as e:
+                raise ParseError(f"NDJSON parse error on line {line_number}: {e}")
+
+        return items
@@ -0,0 +1,95 @@
+import csv
+import io
+import math
+from decimal import Decimal
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "fast-json" extra
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer backed by orjson, with DRF's encoder as fallback.
+
+    Output matches ``JSONRenderer``: compact, UTF-8, datetimes in ISO 8601
+    with a ``Z`` suffix for UTC, so serializer output and raw ``.values()``
+    rows render identically. orjson writes NaN and Infinity as ``null``;
+    those payloads are rendered by ``JSONRenderer``, which rejects them
+    with ``ValueError``.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        ret = orjson.dumps(
+            data,
+            default=JSONEncoder().default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+        # Non-finite floats become null; only payloads with a null can hide one
+        if b"null" in ret and _has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escape U+2028/U+2029 like JSONRenderer so output stays valid JS
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+                b"\xe2\x80\xa9", b"\\u2029"
+            )
+        return ret
+
+
+def _has_non_finite_float(data) -> bool:
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, Decimal):
+        # DRF's encoder turns Decimals into floats
+        return not data.is_finite()
+    if isinstance(data, dict):
+        return any(_has_non_finite_float(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite_float(value) for value in data)
+    return False
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Render a list as newline-delimited JSON, one item per line."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        items = data if isinstance(data, list) else [data]
+        encoder = DjangoJSONEncoder()
+        return "".join(encoder.encode(item) + "\n" for item in items).encode()
+
+
+class CSVRenderer(BaseRenderer):
+    """Render a list of flat dicts as CSV with a header row."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        if not rows:
+            return b""
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue().encode()
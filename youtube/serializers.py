@@ -0,0 +1,121 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# Fields whose ``to_representation`` is a no-op for values the database
+# already returns with the right type (int columns, text columns)
+PASSTHROUGH_FIELDS = (serializers.IntegerField, serializers.CharField)
+
+
+def iso_datetime(value, tz):
+    """``DateTimeField.to_representation`` for aware datetimes and ISO 8601."""
+    if not value:
+        return None
+    value = value.astimezone(tz).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+class SparseFieldsMixin:
+    """Serializer mixin: ``fields=[...]`` builds and outputs only those fields."""
+
+    def __init__(self, *args, fields: Optional[Sequence[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class CompiledSerializer:
+    """Precomputed read path for a DRF ``Serializer`` over ``.values()`` rows.
+
+    ``values()`` selects exactly the serializer's fields, and a function
+    generated once per serializer turns each row into the same dict
+    ``serializer_class(instance).data`` would produce, without building model
+    instances or walking the field tree per row. Passthrough fields are
+    copied as-is; other fields (e.g. datetimes) call the field's own
+    ``to_representation``, except ISO 8601 datetimes, which resolve the
+    active timezone once per ``serialize`` call. A ``SerializerMethodField``
+    reads the column of the same name, so it must mirror one (a foreign key
+    name yields its id).
+    """
+
+    def __init__(
+        self,
+        serializer_class: Type[serializers.Serializer],
+        fields: Optional[Sequence[str]] = None,
+    ):
+        self.serializer_class = serializer_class
+        declared = serializer_class().fields
+        names = declared if fields is None else fields
+        self.fields = {name: declared[name] for name in names}
+        self.serialize_row = self._compile()
+        self._subsets: Dict[Tuple[str, ...], "CompiledSerializer"] = {}
+
+    def only(self, fields: Sequence[str]) -> "CompiledSerializer":
+        """Return the compiled serializer for a subset of the fields."""
+        key = tuple(fields)
+        if key == tuple(self.fields):
+            return self
+        if key not in self._subsets:
+            self._subsets[key] = CompiledSerializer(self.serializer_class, key)
+        return self._subsets[key]
+
+    def values(self, queryset):
+        return queryset.values(*self.fields)
+
+    def serialize(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        return [self.serialize_row(row, tz) for row in rows]
+
+    def _compile(self) -> Callable[..., Dict[str, Any]]:
+        namespace: Dict[str, Any] = {"iso_datetime": iso_datetime}
+        body = []
+        items = []
+
+        for index, (name, field) in enumerate(self.fields.items()):
+            if isinstance(
+                field, (PASSTHROUGH_FIELDS, serializers.SerializerMethodField)
+            ):
+                items.append(f"{name!r}: row[{name!r}]")
+                continue
+
+            if self._is_iso_datetime(field):
+                items.append(f"{name!r}: iso_datetime(row[{name!r}], tz)")
+                continue
+
+            # Same None handling as Serializer.to_representation
+            namespace[f"represent_{index}"] = field.to_representation
+            body.append(f"    value_{index} = row[{name!r}]")
+            items.append(
+                f"{name!r}: None if value_{index} is None "
+                f"else represent_{index}(value_{index})"
+            )
+
+        source = "\n".join(
+            [
+                "def serialize_row(row, tz=None):",
+                *body,
+                "    return {" + ", ".join(items) + "}",
+            ]
+        )
+        exec(
+            compile(source, f"<{self.serializer_class.__qualname__}>", "exec"),
+            namespace,
+        )
+        return namespace["serialize_row"]
+
+    @staticmethod
+    def _is_iso_datetime(field) -> bool:
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        return (
+            isinstance(field, serializers.DateTimeField)
+            and settings.USE_TZ
+            and not hasattr(field, "timezone")
+            and isinstance(output_format, str)
+            and output_format.lower() == ISO_8601
+        )
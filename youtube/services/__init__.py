@@ -1,13 +1,62 @@
-from .video_service import VideoService
-from .comment_service import CommentService
-from .comment_generation_service import CommentGenerationService
-from .content_population_service import ContentPopulationService
-from .task_logging_service import TaskLoggingService
-
-__all__ = [
-    "VideoService",
-    "CommentService",
-    "CommentGenerationService",
-    "ContentPopulationService",
-    "TaskLoggingService",
-]
+"""
+Service layer. Services are imported on first access, so a process only
+loads the modules it uses.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_MODULES = {
+    "VideoService": "video_service",
+    "CommentService": "comment_service",
+    "CommentGenerationService": "comment_generation_service",
+    "CommentRequestService": "comment_request_service",
+    "ContentPopulationService": "content_population_service",
+    "TaskLoggingService": "task_logging_service",
+    "LeaseService": "lease_service",
+    "BootstrapService": "bootstrap_service",
+    "SyntheticDataService": "synthetic_data_service",
+    "ExportService": "export_service",
+    "SearchService": "search_service",
+    "TrendingService": "trending_service",
+    "EngagementService": "engagement_service",
+    "StatisticsService": "statistics_service",
+    "VideoIdService": "video_id_service",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# Explicit "as" re-exports for type checkers and ruff (F401)
+if TYPE_CHECKING:
+    from .bootstrap_service import BootstrapService as BootstrapService
+    from .comment_generation_service import (
+        CommentGenerationService as CommentGenerationService,
+    )
+    from .comment_request_service import CommentRequestService as CommentRequestService
+    from .comment_service import CommentService as CommentService
+    from .content_population_service import (
+        ContentPopulationService as ContentPopulationService,
+    )
+    from .engagement_service import EngagementService as EngagementService
+    from .export_service import ExportService as ExportService
+    from .lease_service import LeaseService as LeaseService
+    from .search_service import SearchService as SearchService
+    from .statistics_service import StatisticsService as StatisticsService
+    from .synthetic_data_service import SyntheticDataService as SyntheticDataService
+    from .task_logging_service import TaskLoggingService as TaskLoggingService
+    from .trending_service import TrendingService as TrendingService
+    from .video_id_service import VideoIdService as VideoIdService
+    from .video_service import VideoService as VideoService
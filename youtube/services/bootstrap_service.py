@@ -0,0 +1,59 @@
+from typing import Any, Callable, Dict, Optional
+
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, transaction
+from django.db.migrations.executor import MigrationExecutor
+
+from ..models import BootstrapStep
+
+
+class BootstrapService:
+    """Run one-time deployment steps exactly once across all replicas.
+
+    ``run_once`` inserts the step's ``BootstrapStep`` row and runs the step
+    in the same transaction. Concurrent callers block on the unique index
+    until the first commits and then skip the step; if the step raises, the
+    row is rolled back so the next bootstrap retries it. Steps defer side
+    effects outside the database (e.g. queueing tasks) with
+    ``transaction.on_commit`` so they only happen once the row commits.
+    """
+
+    def readiness(self, using: str = DEFAULT_DB_ALIAS) -> Optional[str]:
+        """Return why the database is not ready yet, or None when it is."""
+        connection = connections[using]
+        try:
+            connection.ensure_connection()
+            executor = MigrationExecutor(connection)
+            plan = executor.migration_plan(executor.loader.graph.leaf_nodes())
+        except Exception as e:
+            return f"database unavailable: {e}"
+        finally:
+            connection.close_if_unusable_or_obsolete()
+
+        if plan:
+            return f"{len(plan)} unapplied migration(s)"
+        return None
+
+    def run_once(
+        self, name: str, step: Callable[[], Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Run ``step`` unless it already ran; return its result or None."""
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    marker = BootstrapStep.objects.create(name=name)
+            except IntegrityError:
+                return None
+            marker.result = step()
+            marker.save(update_fields=["result"])
+        return marker.result
+
+    def reset(self, name: str) -> bool:
+        """Forget that ``name`` ran so the next bootstrap runs it again."""
+        deleted, _ = BootstrapStep.objects.filter(name=name).delete()
+        return bool(deleted)
+
+    def completed(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            step.name: {"completed_at": step.completed_at, "result": step.result}
+            for step in BootstrapStep.objects.all()
+        }
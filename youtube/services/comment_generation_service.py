@@ -1,21 +1,30 @@
 import os
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from typing import Optional, List
-from openai import OpenAI
+from typing import TYPE_CHECKING, Optional, List
 from ..models import Video, Comment
 from .comment_service import CommentService
 
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 class CommentGenerationService:
-    def __init__(self, openai_client: Optional[OpenAI] = None):
-        if openai_client:
-            self.client = openai_client
-        else:
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if not api_key:
+    def __init__(self, openai_client: Optional["OpenAI"] = None):
+        self._client = openai_client
+        if not openai_client:
+            self.api_key = os.environ.get("OPENAI_API_KEY")
+            if not self.api_key:
                 raise ValidationError("OPENAI_API_KEY environment variable is required")
-            self.client = OpenAI(api_key=api_key)
+
+    @property
+    def client(self) -> "OpenAI":
+        # Built on first use so importing this service does not load openai
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
 
     def generate_comment(
         self, *, video_title: str, video_description: str = "", tone: str = "friendly"
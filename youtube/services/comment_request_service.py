@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from ..checks import require_shared_cache
+
+
+class CommentRequestService:
+    """Coalesce comment generation requests per video.
+
+    Requests add to a pending count per video in the cache (Redis in
+    production, locmem in tests). The first request in a window also takes
+    a flush lock and tells the caller to schedule one flush after
+    ``COMMENT_COALESCE_SECONDS``; later requests in the window only add to
+    the count. ``claim`` releases the lock before taking the count, so a
+    request that arrives during a claim either lands in that claim or
+    schedules the next flush, and none is lost. The cache must be shared
+    by every process (``CACHE_URL``); see ``youtube.checks``.
+    """
+
+    PENDING_KEY = "comment-requests:pending:{video_id}"
+    LOCK_KEY = "comment-requests:lock:{video_id}"
+
+    def request(self, *, video_id: int, comment_count: int) -> bool:
+        """Add ``comment_count`` to the video's pending comments.
+
+        Returns True when the caller must schedule a flush for the video.
+        """
+        # A per-process cache would never merge requests across workers
+        require_shared_cache()
+        pending_key = self.PENDING_KEY.format(video_id=video_id)
+        timeout = self.pending_timeout()
+        cache.add(pending_key, 0, timeout)
+        cache.incr(pending_key, comment_count)
+        # incr keeps the key's expiry; extend it so a request landing just
+        # before the count expires is still there when its flush runs
+        cache.touch(pending_key, timeout)
+
+        return cache.add(self.LOCK_KEY.format(video_id=video_id), 1, timeout)
+
+    def claim(self, *, video_id: int) -> int:
+        """Take and return every comment pending for the video."""
+        cache.delete(self.LOCK_KEY.format(video_id=video_id))
+
+        pending_key = self.PENDING_KEY.format(video_id=video_id)
+        pending = cache.get(pending_key, 0)
+        if pending:
+            cache.decr(pending_key, pending)
+        return pending
+
+    def pending_timeout(self) -> int:
+        # Outlives the flush by a wide margin in case a worker is slow
+        return settings.COMMENT_COALESCE_SECONDS * 10 + 300
@@ -0,0 +1,24 @@
+"""
+Structured output schemas for AI comment generation.
+
+Kept apart from ContentPopulationService so pydantic is only imported when
+comments are actually generated.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class GeneratedComment(BaseModel):
+    content: str = Field(description="The comment text content")
+    tone: str = Field(
+        description="The tone of the comment (friendly, excited, thoughtful, etc.)"
+    )
+    author_style: str = Field(
+        description="The style this author typically uses (casual, technical, enthusiastic, etc.)"
+    )
+
+
+class CommentBatch(BaseModel):
+    comments: List[GeneratedComment] = Field(description="List of generated comments")
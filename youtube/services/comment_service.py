@@ -1,13 +1,26 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from typing import Optional
+from django.db.models import F
+from django.utils import timezone
+from typing import Any, Dict, List, Optional
 from ..models import Video, Comment
+from .statistics_service import StatisticsService
 
 
 class CommentService:
-    def get_by_id(self, *, comment_id: int) -> Comment:
+    def __init__(self):
+        self.statistics_service = StatisticsService()
+
+    def get_by_id(
+        self, *, comment_id: int, only: Optional[List[str]] = None
+    ) -> Comment:
+        queryset = Comment.objects.all()
+        if only is not None:
+            queryset = queryset.only(*only)
         try:
-            return Comment.objects.get(pk=comment_id)
+            return queryset.get(pk=comment_id)
         except Comment.DoesNotExist:
             raise ValidationError("Comment not found.")
 
@@ -21,9 +34,58 @@ class CommentService:
         comment = Comment(video=video, author=author, content=content)
         comment.full_clean()
         comment.save()
+        self.statistics_service.add_comments([comment])
 
         return comment
 
+    def bulk_create(
+        self, *, items: List[Dict[str, Any]], atomic: bool = False
+    ) -> Dict[str, Any]:
+        """Validate and insert many comments with batched ``bulk_create``.
+
+        Items failing validation are reported by position in ``items``;
+        with ``atomic`` nothing is written if any item fails.
+        """
+        video_ids = {item["video_id"] for item in items}
+        existing_video_ids = set(
+            Video.objects.filter(pk__in=video_ids).values_list("id", flat=True)
+        )
+
+        errors: List[Dict[str, Any]] = []
+        comments: List[Comment] = []
+
+        for index, item in enumerate(items):
+            if item["video_id"] not in existing_video_ids:
+                errors.append(
+                    {"index": index, "errors": {"video": ["Video not found."]}}
+                )
+                continue
+
+            comment = Comment(
+                video_id=item["video_id"],
+                author=item["author"],
+                content=item["content"],
+            )
+            try:
+                # The video was checked above for the whole batch at once
+                comment.full_clean(exclude=["video"], validate_unique=False)
+            except ValidationError as e:
+                errors.append({"index": index, "errors": e.message_dict})
+                continue
+
+            comments.append(comment)
+
+        if atomic and errors:
+            return {"created_ids": [], "errors": errors}
+
+        with transaction.atomic():
+            saved = Comment.objects.bulk_create(
+                comments, batch_size=settings.BULK_BATCH_SIZE
+            )
+            self.statistics_service.add_comments(saved)
+
+        return {"created_ids": [comment.pk for comment in saved], "errors": errors}
+
     @transaction.atomic
     def update(self, *, comment_id: int, **kwargs) -> Comment:
         try:
@@ -45,6 +107,7 @@ class CommentService:
         except Comment.DoesNotExist:
             raise ValidationError("Comment not found.")
 
+        self.statistics_service.add_comments([comment], sign=-1)
         comment.delete()
 
     @transaction.atomic
@@ -57,11 +120,29 @@ class CommentService:
         comment.like_count += 1
         comment.full_clean()
         comment.save()
+        self.statistics_service.add_counters(comment_likes=1)
 
         return comment
 
+    async def aincrement_likes(self, *, comment_id: int) -> int:
+        return await sync_to_async(self._increment_like_count)(comment_id=comment_id)
+
+    @transaction.atomic
+    def _increment_like_count(self, *, comment_id: int) -> int:
+        updated = Comment.objects.filter(pk=comment_id).update(
+            like_count=F("like_count") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            raise ValidationError("Comment not found.")
+
+        self.statistics_service.add_counters(comment_likes=1)
+        return Comment.objects.values_list("like_count", flat=True).get(pk=comment_id)
+
     def get_by_video(self, *, video_id: Optional[int] = None):
         queryset = Comment.objects.all()
         if video_id is not None:
             queryset = queryset.filter(video=video_id)
         return queryset
+
+    def get_for_videos(self, *, video_ids: List[int]):
+        return Comment.objects.filter(video_id__in=video_ids)
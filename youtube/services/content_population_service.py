@@ -2,26 +2,18 @@ import os
 import random
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from typing import Optional, Dict, Any, List, TypedDict
-from pydantic import BaseModel, Field
-from openai import OpenAI
-from ..models import Video, Comment
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, TypedDict
+from ..models import Video
 from .video_service import VideoService
 from .comment_service import CommentService
+from .engagement_service import EngagementService
+from .statistics_service import StatisticsService
+from .video_id_service import VideoIdService
 
+if TYPE_CHECKING:
+    from openai import OpenAI
 
-class GeneratedComment(BaseModel):
-    content: str = Field(description="The comment text content")
-    tone: str = Field(
-        description="The tone of the comment (friendly, excited, thoughtful, etc.)"
-    )
-    author_style: str = Field(
-        description="The style this author typically uses (casual, technical, enthusiastic, etc.)"
-    )
-
-
-class CommentBatch(BaseModel):
-    comments: List[GeneratedComment] = Field(description="List of generated comments")
+    from .comment_schemas import GeneratedComment
 
 
 class VideoTemplate(TypedDict):
@@ -31,14 +23,28 @@ class VideoTemplate(TypedDict):
 
 
 class ContentPopulationService:
-    def __init__(self):
+    def __init__(self, openai_client: Optional["OpenAI"] = None):
         self.video_service = VideoService()
         self.comment_service = CommentService()
-
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValidationError("OPENAI_API_KEY environment variable is required")
-        self.client = OpenAI(api_key=api_key)
+        self.engagement_service = EngagementService()
+        self.statistics_service = StatisticsService()
+        self.video_id_service = VideoIdService()
+
+        self._client = openai_client
+        if not openai_client:
+            self.api_key = os.environ.get("OPENAI_API_KEY")
+            if not self.api_key:
+                raise ValidationError("OPENAI_API_KEY environment variable is required")
+
+    @property
+    def client(self) -> "OpenAI":
+        # Built on first use: engagement and population paths that never call
+        # OpenAI do not load the openai package
+        if self._client is None:
+            from openai import OpenAI
+
+            self._client = OpenAI(api_key=self.api_key)
+        return self._client
 
     VIDEO_TEMPLATES: List[VideoTemplate] = [
         {
@@ -111,44 +117,53 @@ class ContentPopulationService:
 
     @transaction.atomic
     def generate_video(self) -> Dict[str, Any]:
-        template = random.choice(self.VIDEO_TEMPLATES)
-        topic = random.choice(template["topics"])
+        [video_data] = self.generate_videos(1)
+        return video_data
 
-        title = template["title"].format(topic=topic)
-        description = template["description"].format(topic=topic)
+    @transaction.atomic
+    def generate_videos(self, count: int) -> List[Dict[str, Any]]:
+        """Create ``count`` videos in one INSERT with a block of reserved ids."""
+        videos = [
+            self._build_video(video_id)
+            for video_id in self.video_id_service.allocate(count)
+        ]
+        Video.objects.bulk_create(videos)
+        self.statistics_service.add_videos(videos)
+
+        return [
+            {
+                "video_id": video.id,
+                "title": video.title,
+                "description": video.description,
+                "url": video.url,
+                "duration": video.duration,
+                "view_count": video.view_count,
+                "like_count": video.like_count,
+            }
+            for video in videos
+        ]
 
-        duration = random.randint(300, 3600)
+    def _build_video(self, video_id: str) -> Video:
+        template = random.choice(self.VIDEO_TEMPLATES)
+        topic = random.choice(template["topics"])
         view_count = random.randint(100, 10000)
-        like_count = random.randint(10, int(view_count * 0.1))
-
-        video_id = f"dQw4w9WgXcQ_{random.randint(1000, 9999)}"
-        url = f"https://youtube.com/watch?v={video_id}"
-        thumbnail_url = f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
-
-        video = Video.objects.create(
-            title=title,
-            description=description,
-            url=url,
-            thumbnail_url=thumbnail_url,
-            duration=duration,
+
+        return Video(
+            title=template["title"].format(topic=topic),
+            description=template["description"].format(topic=topic),
+            url=f"https://youtube.com/watch?v={video_id}",
+            thumbnail_url=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+            duration=random.randint(300, 3600),
             view_count=view_count,
-            like_count=like_count,
+            like_count=random.randint(10, int(view_count * 0.1)),
         )
 
-        return {
-            "video_id": video.id,
-            "title": title,
-            "description": description,
-            "url": url,
-            "duration": duration,
-            "view_count": view_count,
-            "like_count": like_count,
-        }
-
     def _generate_comments_with_ai(
         self, video_title: str, video_description: str, comment_count: int
-    ) -> List[GeneratedComment]:
+    ) -> List["GeneratedComment"]:
         """Generate comments using OpenAI GPT-5 with structured output"""
+        from .comment_schemas import CommentBatch
+
         try:
             system_prompt = (
                 "You are a YouTube comment generator. Create realistic, diverse comments "
@@ -206,6 +221,7 @@ Vary the author styles and perspectives."""
 
                 comment.like_count = random.randint(0, 50)
                 comment.save()
+                self.statistics_service.add_counters(comment_likes=comment.like_count)
 
                 generated_comments.append(
                     {
@@ -236,6 +252,9 @@ Vary the author styles and perspectives."""
                     )
                     comment.like_count = random.randint(0, 50)
                     comment.save()
+                    self.statistics_service.add_counters(
+                        comment_likes=comment.like_count
+                    )
 
                     generated_comments.append(
                         {
@@ -276,6 +295,7 @@ Vary the author styles and perspectives."""
         for video in videos:
             try:
                 activities = []
+                views_to_add = likes_to_add = 0
 
                 if random.random() < 0.7:
                     views_to_add = random.randint(1, 50)
@@ -289,6 +309,10 @@ Vary the author styles and perspectives."""
                         self.video_service.increment_likes(video_id=video.id)
                     activities.append(f"+{likes_to_add} likes")
 
+                self.engagement_service.record(
+                    video_id=video.id, views=views_to_add, likes=likes_to_add
+                )
+
                 engagement_results.append(
                     {
                         "video_id": video.id,
@@ -308,29 +332,4 @@ Vary the author styles and perspectives."""
         }
 
     def get_engagement_statistics(self) -> Dict[str, Any]:
-        from django.db.models import Count, Avg, Max
-
-        video_stats = Video.objects.aggregate(
-            total_videos=Count("id"),
-            avg_views=Avg("view_count"),
-            avg_likes=Avg("like_count"),
-            max_views=Max("view_count"),
-            max_likes=Max("like_count"),
-        )
-
-        comment_stats = Comment.objects.aggregate(
-            total_comments=Count("id"),
-            avg_likes=Avg("like_count"),
-        )
-
-        most_commented = list(
-            Video.objects.annotate(comment_count=Count("comments"))
-            .order_by("-comment_count")[:5]
-            .values("id", "title", "comment_count", "view_count", "like_count")
-        )
-
-        return {
-            "video_stats": video_stats,
-            "comment_stats": comment_stats,
-            "most_commented_videos": most_commented,
-        }
+        return self.statistics_service.get_statistics()
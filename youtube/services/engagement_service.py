@@ -0,0 +1,249 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Trunc
+from django.utils import timezone
+
+from ..models import EngagementBucket, Video
+
+
+class EngagementService:
+    """Record views/likes into time buckets and serve history from them.
+
+    Activity is added to the current minute bucket with a single UPDATE
+    (an INSERT only for the first event of the minute). ``compact`` rolls
+    minute buckets older than ``ENGAGEMENT_MINUTE_RETENTION`` into hour
+    buckets and hour buckets older than ``ENGAGEMENT_HOUR_RETENTION`` into
+    day buckets.
+    """
+
+    GRANULARITIES = ["minute", "hour", "day"]
+    MAX_POINTS = 2000
+
+    def record(
+        self,
+        *,
+        video_id: int,
+        views: int = 0,
+        likes: int = 0,
+        at: Optional[datetime] = None,
+    ) -> None:
+        counts = {"views": views, "likes": likes}
+        increments = {field: F(field) + n for field, n in counts.items() if n}
+        if not increments:
+            return
+
+        bucket_start = self.truncate(at or timezone.now(), "minute")
+        bucket = EngagementBucket.objects.filter(
+            video_id=video_id, granularity="minute", bucket_start=bucket_start
+        )
+        if bucket.update(**increments):
+            return
+
+        try:
+            with transaction.atomic():
+                EngagementBucket.objects.create(
+                    video_id=video_id,
+                    granularity="minute",
+                    bucket_start=bucket_start,
+                    **counts,
+                )
+        except IntegrityError:
+            # Another request created this minute's bucket first
+            bucket.update(**increments)
+
+    def record_many(
+        self,
+        *,
+        deltas: Dict[int, Tuple[int, int]],
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Add ``(views, likes)`` per video id to one minute's buckets in bulk."""
+        deltas = {video_id: delta for video_id, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+
+        bucket_start = self.truncate(at or timezone.now(), "minute")
+        EngagementBucket.objects.bulk_create(
+            [
+                EngagementBucket(
+                    video_id=video_id, granularity="minute", bucket_start=bucket_start
+                )
+                for video_id in deltas
+            ],
+            ignore_conflicts=True,
+            batch_size=settings.BULK_BATCH_SIZE,
+        )
+        # One UPDATE per distinct delta rather than one per video
+        videos_by_delta: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for video_id, delta in deltas.items():
+            videos_by_delta[delta].append(video_id)
+        for (views, likes), video_ids in videos_by_delta.items():
+            EngagementBucket.objects.filter(
+                video_id__in=video_ids,
+                granularity="minute",
+                bucket_start=bucket_start,
+            ).update(views=F("views") + views, likes=F("likes") + likes)
+
+    async def arecord(
+        self,
+        *,
+        video_id: int,
+        views: int = 0,
+        likes: int = 0,
+        at: Optional[datetime] = None,
+    ) -> None:
+        counts = {"views": views, "likes": likes}
+        increments = {field: F(field) + n for field, n in counts.items() if n}
+        if not increments:
+            return
+
+        bucket_start = self.truncate(at or timezone.now(), "minute")
+        bucket = EngagementBucket.objects.filter(
+            video_id=video_id, granularity="minute", bucket_start=bucket_start
+        )
+        if await bucket.aupdate(**increments):
+            return
+
+        try:
+            await EngagementBucket.objects.acreate(
+                video_id=video_id,
+                granularity="minute",
+                bucket_start=bucket_start,
+                **counts,
+            )
+        except IntegrityError:
+            await bucket.aupdate(**increments)
+
+    def compact(self, *, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Roll old minute buckets into hours and old hour buckets into days."""
+        now = now or timezone.now()
+        minute_cutoff = self.truncate(
+            now - settings.ENGAGEMENT_MINUTE_RETENTION, "hour"
+        )
+        hour_cutoff = self.truncate(now - settings.ENGAGEMENT_HOUR_RETENTION, "day")
+
+        return {
+            "minute_buckets_compacted": self._rollup("minute", "hour", minute_cutoff),
+            "hour_buckets_compacted": self._rollup("hour", "day", hour_cutoff),
+        }
+
+    @transaction.atomic
+    def _rollup(self, source: str, target: str, cutoff: datetime) -> int:
+        old = EngagementBucket.objects.filter(
+            granularity=source, bucket_start__lt=cutoff
+        )
+        totals = list(
+            old.annotate(period=Trunc("bucket_start", target, tzinfo=dt_timezone.utc))
+            .values("video_id", "period")
+            .annotate(total_views=Sum("views"), total_likes=Sum("likes"))
+        )
+        if not totals:
+            return 0
+
+        existing = {
+            (bucket.video_id, bucket.bucket_start): bucket
+            for bucket in EngagementBucket.objects.filter(
+                granularity=target,
+                video_id__in={row["video_id"] for row in totals},
+                bucket_start__in={row["period"] for row in totals},
+            )
+        }
+
+        to_update = []
+        to_create = []
+        for row in totals:
+            bucket = existing.get((row["video_id"], row["period"]))
+            if bucket is None:
+                to_create.append(
+                    EngagementBucket(
+                        video_id=row["video_id"],
+                        granularity=target,
+                        bucket_start=row["period"],
+                        views=row["total_views"],
+                        likes=row["total_likes"],
+                    )
+                )
+            else:
+                bucket.views += row["total_views"]
+                bucket.likes += row["total_likes"]
+                to_update.append(bucket)
+
+        EngagementBucket.objects.bulk_update(
+            to_update, ["views", "likes"], batch_size=settings.BULK_BATCH_SIZE
+        )
+        EngagementBucket.objects.bulk_create(
+            to_create, batch_size=settings.BULK_BATCH_SIZE
+        )
+        deleted, _ = old.delete()
+        return deleted
+
+    def get_history(
+        self, *, video_id: int, start: datetime, end: datetime, bucket: str
+    ) -> Dict[str, Any]:
+        """Sum buckets at ``bucket`` resolution over ``[start, end)``.
+
+        Finer buckets that have not been compacted yet are folded in, so
+        recent activity is included at every resolution.
+        """
+        if start >= end:
+            raise ValidationError("'from' must be before 'to'.")
+        if (end - start) / self.bucket_length(bucket) > self.MAX_POINTS:
+            raise ValidationError(
+                f"Range too large for {bucket} buckets (max {self.MAX_POINTS})."
+            )
+        if not Video.objects.filter(pk=video_id).exists():
+            raise ValidationError("Video not found.")
+
+        finer_or_equal = self.GRANULARITIES[: self.GRANULARITIES.index(bucket) + 1]
+        rows = list(
+            EngagementBucket.objects.filter(
+                video_id=video_id,
+                granularity__in=finer_or_equal,
+                bucket_start__gte=self.truncate(start, bucket),
+                bucket_start__lt=end,
+            )
+            .annotate(period=Trunc("bucket_start", bucket, tzinfo=dt_timezone.utc))
+            .values("period")
+            .annotate(views=Sum("views"), likes=Sum("likes"))
+            .order_by("period")
+        )
+
+        points: List[Dict[str, Any]] = [
+            {"start": row["period"], "views": row["views"], "likes": row["likes"]}
+            for row in rows
+        ]
+        return {
+            "video_id": video_id,
+            "bucket": bucket,
+            "from": start,
+            "to": end,
+            "totals": {
+                "views": sum(point["views"] for point in points),
+                "likes": sum(point["likes"] for point in points),
+            },
+            "results": points,
+        }
+
+    @staticmethod
+    def truncate(value: datetime, granularity: str) -> datetime:
+        value = value.astimezone(dt_timezone.utc).replace(second=0, microsecond=0)
+        if granularity in ("hour", "day"):
+            value = value.replace(minute=0)
+        if granularity == "day":
+            value = value.replace(hour=0)
+        return value
+
+    @classmethod
+    def bucket_length(cls, granularity: str) -> timedelta:
+        return {
+            "minute": timedelta(minutes=1),
+            "hour": timedelta(hours=1),
+            "day": timedelta(days=1),
+        }[granularity]
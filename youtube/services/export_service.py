@@ -0,0 +1,133 @@
+import csv
+import io
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ..compression import StreamCompressor
+from ..models import Comment, Video
+
+
+class ExportService:
+    """Stream videos and comments as NDJSON or CSV in constant memory.
+
+    Rows are read with ``.values().iterator()`` (a server-side cursor on
+    PostgreSQL) in ``(updated_at, id)`` order so ``since`` can be used for
+    incremental syncs.
+    """
+
+    FIELDS = {
+        "videos": [
+            "id",
+            "title",
+            "description",
+            "url",
+            "thumbnail_url",
+            "duration",
+            "view_count",
+            "like_count",
+            "created_at",
+            "updated_at",
+        ],
+        "comments": [
+            "id",
+            "video_id",
+            "author",
+            "content",
+            "like_count",
+            "created_at",
+            "updated_at",
+        ],
+    }
+    MODELS = {"videos": Video, "comments": Comment}
+    FORMATS = ["ndjson", "csv"]
+
+    # Encoded output is yielded in pieces of roughly this many bytes
+    FLUSH_BYTES = 64 * 1024
+
+    def get_rows(
+        self,
+        *,
+        resource: str,
+        since: Optional[datetime] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = self.MODELS[resource].objects.values(*self.FIELDS[resource])
+        if since is not None:
+            queryset = queryset.filter(updated_at__gte=since)
+
+        return queryset.order_by("updated_at", "id").iterator(
+            chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE
+        )
+
+    def iter_ndjson(self, rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+        encoder = DjangoJSONEncoder()
+        for row in rows:
+            yield encoder.encode(row) + "\n"
+
+    def iter_csv(
+        self, rows: Iterable[Dict[str, Any]], fields: List[str]
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(
+                {
+                    key: value.isoformat() if isinstance(value, datetime) else value
+                    for key, value in row.items()
+                }
+            )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Header only when there are no rows
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def stream(
+        self,
+        *,
+        resource: str,
+        export_format: str = "ndjson",
+        since: Optional[datetime] = None,
+        chunk_size: Optional[int] = None,
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """Yield the encoded (and optionally gzipped) export as bytes."""
+        rows = self.get_rows(resource=resource, since=since, chunk_size=chunk_size)
+        if export_format == "csv":
+            lines = self.iter_csv(rows, self.FIELDS[resource])
+        else:
+            lines = self.iter_ndjson(rows)
+
+        chunks = self._buffer(lines)
+        if compress:
+            chunks = self._gzip(chunks)
+        return chunks
+
+    def _buffer(self, lines: Iterable[str]) -> Iterator[bytes]:
+        pending: List[bytes] = []
+        size = 0
+        for line in lines:
+            data = line.encode("utf-8")
+            pending.append(data)
+            size += len(data)
+            if size >= self.FLUSH_BYTES:
+                yield b"".join(pending)
+                pending = []
+                size = 0
+        if pending:
+            yield b"".join(pending)
+
+    def _gzip(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = StreamCompressor("gzip")
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.finish()
@@ -0,0 +1,66 @@
+import contextlib
+from typing import Iterator, Optional
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.redis import RedisCache
+
+from ..checks import require_shared_cache
+
+
+class LeaseService:
+    """Expiring, exclusive leases held in the cache.
+
+    ``acquire`` is a single atomic ``add`` (``SET NX PX`` on Redis, a locked
+    dict in the locmem test cache), so at most one owner holds a lease at
+    a time across workers and beat instances. Leases expire after
+    ``timeout`` seconds, so a crashed owner cannot block others forever.
+    """
+
+    KEY = "lease:{name}"
+
+    # Compare-and-delete, so a lease that expired and was taken by another
+    # owner between the check and the delete is left alone
+    RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    def acquire(self, name: str, *, owner: str, timeout: int) -> bool:
+        # A per-process cache would give every worker its own lease
+        require_shared_cache()
+        return cache.add(self.KEY.format(name=name), owner, timeout)
+
+    def release(self, name: str, *, owner: str) -> None:
+        """Release the lease if ``owner`` still holds it.
+
+        On Redis the check and delete run as one script. Other backends
+        (locmem in tests and local runs) check then delete, which is only
+        safe because they are not shared between processes.
+        """
+        key = self.KEY.format(name=name)
+        backend = caches[DEFAULT_CACHE_ALIAS]
+        if isinstance(backend, RedisCache):
+            client = backend._cache.get_client(key, write=True)
+            client.eval(
+                self.RELEASE_SCRIPT,
+                1,
+                backend.make_and_validate_key(key),
+                backend._cache._serializer.dumps(owner),
+            )
+        elif backend.get(key) == owner:
+            backend.delete(key)
+
+    def holder(self, name: str) -> Optional[str]:
+        return cache.get(self.KEY.format(name=name))
+
+    @contextlib.contextmanager
+    def hold(self, name: str, *, owner: str, timeout: int) -> Iterator[bool]:
+        """Yield whether the lease was acquired; release it on exit."""
+        acquired = self.acquire(name, owner=owner, timeout=timeout)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self.release(name, owner=owner)
@@ -0,0 +1,82 @@
+import re
+from typing import Optional
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, QuerySet
+from django.db.models.expressions import RawSQL
+
+from ..models import Comment, Video
+
+
+class SearchService:
+    """Ranked full-text search over videos and comments.
+
+    Uses the ``search_vector`` GIN-indexed columns on PostgreSQL and the FTS5
+    tables on SQLite (see migration ``0005_search_index``). Both are kept up
+    to date by the database on every write.
+    """
+
+    MODELS = {"video": Video, "comment": Comment}
+
+    # FTS5 bm25() weights, in the column order of each FTS table
+    SQLITE_WEIGHTS = {"video": "10.0, 4.0", "comment": "10.0, 4.0"}
+
+    def search(
+        self,
+        *,
+        query: str,
+        search_type: str = "video",
+        queryset: Optional[QuerySet] = None,
+    ) -> QuerySet:
+        """Return matching rows annotated with ``rank`` (higher is better)."""
+        model = self.MODELS[search_type]
+        if queryset is None:
+            queryset = model.objects.all()
+
+        if connection.vendor == "postgresql":
+            return self._search_postgresql(queryset, query)
+        return self._search_sqlite(queryset, query, search_type)
+
+    def _search_postgresql(self, queryset: QuerySet, query: str) -> QuerySet:
+        table = queryset.model._meta.db_table
+        tsquery = "websearch_to_tsquery('english', %s)"
+        return queryset.annotate(
+            rank=RawSQL(
+                f"ts_rank_cd({table}.search_vector, {tsquery})::float8",
+                [query],
+                output_field=FloatField(),
+            )
+        ).filter(
+            RawSQL(
+                f"{table}.search_vector @@ {tsquery}",
+                [query],
+                output_field=BooleanField(),
+            )
+        )
+
+    def _search_sqlite(
+        self, queryset: QuerySet, query: str, search_type: str
+    ) -> QuerySet:
+        table = queryset.model._meta.db_table
+        fts = f"{table}_fts"
+        match = self._fts5_query(query)
+        if not match:
+            return queryset.none()
+
+        weights = self.SQLITE_WEIGHTS[search_type]
+        return queryset.annotate(
+            # bm25() is lower-is-better; negate it to match ts_rank_cd
+            rank=RawSQL(
+                f"SELECT -bm25({fts}, {weights}) FROM {fts} "
+                f"WHERE {fts} MATCH %s AND {fts}.rowid = {table}.id",
+                [match],
+                output_field=FloatField(),
+            )
+        ).filter(
+            id__in=RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [match])
+        )
+
+    def _fts5_query(self, query: str) -> str:
+        # Quote every word so user input can never be parsed as FTS5 syntax
+        words = re.findall(r"\w+", query)
+        return " ".join(f'"{word}"' for word in words)
@@ -0,0 +1,231 @@
+import random
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Max, Sum, Value
+from django.db.models.functions import Greatest
+
+from ..db_router import read_from_replica
+from ..models import Comment, EngagementAggregate, Video, VideoCommentTally
+
+
+class StatisticsService:
+    """Engagement statistics read from running totals in O(1).
+
+    Write paths in ``VideoService``, ``CommentService`` and the content
+    population services call the ``add_*`` methods inside their own
+    transactions. ``rebuild`` recomputes everything from the base tables.
+    """
+
+    TOP_COMMENTED = 5
+
+    def add_videos(self, videos: Iterable[Video], *, sign: int = 1) -> None:
+        videos = list(videos)
+        if not videos:
+            return
+
+        self._apply(
+            video_count=sign * len(videos),
+            view_sum=sign * sum(video.view_count for video in videos),
+            like_sum=sign * sum(video.like_count for video in videos),
+            view_max=max(video.view_count for video in videos) if sign > 0 else None,
+            like_max=max(video.like_count for video in videos) if sign > 0 else None,
+        )
+
+    def add_comments(self, comments: Iterable[Comment], *, sign: int = 1) -> None:
+        comments = list(comments)
+        if not comments:
+            return
+
+        self._apply(
+            comment_count=sign * len(comments),
+            comment_like_sum=sign * sum(comment.like_count for comment in comments),
+        )
+        per_video = Counter(comment.video_id for comment in comments)
+        self._tally({video_id: sign * n for video_id, n in per_video.items()})
+
+    def remove_video(self, video: Video) -> None:
+        """Account for deleting ``video`` and, by cascade, its comments."""
+        comments = video.comments.aggregate(count=Count("id"), likes=Sum("like_count"))
+        self.add_videos([video], sign=-1)
+        self._apply(
+            comment_count=-comments["count"],
+            comment_like_sum=-(comments["likes"] or 0),
+        )
+
+    def add_counters(
+        self,
+        *,
+        views: int = 0,
+        likes: int = 0,
+        comment_likes: int = 0,
+        view_count: Optional[int] = None,
+        like_count: Optional[int] = None,
+    ) -> None:
+        """Add counter increments; ``view_count``/``like_count`` are new values."""
+        self._apply(
+            view_sum=views,
+            like_sum=likes,
+            comment_like_sum=comment_likes,
+            view_max=view_count,
+            like_max=like_count,
+        )
+
+    def _apply(self, **deltas) -> None:
+        updates = self._updates(**deltas)
+        if not updates:
+            return
+
+        shard = random.randrange(settings.STATS_SHARDS)
+        if not EngagementAggregate.objects.filter(shard=shard).update(**updates):
+            EngagementAggregate.objects.get_or_create(shard=shard)
+            EngagementAggregate.objects.filter(shard=shard).update(**updates)
+
+    def _updates(
+        self,
+        *,
+        view_max: Optional[int] = None,
+        like_max: Optional[int] = None,
+        **deltas: int,
+    ) -> Dict[str, Any]:
+        updates: Dict[str, Any] = {
+            field: F(field) + delta for field, delta in deltas.items() if delta
+        }
+        if view_max is not None:
+            updates["view_max"] = Greatest("view_max", Value(view_max))
+        if like_max is not None:
+            updates["like_max"] = Greatest("like_max", Value(like_max))
+        return updates
+
+    def _tally(self, deltas: Dict[int, int]) -> None:
+        VideoCommentTally.objects.bulk_create(
+            [VideoCommentTally(video_id=video_id) for video_id in deltas],
+            ignore_conflicts=True,
+            batch_size=settings.BULK_BATCH_SIZE,
+        )
+        # One UPDATE per distinct delta rather than one per video
+        videos_by_delta: Dict[int, List[int]] = defaultdict(list)
+        for video_id, delta in deltas.items():
+            if delta:
+                videos_by_delta[delta].append(video_id)
+        for delta, video_ids in videos_by_delta.items():
+            VideoCommentTally.objects.filter(video_id__in=video_ids).update(
+                comment_count=F("comment_count") + delta
+            )
+
+    def get_statistics(self) -> Dict[str, Any]:
+        # Totals tolerate replication lag; inside a transaction (e.g. rebuild)
+        # the router keeps reads on the primary.
+        with read_from_replica():
+            return self._get_statistics()
+
+    def _get_statistics(self) -> Dict[str, Any]:
+        totals = EngagementAggregate.objects.aggregate(
+            video_count=Sum("video_count"),
+            view_sum=Sum("view_sum"),
+            like_sum=Sum("like_sum"),
+            view_max=Max("view_max"),
+            like_max=Max("like_max"),
+            comment_count=Sum("comment_count"),
+            comment_like_sum=Sum("comment_like_sum"),
+        )
+        video_count = totals["video_count"] or 0
+        comment_count = totals["comment_count"] or 0
+
+        return {
+            "video_stats": {
+                "total_videos": video_count,
+                "avg_views": totals["view_sum"] / video_count if video_count else None,
+                "avg_likes": totals["like_sum"] / video_count if video_count else None,
+                "max_views": totals["view_max"] if video_count else None,
+                "max_likes": totals["like_max"] if video_count else None,
+            },
+            "comment_stats": {
+                "total_comments": comment_count,
+                "avg_likes": (
+                    totals["comment_like_sum"] / comment_count
+                    if comment_count
+                    else None
+                ),
+            },
+            "most_commented_videos": self.get_most_commented(),
+        }
+
+    def get_most_commented(self) -> List[Dict[str, Any]]:
+        tallies = (
+            VideoCommentTally.objects.filter(comment_count__gt=0)
+            .select_related("video")
+            .order_by("-comment_count", "video_id")[: self.TOP_COMMENTED]
+        )
+        rows = [
+            {
+                "id": tally.video_id,
+                "title": tally.video.title,
+                "comment_count": tally.comment_count,
+                "view_count": tally.video.view_count,
+                "like_count": tally.video.like_count,
+            }
+            for tally in tallies
+        ]
+
+        # Fewer commented videos than requested: fill up with uncommented ones
+        if len(rows) < self.TOP_COMMENTED:
+            uncommented = (
+                Video.objects.exclude(pk__in=[row["id"] for row in rows])
+                .order_by("id")
+                .values("id", "title", "view_count", "like_count")
+            )
+            rows += [
+                {**video, "comment_count": 0}
+                for video in uncommented[: self.TOP_COMMENTED - len(rows)]
+            ]
+        return rows
+
+    @transaction.atomic
+    def rebuild(self) -> Dict[str, Any]:
+        """Recompute the running totals and tallies from the base tables.
+
+        Returns the statistics before and after so drift can be reported.
+        """
+        before = self.get_statistics()
+
+        videos = Video.objects.aggregate(
+            count=Count("id"),
+            views=Sum("view_count"),
+            likes=Sum("like_count"),
+            max_views=Max("view_count"),
+            max_likes=Max("like_count"),
+        )
+        comments = Comment.objects.aggregate(count=Count("id"), likes=Sum("like_count"))
+        EngagementAggregate.objects.all().delete()
+        EngagementAggregate.objects.create(
+            shard=0,
+            video_count=videos["count"],
+            view_sum=videos["views"] or 0,
+            like_sum=videos["likes"] or 0,
+            view_max=videos["max_views"] or 0,
+            like_max=videos["max_likes"] or 0,
+            comment_count=comments["count"],
+            comment_like_sum=comments["likes"] or 0,
+        )
+
+        VideoCommentTally.objects.all().delete()
+        tallies = (
+            Comment.objects.order_by()
+            .values("video_id")
+            .annotate(count=Count("id"))
+            .iterator(chunk_size=settings.BULK_BATCH_SIZE)
+        )
+        batch: List[VideoCommentTally] = []
+        for row in tallies:
+            batch.append(
+                VideoCommentTally(video_id=row["video_id"], comment_count=row["count"])
+            )
+            if len(batch) >= settings.BULK_BATCH_SIZE:
+                VideoCommentTally.objects.bulk_create(batch)
+                batch = []
+        VideoCommentTally.objects.bulk_create(batch)
+
+        return {"before": before, "after": self.get_statistics()}
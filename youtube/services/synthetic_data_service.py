@@ -0,0 +1,209 @@
+"""
+Offline synthetic data generation for benchmarks and capacity testing.
+"""
+
+import csv
+import io
+import random
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ..models import Comment, Video
+from .content_population_service import ContentPopulationService
+from .statistics_service import StatisticsService
+
+
+class SyntheticDataService:
+    """Generate videos and comments without calling OpenAI."""
+
+    COMMENT_PHRASES = [
+        "Great explanation of {topic}, thanks!",
+        "I finally understand {topic} after watching this.",
+        "Could you do a follow-up on {topic}?",
+        "The part about {topic} at the end was the best.",
+        "Been struggling with {topic} for weeks, this helped a lot.",
+    ]
+
+    def __init__(self, *, seed: Optional[int] = None):
+        self.random = random.Random(seed)
+        self.statistics_service = StatisticsService()
+
+    def build_videos(
+        self, count: int, *, prefix: Optional[str] = None, start: int = 0
+    ) -> List[Video]:
+        """Build unsaved Video instances with unique URLs.
+
+        URLs are ``<prefix>-<n>`` for n in ``start``..``start + count``, so
+        distinct ranges of one prefix never collide.
+        """
+        prefix = prefix or uuid.uuid4().hex[:8]
+        videos = []
+
+        for index in range(start, start + count):
+            template = self.random.choice(ContentPopulationService.VIDEO_TEMPLATES)
+            topic = self.random.choice(template["topics"])
+            view_count = self.random.randint(100, 10000)
+            video_id = f"{prefix}-{index}"
+
+            videos.append(
+                Video(
+                    title=template["title"].format(topic=topic),
+                    description=template["description"].format(topic=topic),
+                    url=f"https://youtube.com/watch?v={video_id}",
+                    thumbnail_url=f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                    duration=self.random.randint(300, 3600),
+                    view_count=view_count,
+                    like_count=self.random.randint(10, int(view_count * 0.1)),
+                )
+            )
+
+        return videos
+
+    def build_comments(self, video_ids: List[int], count: int) -> List[Comment]:
+        """Build unsaved Comment instances spread randomly over ``video_ids``."""
+        comments = []
+
+        for _ in range(count):
+            phrase = self.random.choice(self.COMMENT_PHRASES)
+            template = self.random.choice(ContentPopulationService.VIDEO_TEMPLATES)
+
+            comments.append(
+                Comment(
+                    video_id=self.random.choice(video_ids),
+                    author=self.random.choice(ContentPopulationService.COMMENT_AUTHORS),
+                    content=phrase.format(topic=self.random.choice(template["topics"])),
+                    like_count=self.random.randint(0, 50),
+                )
+            )
+
+        return comments
+
+    def seed_comments(
+        self, *, video_ids: List[int], comment_count: int, batch_size: int = 1000
+    ) -> int:
+        """Insert ``comment_count`` comments spread over ``video_ids``."""
+        if not video_ids:
+            return 0
+
+        created = 0
+        while created < comment_count:
+            chunk = min(batch_size, comment_count - created)
+            comments = Comment.objects.bulk_create(
+                self.build_comments(video_ids, chunk), batch_size=batch_size
+            )
+            self.statistics_service.add_comments(comments)
+            created += chunk
+
+        return created
+
+    @transaction.atomic
+    def seed(
+        self, *, video_count: int, comment_count: int, batch_size: int = 1000
+    ) -> Dict[str, Any]:
+        """Insert ``video_count`` videos and ``comment_count`` comments in batches."""
+        videos = Video.objects.bulk_create(
+            self.build_videos(video_count), batch_size=batch_size
+        )
+        self.statistics_service.add_videos(videos)
+        video_ids = [video.id for video in videos]
+
+        comments_created = self.seed_comments(
+            video_ids=video_ids, comment_count=comment_count, batch_size=batch_size
+        )
+
+        return {
+            "videos_created": len(video_ids),
+            "comments_created": comments_created,
+            "video_ids": video_ids,
+        }
+
+    def seed_range(
+        self,
+        *,
+        prefix: str,
+        start: int,
+        video_count: int,
+        comment_count: int,
+        batch_size: int = 1000,
+        use_copy: bool = False,
+    ) -> Dict[str, int]:
+        """Insert videos ``start``..``start + video_count`` of a seeding run.
+
+        Comments are spread over the videos of each batch, and every batch
+        commits on its own so millions of rows never share one transaction.
+        ``use_copy`` loads rows with PostgreSQL ``COPY`` instead of INSERT.
+        """
+        videos_created = comments_created = 0
+
+        for offset in range(0, video_count, batch_size):
+            count = min(batch_size, video_count - offset)
+            # This batch's share of comment_count, exact over all batches
+            comments = (
+                comment_count * (offset + count) // video_count
+                - comment_count * offset // video_count
+            )
+
+            with transaction.atomic():
+                videos = self.build_videos(count, prefix=prefix, start=start + offset)
+                if use_copy:
+                    self._copy(Video, videos)
+                    ids = dict(
+                        Video.objects.filter(
+                            url__in=[video.url for video in videos]
+                        ).values_list("url", "id")
+                    )
+                    for video in videos:
+                        video.id = ids[video.url]
+                else:
+                    Video.objects.bulk_create(videos, batch_size=batch_size)
+                self.statistics_service.add_videos(videos)
+
+                if comments:
+                    built = self.build_comments(
+                        [video.id for video in videos], comments
+                    )
+                    if use_copy:
+                        self._copy(Comment, built)
+                    else:
+                        Comment.objects.bulk_create(built, batch_size=batch_size)
+                    self.statistics_service.add_comments(built)
+
+            videos_created += count
+            comments_created += comments
+
+        return {"videos_created": videos_created, "comments_created": comments_created}
+
+    def _copy(self, model, objs: Sequence[Any]) -> None:
+        """Load ``objs`` into ``model``'s table with PostgreSQL COPY."""
+        fields = [
+            field for field in model._meta.concrete_fields if not field.primary_key
+        ]
+        now = timezone.now()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        for obj in objs:
+            row = []
+            for field in fields:
+                if getattr(field, "auto_now", False):
+                    setattr(obj, field.attname, now)
+                value = field.get_db_prep_save(getattr(obj, field.attname), connection)
+                row.append(r"\N" if value is None else value)
+            writer.writerow(row)
+
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        sql = (
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            r"FROM STDIN WITH (FORMAT csv, NULL '\N')"
+        )
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, "copy_expert"):
+                # psycopg2
+                buffer.seek(0)
+                cursor.cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
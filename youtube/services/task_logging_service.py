@@ -68,3 +68,23 @@ class TaskLoggingService:
             task_log.save()
         except TaskLog.DoesNotExist:
             pass
+
+    @staticmethod
+    def log_task_skipped(task_name: str, task_id: str, reason: str) -> TaskLog:
+        """Log a run that was skipped without doing any work.
+
+        A retried task keeps its id, so an earlier attempt's log is updated.
+        """
+        now = timezone.now()
+        task_log, _ = TaskLog.objects.update_or_create(
+            task_id=task_id,
+            defaults={
+                "task_name": task_name,
+                "status": "SKIPPED",
+                "result": {"reason": reason},
+                "started_at": now,
+                "completed_at": now,
+                "duration_seconds": 0.0,
+            },
+        )
+        return task_log
@@ -0,0 +1,153 @@
+import math
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from ..models import Comment, Video, VideoTrendingScore
+
+
+def _logaddexp(a: float, b: float) -> float:
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+class TrendingService:
+    """Maintain and serve time-decayed trending scores per window.
+
+    Activity (new views, likes and comments since the previous run) decays
+    as ``exp(-age / tau)`` with ``tau`` taken from ``TRENDING_WINDOWS``. The
+    stored score is ``log(sum(activity * exp((t - EPOCH) / tau)))``: every
+    row decays by the same factor over time, so ranking needs no rewrite of
+    idle rows and the top N is a range read on the ``(window, -score)``
+    index.
+    """
+
+    WEIGHTS = {"views": 1.0, "likes": 5.0, "comments": 10.0}
+    EPOCH = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+
+    # Re-scan a little before the previous run to catch late commits;
+    # activity is diffed against snapshots, so overlap is never counted twice.
+    SCAN_OVERLAP = timedelta(minutes=1)
+    BATCH_SIZE = 1000
+
+    def update_scores(self, *, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Fold activity since the last run into each window's score."""
+        now = now or timezone.now()
+        windows = settings.TRENDING_WINDOWS
+
+        since = VideoTrendingScore.objects.aggregate(since=Max("computed_at"))["since"]
+        candidates = Video.objects.all()
+        if since is not None:
+            since -= self.SCAN_OVERLAP
+            commented = Comment.objects.filter(updated_at__gte=since).values("video_id")
+            candidates = candidates.filter(
+                Q(updated_at__gte=since) | Q(pk__in=commented)
+            )
+        video_ids = list(candidates.order_by().values_list("id", flat=True))
+
+        scores_updated = 0
+        for start in range(0, len(video_ids), self.BATCH_SIZE):
+            batch = video_ids[start : start + self.BATCH_SIZE]
+            scores_updated += self._update_batch(batch, windows, now)
+
+        return {
+            "videos_scanned": len(video_ids),
+            "scores_updated": scores_updated,
+            "computed_at": now.isoformat(),
+        }
+
+    @transaction.atomic
+    def _update_batch(
+        self, video_ids: List[int], windows: Dict[str, float], now: datetime
+    ) -> int:
+        counts = (
+            Video.objects.filter(pk__in=video_ids)
+            .annotate(comment_count=Count("comments"))
+            .order_by()
+            .values_list("id", "view_count", "like_count", "comment_count")
+        )
+        previous = {
+            (row.video_id, row.window): row
+            for row in VideoTrendingScore.objects.filter(video_id__in=video_ids)
+        }
+        elapsed = (now - self.EPOCH).total_seconds()
+
+        rows = []
+        for video_id, views, likes, comments in counts:
+            for window, tau in windows.items():
+                prev = previous.get((video_id, window))
+                activity = self._activity(prev, views, likes, comments)
+                if not activity:
+                    continue
+
+                contribution = math.log(activity) + elapsed / tau
+                score = _logaddexp(prev.score, contribution) if prev else contribution
+                rows.append(
+                    VideoTrendingScore(
+                        video_id=video_id,
+                        window=window,
+                        score=score,
+                        view_count=views,
+                        like_count=likes,
+                        comment_count=comments,
+                        computed_at=now,
+                    )
+                )
+
+        VideoTrendingScore.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["video", "window"],
+            update_fields=[
+                "score",
+                "view_count",
+                "like_count",
+                "comment_count",
+                "computed_at",
+            ],
+        )
+        return len(rows)
+
+    def _activity(
+        self,
+        prev: Optional[VideoTrendingScore],
+        views: int,
+        likes: int,
+        comments: int,
+    ) -> float:
+        """Weighted engagement added since the ``prev`` snapshot."""
+        if prev is not None:
+            views -= prev.view_count
+            likes -= prev.like_count
+            comments -= prev.comment_count
+
+        return (
+            self.WEIGHTS["views"] * max(views, 0)
+            + self.WEIGHTS["likes"] * max(likes, 0)
+            + self.WEIGHTS["comments"] * max(comments, 0)
+        )
+
+    def get_trending(
+        self, *, window: str, limit: int = 10, now: Optional[datetime] = None
+    ) -> List[VideoTrendingScore]:
+        """Return the top ``limit`` videos for ``window``, best first.
+
+        Each row gets ``current_score``: the decayed activity as of ``now``.
+        """
+        now = now or timezone.now()
+        tau = settings.TRENDING_WINDOWS[window]
+        elapsed = (now - self.EPOCH).total_seconds()
+
+        rows = list(
+            VideoTrendingScore.objects.filter(window=window)
+            .select_related("video")
+            .order_by("-score")[:limit]
+        )
+        for row in rows:
+            row.current_score = math.exp(row.score - elapsed / tau)
+        return rows
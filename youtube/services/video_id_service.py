@@ -0,0 +1,51 @@
+import base64
+from typing import List
+
+from django.db import transaction
+from django.db.models import F
+
+from ..models import IdSequence
+
+
+class VideoIdService:
+    """Collision-free 11-character video ids in YouTube's base64url format.
+
+    Values come from the ``video`` ``IdSequence``: ``reserve`` takes a
+    block of n values with one atomic UPDATE, so concurrent workers never
+    get the same value. Each value goes through a 64-bit bijection (so
+    consecutive videos get unrelated-looking ids) and is encoded as 11
+    base64url characters. Distinct values give distinct ids, so inserts
+    never fail on the unique URL.
+
+    The sequence row stays locked until the caller's transaction commits;
+    keep those transactions short.
+    """
+
+    SEQUENCE = "video"
+    MASK = (1 << 64) - 1
+
+    def reserve(self, count: int) -> range:
+        """Reserve ``count`` consecutive sequence values."""
+        with transaction.atomic():
+            sequence = IdSequence.objects.filter(name=self.SEQUENCE)
+            if not sequence.update(next_value=F("next_value") + count):
+                IdSequence.objects.get_or_create(name=self.SEQUENCE)
+                sequence.update(next_value=F("next_value") + count)
+            end = sequence.values_list("next_value", flat=True).get()
+        return range(end - count, end)
+
+    def allocate(self, count: int = 1) -> List[str]:
+        """Return ``count`` new video ids reserved as one block."""
+        return [self.encode(value) for value in self.reserve(count)]
+
+    @classmethod
+    def encode(cls, value: int) -> str:
+        # splitmix64 finalizer: every step is invertible, so no two values
+        # share an output
+        value &= cls.MASK
+        value ^= value >> 30
+        value = (value * 0xBF58476D1CE4E5B9) & cls.MASK
+        value ^= value >> 27
+        value = (value * 0x94D049BB133111EB) & cls.MASK
+        value ^= value >> 31
+        return base64.urlsafe_b64encode(value.to_bytes(8, "big")).rstrip(b"=").decode()
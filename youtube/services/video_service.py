@@ -1,25 +1,72 @@
+from collections import defaultdict
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from django.db.models import Count
-from typing import Optional
+from django.db.models import Count, F, Max
+from django.utils import timezone
+from typing import Any, Dict, List, Optional, Tuple
 from ..models import Video
+from .statistics_service import StatisticsService
 
 
 class VideoService:
-    def get_all(self):
+    UPSERT_FIELDS = ["title", "description", "thumbnail_url", "duration", "updated_at"]
+
+    def __init__(self):
+        self.statistics_service = StatisticsService()
+
+    def get_all(self, *, comments_count: bool = True):
+        if not comments_count:
+            return Video.objects.all()
         return Video.objects.annotate(comments_count=Count("comments")).all()
 
-    def get_by_id(self, *, video_id: int) -> Video:
+    def get_by_id(
+        self,
+        *,
+        video_id: int,
+        only: Optional[List[str]] = None,
+        comments: bool = True,
+        comments_count: bool = True,
+    ) -> Video:
+        """Fetch one video; ``only`` limits the loaded columns and the comment
+        prefetch and count are skipped when not needed."""
+        queryset = self._detail_queryset(
+            only=only, comments=comments, comments_count=comments_count
+        )
         try:
-            return (
-                Video.objects.select_related()
-                .prefetch_related("comments")
-                .annotate(comments_count=Count("comments"))
-                .get(pk=video_id)
-            )
+            return queryset.get(pk=video_id)
         except Video.DoesNotExist:
             raise ValidationError("Video not found.")
 
+    async def aget_by_id(
+        self,
+        *,
+        video_id: int,
+        only: Optional[List[str]] = None,
+        comments: bool = True,
+        comments_count: bool = True,
+    ) -> Video:
+        queryset = self._detail_queryset(
+            only=only, comments=comments, comments_count=comments_count
+        )
+        try:
+            return await queryset.aget(pk=video_id)
+        except Video.DoesNotExist:
+            raise ValidationError("Video not found.")
+
+    def _detail_queryset(
+        self, *, only: Optional[List[str]], comments: bool, comments_count: bool
+    ):
+        queryset = Video.objects.select_related()
+        if only is not None:
+            queryset = queryset.only(*only)
+        if comments:
+            queryset = queryset.prefetch_related("comments")
+        if comments_count:
+            queryset = queryset.annotate(comments_count=Count("comments"))
+        return queryset
+
     @transaction.atomic
     def create(
         self,
@@ -39,10 +86,91 @@ class VideoService:
         )
         video.full_clean()
         video.save()
+        self.statistics_service.add_videos([video])
 
         # Return with annotations for serializer compatibility
         return Video.objects.annotate(comments_count=Count("comments")).get(pk=video.pk)
 
+    def bulk_create(
+        self,
+        *,
+        items: List[Dict[str, Any]],
+        upsert: bool = False,
+        atomic: bool = False,
+    ) -> Dict[str, Any]:
+        """Validate and insert many videos with batched ``bulk_create``.
+
+        Items failing model validation are reported by position in ``items``.
+        With ``upsert`` an existing ``url`` is updated instead of rejected;
+        with ``atomic`` nothing is written if any item fails.
+        """
+        errors: List[Dict[str, Any]] = []
+        videos: List[Video] = []
+        url_positions: Dict[str, int] = {}
+
+        for index, item in enumerate(items):
+            video = Video(
+                title=item["title"],
+                description=item.get("description") or "",
+                url=item["url"],
+                thumbnail_url=item.get("thumbnail_url") or "",
+                duration=item.get("duration") or 0,
+            )
+            try:
+                # Uniqueness is checked below with one query for the batch
+                video.full_clean(validate_unique=False)
+            except ValidationError as e:
+                errors.append({"index": index, "errors": e.message_dict})
+                continue
+
+            if video.url in url_positions:
+                errors.append(
+                    {"index": index, "errors": {"url": ["Duplicate url in request."]}}
+                )
+                continue
+            url_positions[video.url] = index
+            videos.append(video)
+
+        existing_urls = set(
+            Video.objects.filter(url__in=url_positions).values_list("url", flat=True)
+        )
+        if existing_urls and not upsert:
+            errors.extend(
+                {
+                    "index": url_positions[url],
+                    "errors": {"url": ["Video with this Url already exists."]},
+                }
+                for url in existing_urls
+            )
+            videos = [video for video in videos if video.url not in existing_urls]
+
+        errors.sort(key=lambda error: error["index"])
+        if atomic and errors:
+            return {"created_ids": [], "updated_ids": [], "errors": errors}
+
+        with transaction.atomic():
+            if upsert:
+                saved = Video.objects.bulk_create(
+                    videos,
+                    batch_size=settings.BULK_BATCH_SIZE,
+                    update_conflicts=True,
+                    unique_fields=["url"],
+                    update_fields=self.UPSERT_FIELDS,
+                )
+            else:
+                saved = Video.objects.bulk_create(
+                    videos, batch_size=settings.BULK_BATCH_SIZE
+                )
+            self.statistics_service.add_videos(
+                video for video in saved if video.url not in existing_urls
+            )
+
+        return {
+            "created_ids": [v.pk for v in saved if v.url not in existing_urls],
+            "updated_ids": [v.pk for v in saved if v.url in existing_urls],
+            "errors": errors,
+        }
+
     @transaction.atomic
     def update(self, *, video_id: int, **kwargs) -> Video:
         try:
@@ -71,6 +199,7 @@ class VideoService:
         except Video.DoesNotExist:
             raise ValidationError("Video not found.")
 
+        self.statistics_service.remove_video(video)
         video.delete()
 
     @transaction.atomic
@@ -83,6 +212,7 @@ class VideoService:
         video.view_count += 1
         video.full_clean()
         video.save()
+        self.statistics_service.add_counters(views=1, view_count=video.view_count)
 
         return video
 
@@ -96,5 +226,64 @@ class VideoService:
         video.like_count += 1
         video.full_clean()
         video.save()
+        self.statistics_service.add_counters(likes=1, like_count=video.like_count)
 
         return video
+
+    @transaction.atomic
+    def add_engagement(self, *, deltas: Dict[int, Tuple[int, int]]) -> Dict[str, int]:
+        """Add ``(views, likes)`` per video id with one UPDATE per distinct delta.
+
+        Unknown video ids are skipped; returns the views and likes applied.
+        """
+        videos_by_delta: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for video_id, delta in deltas.items():
+            if any(delta):
+                videos_by_delta[delta].append(video_id)
+
+        now = timezone.now()
+        views = likes = 0
+        for (view_delta, like_delta), video_ids in videos_by_delta.items():
+            updated = Video.objects.filter(pk__in=video_ids).update(
+                view_count=F("view_count") + view_delta,
+                like_count=F("like_count") + like_delta,
+                updated_at=now,
+            )
+            views += view_delta * updated
+            likes += like_delta * updated
+
+        if views or likes:
+            maxima = Video.objects.filter(
+                pk__in=[pk for ids in videos_by_delta.values() for pk in ids]
+            ).aggregate(view_count=Max("view_count"), like_count=Max("like_count"))
+            self.statistics_service.add_counters(views=views, likes=likes, **maxima)
+
+        return {"views": views, "likes": likes}
+
+    async def aincrement_views(self, *, video_id: int) -> int:
+        return await self._aincrement(video_id=video_id, field="view_count")
+
+    async def aincrement_likes(self, *, video_id: int) -> int:
+        return await self._aincrement(video_id=video_id, field="like_count")
+
+    async def _aincrement(self, *, video_id: int, field: str) -> int:
+        return await sync_to_async(self._increment_counter)(
+            video_id=video_id, field=field
+        )
+
+    @transaction.atomic
+    def _increment_counter(self, *, video_id: int, field: str) -> int:
+        # Single atomic UPDATE instead of read-modify-write; auto_now is not
+        # applied by update(), so updated_at is set explicitly.
+        updated = Video.objects.filter(pk=video_id).update(
+            **{field: F(field) + 1}, updated_at=timezone.now()
+        )
+        if not updated:
+            raise ValidationError("Video not found.")
+
+        value = Video.objects.values_list(field, flat=True).get(pk=video_id)
+        if field == "view_count":
+            self.statistics_service.add_counters(views=1, view_count=value)
+        else:
+            self.statistics_service.add_counters(likes=1, like_count=value)
+        return value
@@ -4,11 +4,18 @@ Celery tasks for YouTube integration.
 
 from .content_generation_tasks import ContentGenerationTasks
 from .engagement_tasks import EngagementTasks
+from .trending_tasks import TrendingTasks
 
 # Export the task functions for backward compatibility
 generate_video_content = ContentGenerationTasks.generate_video_content
 generate_comments_for_video = ContentGenerationTasks.generate_comments_for_video
+flush_comment_requests = ContentGenerationTasks.flush_comment_requests
 populate_initial_content = ContentGenerationTasks.populate_initial_content
+populate_videos = ContentGenerationTasks.populate_videos
+finish_initial_population = ContentGenerationTasks.finish_initial_population
 
 simulate_user_engagement = EngagementTasks.simulate_user_engagement
 generate_engagement_stats = EngagementTasks.generate_engagement_stats
+compact_engagement_buckets = EngagementTasks.compact_engagement_buckets
+
+update_trending_scores = TrendingTasks.update_trending_scores
@@ -2,7 +2,11 @@
 Base task class with common functionality.
 """
 
+import functools
 import logging
+import uuid
+
+from ..services.lease_service import LeaseService
 from ..services.task_logging_service import TaskLoggingService
 
 logger = logging.getLogger(__name__)
@@ -28,7 +32,60 @@ class BaseTask:
         """Helper method to log task failure."""
         return TaskLoggingService.log_task_failure(task_id, error_message)
 
+    @staticmethod
+    def log_task_skipped(task_name: str, task_id: str, reason: str):
+        """Helper method to log a skipped run."""
+        return TaskLoggingService.log_task_skipped(task_name, task_id, reason)
+
     @staticmethod
     def log_task_retry(task_id: str, error_message: str):
         """Helper method to log task retry."""
         return TaskLoggingService.log_task_retry(task_id, error_message)
+
+    @staticmethod
+    def update_task_state(task, task_id: str, meta: dict, state: str = "PROGRESS"):
+        """Helper method to store a task's Celery state and metadata."""
+        # Eager runs (tests, local calls) keep no results in the backend
+        if not task.request.is_eager:
+            task.update_state(task_id=task_id, state=state, meta=meta)
+
+    @staticmethod
+    def mark_task_failed(task, task_id: str, exc: Exception):
+        """Helper method to store a task's Celery FAILURE state.
+
+        The result backend expects an exception as the meta of a FAILURE,
+        so results read back with ``AsyncResult`` re-raise it.
+        """
+        if not task.request.is_eager:
+            task.backend.mark_as_failure(task_id, exc)
+
+    @staticmethod
+    def leased(timeout: int):
+        """Decorator for periodic tasks: run only while holding a lease.
+
+        A run that starts while an earlier run (from a slow tick or a
+        second beat instance) still holds the lease is skipped and logged
+        as SKIPPED. ``timeout`` should exceed the task's longest run; the
+        lease expires after it in case a worker dies mid-run. Apply it
+        below ``@shared_task`` so the task keeps its name.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                lease = LeaseService()
+                name = func.__name__
+                owner = self.request.id or uuid.uuid4().hex
+
+                with lease.hold(name, owner=owner, timeout=timeout) as acquired:
+                    if acquired:
+                        return func(self, *args, **kwargs)
+
+                    reason = f"Run {lease.holder(name)} still holds the {name} lease"
+                    logger.info(f"Skipping {name}: {reason}")
+                    BaseTask.log_task_skipped(name, owner, reason)
+                    return {"skipped": True, "reason": reason}
+
+            return wrapper
+
+        return decorator
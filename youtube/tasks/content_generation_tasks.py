@@ -4,9 +4,14 @@ Content generation tasks for videos and comments.
 
 import random
 import logging
-from celery import shared_task
+from typing import Any, Dict, List, Optional
 
-from ..services import ContentPopulationService
+from celery import chord, shared_task
+from celery.exceptions import Ignore
+from django.conf import settings
+from django.core.cache import cache
+
+from ..services import CommentRequestService, ContentPopulationService
 from .base_task import BaseTask
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,7 @@ class ContentGenerationTasks(BaseTask):
 
     @staticmethod
     @shared_task(bind=True, max_retries=3, default_retry_delay=60)
+    @BaseTask.leased(timeout=60 * 60)
     def generate_video_content(self):
         """
         Generate a new video with realistic YouTube content.
@@ -33,8 +39,8 @@ class ContentGenerationTasks(BaseTask):
             )
 
             # Schedule comment generation for this video
-            ContentGenerationTasks.generate_comments_for_video.delay(
-                video_data["video_id"], comment_count=random.randint(3, 8)
+            ContentGenerationTasks.request_comments(
+                video_data["video_id"], random.randint(3, 8)
             )
 
             result = {
@@ -99,46 +105,204 @@ class ContentGenerationTasks(BaseTask):
             ContentGenerationTasks.log_task_retry(self.request.id, error_msg)
             raise self.retry(exc=exc)
 
+    @staticmethod
+    def request_comments(video_id: int, comment_count: int) -> None:
+        """
+        Ask for ``comment_count`` comments on a video. Requests for the same
+        video within COMMENT_COALESCE_SECONDS are summed into a single
+        ``generate_comments_for_video`` task (one LLM call).
+        """
+        if not settings.COMMENT_COALESCE_SECONDS:
+            ContentGenerationTasks.generate_comments_for_video.delay(
+                video_id, comment_count=comment_count
+            )
+            return
+
+        if CommentRequestService().request(
+            video_id=video_id, comment_count=comment_count
+        ):
+            ContentGenerationTasks.flush_comment_requests.apply_async(
+                (video_id,), countdown=settings.COMMENT_COALESCE_SECONDS
+            )
+
+    @staticmethod
+    @shared_task(bind=True)
+    def flush_comment_requests(self, video_id: int):
+        """
+        Turn every comment request for a video collected during the
+        coalescing window into one ``generate_comments_for_video`` task.
+        """
+        comment_count = CommentRequestService().claim(video_id=video_id)
+        if comment_count:
+            logger.info(
+                f"Coalesced {comment_count} requested comments for video {video_id}"
+            )
+            ContentGenerationTasks.generate_comments_for_video.delay(
+                video_id, comment_count=comment_count
+            )
+        return {"video_id": video_id, "comment_count": comment_count}
+
     @staticmethod
     @shared_task(bind=True)
-    def populate_initial_content(self):
+    def populate_initial_content(
+        self, target: Optional[int] = None, batch_size: Optional[int] = None
+    ):
         """
         Populate the platform with initial content on startup.
-        This creates some videos and comments to make the platform feel active.
+
+        Fans out into a chord of ``populate_videos`` subtasks, one per batch
+        of ``batch_size`` videos, so every worker generates content at once.
+        ``finish_initial_population`` then aggregates the batches into this
+        task's TaskLog entry. Until it does, this task's state is PROGRESS
+        with ``{"target": ..., "completed": ...}``.
+
+        Args:
+            target: Number of videos to create (default: 5-10)
+            batch_size: Videos per subtask (default: POPULATE_BATCH_SIZE)
         """
+        target = target or random.randint(5, 10)
+        batch_size = batch_size or settings.POPULATE_BATCH_SIZE
         ContentGenerationTasks.log_task_start(
-            "populate_initial_content", self.request.id
+            "populate_initial_content",
+            self.request.id,
+            kwargs={"target": target, "batch_size": batch_size},
         )
 
         try:
-            content_service = ContentPopulationService()
-
-            # Generate initial videos
-            video_count = random.randint(5, 10)
-            videos_created = []
-
-            for _ in range(video_count):
-                video_data = content_service.generate_video()
-                videos_created.append(video_data)
+            batches = [
+                min(batch_size, target - offset)
+                for offset in range(0, target, batch_size)
+            ]
+            workflow = chord(
+                [
+                    ContentGenerationTasks.populate_videos.s(
+                        count, self.request.id, target
+                    )
+                    for count in batches
+                ],
+                ContentGenerationTasks.finish_initial_population.s(
+                    self.request.id, target
+                ),
+            )
 
-                # Generate comments for each video
-                comment_count = random.randint(2, 5)
-                content_service.generate_comments_for_video(
-                    video_data["video_id"], comment_count
-                )
+            cache.set(
+                ContentGenerationTasks.progress_key(self.request.id),
+                0,
+                settings.POPULATE_PROGRESS_TIMEOUT,
+            )
+            ContentGenerationTasks.update_task_state(
+                self, self.request.id, {"target": target, "completed": 0}
+            )
 
-            result = {
-                "videos_created": len(videos_created),
-                "video_ids": [v["video_id"] for v in videos_created],
-                "message": f"Successfully populated {len(videos_created)} videos with comments",
-            }
-
-            logger.info(f"Initial population complete: {result['message']}")
-            ContentGenerationTasks.log_task_success(self.request.id, result)
-            return result
+            if self.request.is_eager:
+                # No workers to fan out to: run the batches in-process
+                return workflow.apply().get()
+            workflow.apply_async()
 
         except Exception as exc:
             error_msg = str(exc)
             logger.error(f"Error during initial population: {error_msg}")
             ContentGenerationTasks.log_task_failure(self.request.id, error_msg)
             return {"error": error_msg}
+
+        logger.info(
+            f"Initial population of {target} videos split into {len(batches)} subtasks"
+        )
+        # Keep the PROGRESS state; the chord callback records the result
+        raise Ignore()
+
+    @staticmethod
+    @shared_task(bind=True)
+    def populate_videos(self, count: int, parent_id: str, target: int):
+        """
+        Generate ``count`` videos with comments as one batch of
+        ``populate_initial_content``. Never raises, so one failing batch
+        does not stop the chord callback.
+        """
+        video_ids: List[int] = []
+        comments_generated = 0
+        errors: List[str] = []
+
+        try:
+            content_service = ContentPopulationService()
+            # One transaction and one block of reserved ids for the batch
+            video_ids = [
+                video_data["video_id"]
+                for video_data in content_service.generate_videos(count)
+            ]
+        except Exception as exc:
+            logger.error(f"Error generating initial videos: {exc}")
+            errors.append(str(exc))
+
+        for video_id in video_ids:
+            try:
+                comments = content_service.generate_comments_for_video(
+                    video_id, random.randint(2, 5)
+                )
+                comments_generated += comments.get("comments_generated", 0)
+            except Exception as exc:
+                logger.error(f"Error generating initial comments: {exc}")
+                errors.append(str(exc))
+
+        completed = ContentGenerationTasks.add_progress(parent_id, len(video_ids))
+        ContentGenerationTasks.update_task_state(
+            self, parent_id, {"target": target, "completed": completed}
+        )
+
+        return {
+            "video_ids": video_ids,
+            "comments_generated": comments_generated,
+            "errors": errors,
+        }
+
+    @staticmethod
+    @shared_task(bind=True)
+    def finish_initial_population(
+        self, results: List[Dict[str, Any]], parent_id: str, target: int
+    ):
+        """
+        Chord callback of ``populate_initial_content``: record the combined
+        batch results on the parent's TaskLog and Celery state.
+        """
+        video_ids = [video_id for batch in results for video_id in batch["video_ids"]]
+        errors = [error for batch in results for error in batch["errors"]]
+
+        result = {
+            "target": target,
+            "videos_created": len(video_ids),
+            "comments_generated": sum(batch["comments_generated"] for batch in results),
+            "batches": len(results),
+            "video_ids": video_ids,
+            "errors": errors[:10],
+            "message": f"Successfully populated {len(video_ids)} videos with comments",
+        }
+        cache.delete(ContentGenerationTasks.progress_key(parent_id))
+
+        if video_ids or not errors:
+            logger.info(f"Initial population complete: {result['message']}")
+            ContentGenerationTasks.log_task_success(parent_id, result)
+            ContentGenerationTasks.update_task_state(
+                self, parent_id, result, state="SUCCESS"
+            )
+        else:
+            logger.error(f"Initial population failed: {errors[0]}")
+            ContentGenerationTasks.log_task_failure(parent_id, errors[0])
+            ContentGenerationTasks.mark_task_failed(
+                self, parent_id, RuntimeError(errors[0])
+            )
+        return result
+
+    @staticmethod
+    def progress_key(task_id: str) -> str:
+        return f"populate-progress:{task_id}"
+
+    @staticmethod
+    def add_progress(task_id: str, count: int) -> int:
+        """Add ``count`` created videos to the shared progress counter."""
+        key = ContentGenerationTasks.progress_key(task_id)
+        try:
+            return cache.incr(key, count)
+        except ValueError:
+            # Expired or evicted
+            cache.set(key, count, settings.POPULATE_PROGRESS_TIMEOUT)
+            return count
@@ -7,7 +7,7 @@ import logging
 from celery import shared_task
 from django.utils import timezone
 
-from ..services import ContentPopulationService
+from ..services import ContentPopulationService, EngagementService, StatisticsService
 from .base_task import BaseTask
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ class EngagementTasks(BaseTask):
 
     @staticmethod
     @shared_task(bind=True, max_retries=2, default_retry_delay=120)
+    @BaseTask.leased(timeout=15 * 60)
     def simulate_user_engagement(self):
         """
         Simulate user engagement by randomly adding views, likes, and comments to existing videos.
@@ -39,9 +40,7 @@ class EngagementTasks(BaseTask):
 
             for video_info in result["engagement_details"]:
                 if random.random() < 0.2:
-                    ContentGenerationTasks.generate_comments_for_video.delay(
-                        video_info["video_id"], comment_count=1
-                    )
+                    ContentGenerationTasks.request_comments(video_info["video_id"], 1)
                     video_info["activities"].append("scheduled +1 comment")
 
             logger.info(f"Simulated engagement for {result['videos_engaged']} videos")
@@ -62,6 +61,7 @@ class EngagementTasks(BaseTask):
 
     @staticmethod
     @shared_task(bind=True)
+    @BaseTask.leased(timeout=3 * 60 * 60)
     def generate_engagement_stats(self):
         """
         Generate and log engagement statistics for monitoring.
@@ -70,8 +70,8 @@ class EngagementTasks(BaseTask):
         EngagementTasks.log_task_start("generate_engagement_stats", self.request.id)
 
         try:
-            content_service = ContentPopulationService()
-            stats = content_service.get_engagement_statistics()
+            # Reads the running aggregates only; needs no LLM client or key
+            stats = StatisticsService().get_statistics()
 
             stats["timestamp"] = timezone.now().isoformat()
 
@@ -90,3 +90,30 @@ class EngagementTasks(BaseTask):
             logger.error(f"Error generating engagement stats: {error_msg}")
             EngagementTasks.log_task_failure(self.request.id, error_msg)
             return {"error": error_msg}
+
+    @staticmethod
+    @shared_task(bind=True)
+    @BaseTask.leased(timeout=3 * 60 * 60)
+    def compact_engagement_buckets(self):
+        """
+        Roll old minute buckets into hour buckets and old hour buckets into
+        day buckets so engagement history stays small.
+        """
+        EngagementTasks.log_task_start("compact_engagement_buckets", self.request.id)
+
+        try:
+            result = EngagementService().compact()
+
+            logger.info(
+                f"Compacted {result['minute_buckets_compacted']} minute and "
+                f"{result['hour_buckets_compacted']} hour engagement buckets"
+            )
+
+            EngagementTasks.log_task_success(self.request.id, result)
+            return result
+
+        except Exception as exc:
+            error_msg = str(exc)
+            logger.error(f"Error compacting engagement buckets: {error_msg}")
+            EngagementTasks.log_task_failure(self.request.id, error_msg)
+            return {"error": error_msg}
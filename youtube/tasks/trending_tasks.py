@@ -0,0 +1,42 @@
+"""
+Trending score maintenance tasks.
+"""
+
+import logging
+from celery import shared_task
+
+from ..services import TrendingService
+from .base_task import BaseTask
+
+logger = logging.getLogger(__name__)
+
+
+class TrendingTasks(BaseTask):
+    """Tasks related to trending rankings."""
+
+    @staticmethod
+    @shared_task(bind=True)
+    @BaseTask.leased(timeout=15 * 60)
+    def update_trending_scores(self):
+        """
+        Fold engagement since the previous run into the trending score table.
+        Only videos with new views, likes or comments are rewritten.
+        """
+        TrendingTasks.log_task_start("update_trending_scores", self.request.id)
+
+        try:
+            result = TrendingService().update_scores()
+
+            logger.info(
+                f"Updated {result['scores_updated']} trending scores "
+                f"across {result['videos_scanned']} videos"
+            )
+
+            TrendingTasks.log_task_success(self.request.id, result)
+            return result
+
+        except Exception as exc:
+            error_msg = str(exc)
+            logger.error(f"Error updating trending scores: {error_msg}")
+            TrendingTasks.log_task_failure(self.request.id, error_msg)
+            return {"error": error_msg}
@@ -0,0 +1,119 @@
+"""
+Integration tests for the async (ASGI) read and counter endpoints.
+
+These check that the async views return the same payloads as their sync
+counterparts and use atomic counter updates.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Comment, Video
+from ..services import StatisticsService
+
+
+class AsyncVideoAPITest(TestCase):
+    """Test suite for async video and comment endpoints."""
+
+    def setUp(self):
+        cache.clear()
+        self.video = Video.objects.create(
+            title="Async Video",
+            description="Served under ASGI",
+            url="https://youtube.com/watch?v=async1",
+            view_count=100,
+            like_count=10,
+        )
+        self.comment = Comment.objects.create(
+            video=self.video, author="Author", content="Nice", like_count=2
+        )
+
+    def test_async_list_matches_sync_list(self):
+        """Test async list returns the same payload as the sync list."""
+        Video.objects.create(title="Second", url="https://youtube.com/watch?v=async2")
+
+        sync_response = self.client.get(reverse("video-list"), {"page_size": 1})
+        async_response = self.client.get(reverse("async-video-list"), {"page_size": 1})
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        async_data = async_response.json()
+        sync_data = sync_response.json()
+        self.assertEqual(async_data["count"], sync_data["count"])
+        self.assertEqual(set(async_data["results"][0]), set(sync_data["results"][0]))
+        self.assertIn("page=2", async_data["next"])
+        self.assertIsNone(async_data["previous"])
+
+    def test_async_list_invalid_page_returns_404(self):
+        """Test out-of-range page returns 404 like the sync paginator."""
+        response = self.client.get(reverse("async-video-list"), {"page": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_async_detail_matches_sync_detail(self):
+        """Test async detail returns the same payload including comments."""
+        sync_response = self.client.get(reverse("video-detail", args=[self.video.id]))
+        async_response = self.client.get(
+            reverse("async-video-detail", args=[self.video.id])
+        )
+
+        self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_async_detail_not_found_uses_project_error_format(self):
+        """Test missing video returns 400 with detail wrapper."""
+        response = self.client.get(reverse("async-video-detail", args=[999]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("detail", response.json())
+
+    def test_async_increment_views(self):
+        """Test async increment_views updates the count atomically."""
+        url = reverse("async-video-increment-views", args=[self.video.id])
+
+        self.client.post(url)
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"view_count": 102})
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.view_count, 102)
+
+    def test_async_like_video_and_comment(self):
+        """Test async like endpoints return updated counts."""
+        video_response = self.client.post(
+            reverse("async-video-like", args=[self.video.id])
+        )
+        comment_response = self.client.post(
+            reverse("async-comment-like", args=[self.comment.id])
+        )
+
+        self.assertEqual(video_response.json(), {"like_count": 11})
+        self.assertEqual(comment_response.json(), {"like_count": 3})
+
+    def test_async_like_nonexistent_comment(self):
+        """Test liking a missing comment returns 400."""
+        response = self.client.post(reverse("async-comment-like", args=[999]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_async_counters_roll_back_when_statistics_fail(self):
+        """Test a failed statistics update also undoes the row increment."""
+        with patch.object(
+            StatisticsService, "add_counters", side_effect=DatabaseError("down")
+        ):
+            with self.assertRaises(DatabaseError):
+                self.client.post(
+                    reverse("async-video-increment-views", args=[self.video.id])
+                )
+            with self.assertRaises(DatabaseError):
+                self.client.post(reverse("async-comment-like", args=[self.comment.id]))
+
+        self.video.refresh_from_db()
+        self.comment.refresh_from_db()
+        self.assertEqual(self.video.view_count, 100)
+        self.assertEqual(self.comment.like_count, 2)
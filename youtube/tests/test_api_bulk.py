@@ -0,0 +1,157 @@
+"""
+Integration tests for the bulk create endpoints.
+
+These cover JSON array and NDJSON bodies, per-item error reporting, upserts
+by url and all-or-nothing writes.
+"""
+
+import json
+
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Comment, Video
+
+
+def video_item(index, **overrides):
+    item = {
+        "title": f"Bulk Video {index}",
+        "description": "Created in bulk",
+        "url": f"https://youtube.com/watch?v=bulk{index}",
+        "duration": 60,
+    }
+    item.update(overrides)
+    return item
+
+
+class VideoBulkCreateAPITest(TestCase):
+    """Test suite for the video bulk create endpoint."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("video-bulk-create")
+
+    def test_bulk_create_json_array(self):
+        """Test creating many videos from a JSON array in few queries."""
+        items = [video_item(i) for i in range(50)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["created_ids"]), 50)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(Video.objects.count(), 50)
+        self.assertLess(len(ctx.captured_queries), 15)
+
+    def test_bulk_create_ndjson(self):
+        """Test creating videos from a newline-delimited JSON body."""
+        body = "\n".join(json.dumps(video_item(i)) for i in range(3)) + "\n\n"
+
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Video.objects.count(), 3)
+
+    def test_bulk_create_ndjson_parse_error(self):
+        """Test malformed NDJSON reports the offending line."""
+        body = json.dumps(video_item(0)) + "\n{not json}\n"
+
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("line 2", str(response.data))
+
+    def test_bulk_create_partial_success(self):
+        """Test invalid items are reported by index while others are written."""
+        Video.objects.create(title="Existing", url="https://youtube.com/watch?v=bulk2")
+        items = [
+            video_item(0),
+            video_item(1, url="not-a-url"),
+            video_item(2),
+            video_item(3),
+            video_item(4, url="https://youtube.com/watch?v=bulk3"),
+        ]
+
+        response = self.client.post(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(len(response.data["created_ids"]), 2)
+        self.assertEqual([e["index"] for e in response.data["errors"]], [1, 2, 4])
+        self.assertEqual(Video.objects.count(), 3)
+
+    def test_bulk_create_atomic_writes_nothing_on_error(self):
+        """Test atomic mode rejects the whole batch if any item fails."""
+        items = [video_item(0), video_item(1, title="")]
+
+        response = self.client.post(f"{self.url}?atomic=true", items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["errors"][0]["index"], 1)
+        self.assertEqual(Video.objects.count(), 0)
+
+    def test_bulk_upsert_updates_existing_urls(self):
+        """Test upsert updates videos matched by url and creates the rest."""
+        existing = Video.objects.create(
+            title="Old Title", url="https://youtube.com/watch?v=bulk0", view_count=7
+        )
+        items = [video_item(0, title="New Title"), video_item(1)]
+
+        response = self.client.post(f"{self.url}?upsert=true", items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["updated_ids"], [existing.id])
+        self.assertEqual(len(response.data["created_ids"]), 1)
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "New Title")
+        self.assertEqual(existing.view_count, 7)
+
+    @override_settings(BULK_MAX_ITEMS=2)
+    def test_bulk_create_rejects_oversized_request(self):
+        """Test requests above BULK_MAX_ITEMS are rejected."""
+        items = [video_item(i) for i in range(3)]
+
+        response = self.client.post(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Video.objects.count(), 0)
+
+    def test_bulk_create_rejects_non_list_body(self):
+        """Test a single object body is rejected."""
+        response = self.client.post(self.url, video_item(0), format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class CommentBulkCreateAPITest(TestCase):
+    """Test suite for the comment bulk create endpoint."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("comment-bulk-create")
+        self.video = Video.objects.create(
+            title="Video", url="https://youtube.com/watch?v=comments"
+        )
+
+    def test_bulk_create_comments(self):
+        """Test creating comments in bulk with a missing video reported."""
+        items = [
+            {"video": self.video.id, "author": "A", "content": "First"},
+            {"video": 999, "author": "B", "content": "Lost"},
+            {"video": self.video.id, "author": "C"},
+            {"video": self.video.id, "author": "D", "content": "Second"},
+        ]
+
+        response = self.client.post(self.url, items, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(len(response.data["created_ids"]), 2)
+        self.assertEqual([e["index"] for e in response.data["errors"]], [1, 2])
+        self.assertEqual(
+            response.data["errors"][0]["errors"], {"video": ["Video not found."]}
+        )
+        self.assertEqual(Comment.objects.filter(video=self.video).count(), 2)
@@ -0,0 +1,113 @@
+"""
+Integration tests for the streaming export endpoints and command.
+"""
+
+import csv
+import gzip
+import io
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ..models import Comment, Video
+
+
+class ExportAPITest(TestCase):
+    """Test suite for the video and comment export endpoints."""
+
+    def setUp(self):
+        self.videos = [
+            Video.objects.create(
+                title=f"Export {i}", url=f"https://youtube.com/watch?v=export{i}"
+            )
+            for i in range(3)
+        ]
+        Comment.objects.create(video=self.videos[0], author="A", content="Hi, there")
+
+    def read(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_export_videos_ndjson(self):
+        """Test videos stream as NDJSON ordered by updated_at then id."""
+        response = self.client.get(reverse("video-export"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [v.id for v in self.videos])
+        self.assertIn("view_count", rows[0])
+
+    def test_export_comments_csv(self):
+        """Test comments stream as CSV with a header row."""
+        response = self.client.get(reverse("comment-export"), {"format": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        rows = list(csv.DictReader(io.StringIO(self.read(response).decode())))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["content"], "Hi, there")
+        self.assertEqual(int(rows[0]["video_id"]), self.videos[0].id)
+
+    def test_export_since_filters_by_updated_at(self):
+        """Test since only returns rows updated at or after the timestamp."""
+        cutoff = timezone.now() + timedelta(minutes=1)
+        Video.objects.filter(pk=self.videos[1].pk).update(
+            updated_at=cutoff + timedelta(seconds=5)
+        )
+
+        response = self.client.get(
+            reverse("video-export"), {"since": cutoff.isoformat()}
+        )
+
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.videos[1].id])
+
+    def test_export_invalid_since(self):
+        """Test an unparseable since returns 400."""
+        response = self.client.get(reverse("video-export"), {"since": "yesterday"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_gzip_when_accepted(self):
+        """Test the body is gzipped on the fly when the client accepts it."""
+        response = self.client.get(
+            reverse("video-export"), HTTP_ACCEPT_ENCODING="gzip, deflate"
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        lines = gzip.decompress(self.read(response)).splitlines()
+        self.assertEqual(len(lines), 3)
+
+
+class ExportContentCommandTest(TestCase):
+    def test_command_writes_gzipped_csv(self):
+        """Test export_content writes a gzipped CSV file."""
+        Video.objects.create(title="Cmd", url="https://youtube.com/watch?v=cmd")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "videos.csv.gz"
+            call_command(
+                "export_content",
+                "videos",
+                export_format="csv",
+                gzip=True,
+                chunk_size=1,
+                output=str(output),
+                stderr=StringIO(),
+            )
+            rows = list(
+                csv.DictReader(
+                    io.StringIO(gzip.decompress(output.read_bytes()).decode())
+                )
+            )
+
+        self.assertEqual([row["title"] for row in rows], ["Cmd"])
@@ -30,3 +30,15 @@ class APIErrorHandlingTest(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("detail", response.data)
+
+
+class HealthAPITest(APITestCase):
+    """Test suite for the health endpoint."""
+
+    def test_health_does_no_database_work(self):
+        """Test /healthz/ answers without touching the database."""
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("healthz"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"status": "ok"})
@@ -0,0 +1,393 @@
+"""
+Tests for the benchmark harness and synthetic data generation.
+"""
+
+import json
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.core.management import CommandError, call_command
+from django.db import connections
+from django.test import TestCase
+
+from youtube.benchmarks.compression_bench import (
+    run_compression_benchmarks,
+    synthetic_list_page,
+)
+from youtube.benchmarks.engagement_sim import (
+    DatabaseSink,
+    EngagementSimulator,
+    HttpSink,
+    zipf_norm,
+)
+from youtube.benchmarks.http_load import DjangoClientTransport
+from youtube.benchmarks.connection_bench import (
+    connection_scenarios,
+    measure_requests,
+)
+from youtube.benchmarks.service_bench import (
+    render_scaling_curves,
+    run_service_benchmarks,
+)
+from youtube.benchmarks.startup_bench import (
+    parse_importtime,
+    run_startup_benchmarks,
+)
+from youtube.benchmarks.stats import compare_results, percentile, summarize
+from youtube.benchmarks.stubs import StubOpenAIClient
+from youtube.models import Comment, EngagementBucket, Video
+from youtube.services import (
+    ContentPopulationService,
+    StatisticsService,
+    SyntheticDataService,
+)
+
+
+class BenchmarkStatsTest(TestCase):
+    def test_percentile_interpolates_between_ranks(self):
+        """Test percentile uses linear interpolation."""
+        values = [1.0, 2.0, 3.0, 4.0]
+
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4.0)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_summarize_counts_errors_in_throughput(self):
+        """Test summary includes errors in request totals."""
+        summary = summarize([0.01, 0.02], errors=2, elapsed=2.0, total_bytes=100)
+
+        self.assertEqual(summary["requests"], 4)
+        self.assertEqual(summary["requests_per_second"], 2.0)
+        self.assertEqual(summary["bytes_per_second"], 50.0)
+        self.assertEqual(summary["p50_ms"], 15.0)
+
+    def test_compare_results_reports_percent_change(self):
+        """Test comparison against a baseline file."""
+        current = {"scenarios": {"list": {"p95_ms": 12.0}}}
+        baseline = {"scenarios": {"list": {"p95_ms": 10.0}}}
+
+        rows = compare_results(current, baseline, ["p95_ms"])
+
+        self.assertEqual(rows[0]["change_percent"], 20.0)
+
+
+class SyntheticDataServiceTest(TestCase):
+    def test_seed_creates_requested_rows(self):
+        """Test seeding inserts the requested number of videos and comments."""
+        result = SyntheticDataService(seed=1).seed(
+            video_count=25, comment_count=120, batch_size=50
+        )
+
+        self.assertEqual(result["videos_created"], 25)
+        self.assertEqual(result["comments_created"], 120)
+        self.assertEqual(Video.objects.count(), 25)
+        self.assertEqual(Comment.objects.count(), 120)
+
+    def test_seed_urls_do_not_collide_across_runs(self):
+        """Test repeated seeding never reuses a URL."""
+        service = SyntheticDataService(seed=1)
+        service.seed(video_count=10, comment_count=0)
+        service.seed(video_count=10, comment_count=0)
+
+        self.assertEqual(Video.objects.values("url").distinct().count(), 20)
+
+
+class BenchmarkApiCommandTest(TestCase):
+    def test_command_writes_results_for_each_scenario(self):
+        """Test benchmark_api runs all scenarios and stores JSON results."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+
+            call_command(
+                "benchmark_api",
+                videos=5,
+                comments=20,
+                requests=6,
+                concurrency=1,
+                output=str(output),
+                stdout=StringIO(),
+            )
+
+            results = json.loads(output.read_text())
+
+        self.assertEqual(
+            set(results["scenarios"]),
+            {"list", "detail", "create", "increment_views", "like"},
+        )
+        for row in results["scenarios"].values():
+            self.assertEqual(row["errors"], 0)
+            self.assertEqual(row["requests"], 6)
+
+
+class ServiceBenchmarkTest(TestCase):
+    def test_stub_client_generates_comments_offline(self):
+        """Test ContentPopulationService works with the stubbed OpenAI client."""
+        video = Video.objects.create(
+            title="Stubbed", url="https://youtube.com/watch?v=stub"
+        )
+        stub = StubOpenAIClient()
+        service = ContentPopulationService(openai_client=stub)
+
+        result = service.generate_comments_for_video(video.id, 3)
+
+        self.assertEqual(result["comments_generated"], 3)
+        self.assertEqual(stub.calls, 1)
+        self.assertEqual(video.comments.count(), 3)
+
+    def test_benchmarks_record_time_and_queries_and_roll_back(self):
+        """Test each case is measured per size and seeded rows are discarded."""
+        results = run_service_benchmarks([20, 50], comments_per_video=5, repeat=1)
+
+        self.assertIn("VideoService.get_all (page)@50", results)
+        self.assertEqual(results["VideoService.get_all (page)@50"]["queries"], 2)
+        self.assertEqual(results["get_engagement_statistics@20"]["videos"], 4)
+        self.assertIn("growth", render_scaling_curves(results))
+        self.assertEqual(Video.objects.count(), 0)
+
+
+class ConnectionBenchmarkTest(TestCase):
+    def test_reuse_connects_once_and_per_request_connects_every_time(self):
+        """Test connection scenarios count the connections they open."""
+        # In-memory SQLite connections are never closed, so use a file
+        with tempfile.TemporaryDirectory() as tmp:
+            base = {**connections.settings["default"], "NAME": f"{tmp}/bench.db"}
+            results = {
+                name: measure_requests(
+                    {**base, **overrides}, alias="default", requests=5
+                )
+                for name, overrides in connection_scenarios().items()
+            }
+
+        self.assertEqual(results["new connection per request"]["connects"], 5)
+        self.assertEqual(results["persistent connection"]["connects"], 1)
+        self.assertEqual(
+            results["persistent connection + health checks"]["connects"], 1
+        )
+
+    def test_command_writes_results(self):
+        """Test benchmark_connections stores JSON results."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+
+            call_command(
+                "benchmark_connections",
+                requests=3,
+                output=str(output),
+                stdout=StringIO(),
+            )
+
+            results = json.loads(output.read_text())
+
+        self.assertEqual(results["meta"]["benchmark"], "connections")
+        self.assertEqual(results["scenarios"]["persistent connection"]["requests"], 3)
+
+
+class CompressionBenchmarkTest(TestCase):
+    def test_levels_trade_size_for_time(self):
+        """Test each encoding/level reports its size, ratio and timings."""
+        payload = synthetic_list_page(50)
+
+        results = run_compression_benchmarks(
+            payload, encodings=["gzip"], levels=[1, 9, 42], iterations=2
+        )
+
+        self.assertEqual(list(results), ["identity", "gzip-1", "gzip-9"])
+        self.assertEqual(results["identity"]["bytes"], len(payload))
+        self.assertLess(results["gzip-9"]["bytes"], len(payload))
+        self.assertLessEqual(results["gzip-9"]["bytes"], results["gzip-1"]["bytes"])
+        self.assertGreater(results["gzip-1"]["ratio"], 1)
+
+    def test_command_writes_results(self):
+        """Test benchmark_compression stores JSON results."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+
+            call_command(
+                "benchmark_compression",
+                rows=10,
+                encoding=["gzip"],
+                level=[6],
+                iterations=1,
+                output=str(output),
+                stdout=StringIO(),
+            )
+
+            results = json.loads(output.read_text())
+
+        self.assertEqual(results["meta"]["benchmark"], "compression")
+        self.assertEqual(set(results["scenarios"]), {"identity", "gzip-6"})
+
+
+class SeedCommandTest(TestCase):
+    def test_seeds_exact_counts_in_batches(self):
+        """Test seed inserts the requested rows and keeps statistics in sync."""
+        stdout = StringIO()
+
+        call_command(
+            "seed",
+            videos=25,
+            comments=101,
+            batch_size=10,
+            workers=1,
+            prefix="seed-test",
+            stdout=stdout,
+        )
+
+        self.assertEqual(Video.objects.count(), 25)
+        self.assertEqual(Comment.objects.count(), 101)
+        self.assertIn("rows/sec", stdout.getvalue())
+        stats = StatisticsService().get_statistics()
+        self.assertEqual(stats["video_stats"]["total_videos"], 25)
+        self.assertEqual(stats["comment_stats"]["total_comments"], 101)
+
+    def test_ranges_never_collide_and_prefix_is_single_use(self):
+        """Test worker ranges of one prefix are disjoint and reruns are refused."""
+        service = SyntheticDataService(seed=1)
+        service.seed_range(prefix="p", start=0, video_count=5, comment_count=0)
+        service.seed_range(prefix="p", start=5, video_count=5, comment_count=0)
+
+        self.assertEqual(Video.objects.values("url").distinct().count(), 10)
+        with self.assertRaises(CommandError):
+            call_command("seed", videos=1, prefix="p", stdout=StringIO())
+
+
+class EngagementSimulationTest(TestCase):
+    def setUp(self):
+        SyntheticDataService(seed=1).seed(video_count=30, comment_count=0)
+        self.noon = datetime(2025, 8, 14, 12, 0, tzinfo=dt_timezone.utc)
+
+    def totals(self):
+        views = likes = 0
+        for video in Video.objects.all():
+            views += video.view_count
+            likes += video.like_count
+        return views, likes
+
+    def test_zipf_norm_tail_approximation(self):
+        """Test the approximated normalisation stays close to the exact sum."""
+        exact = sum(r**-1.1 for r in range(1, 50001))
+
+        self.assertAlmostEqual(zipf_norm(50000, 1.1), exact, places=6)
+        self.assertAlmostEqual(zipf_norm(10, 1.0), sum(1 / r for r in range(1, 11)))
+
+    def test_diurnal_rate_peaks_at_peak_hour(self):
+        """Test the rate multiplier swings by the amplitude around 1."""
+        simulator = EngagementSimulator(DatabaseSink(), amplitude=0.5, peak_hour=12)
+
+        with self.settings(TIME_ZONE="UTC"):
+            peak = simulator.diurnal_factor(self.noon)
+            trough = simulator.diurnal_factor(self.noon.replace(hour=0))
+
+        self.assertAlmostEqual(peak, 1.5)
+        self.assertAlmostEqual(trough, 0.5)
+
+    def test_database_target_applies_every_event_in_chunks(self):
+        """Test sampled events land on videos, buckets and statistics."""
+        before = self.totals()
+        simulator = EngagementSimulator(
+            DatabaseSink(), rate=20, amplitude=0, chunk_size=7, seed=3
+        )
+
+        summary = simulator.run(ticks=2, tick_seconds=60, start=self.noon)
+
+        views, likes = self.totals()
+        bucket_events = sum(
+            bucket.views + bucket.likes for bucket in EngagementBucket.objects.all()
+        )
+        self.assertGreater(summary["events"], 0)
+        self.assertEqual(views + likes - sum(before), summary["events"])
+        self.assertEqual(bucket_events, summary["events"])
+        self.assertEqual([row["chunks"] for row in summary["ticks"]], [5, 5])
+        stats = StatisticsService().get_statistics()["video_stats"]
+        self.assertEqual(
+            stats["max_views"], max(Video.objects.values_list("view_count", flat=True))
+        )
+
+    def test_popularity_is_skewed_and_stable(self):
+        """Test the top-ranked video gets far more than the median one."""
+        before = dict(Video.objects.values_list("id", "view_count"))
+        simulator = EngagementSimulator(
+            DatabaseSink(), rate=100, amplitude=0, like_rate=0, seed=5, zipf_s=1.5
+        )
+
+        simulator.run(ticks=3, tick_seconds=60, start=self.noon)
+
+        gains = sorted(
+            view_count - before[pk]
+            for pk, view_count in Video.objects.values_list("id", "view_count")
+        )
+        self.assertGreater(gains[-1], 10 * max(gains[len(gains) // 2], 1))
+
+    def test_http_target_replays_events_through_endpoints(self):
+        """Test the HTTP target sends one counter request per event."""
+        before = self.totals()
+        simulator = EngagementSimulator(
+            HttpSink(DjangoClientTransport(), concurrency=1, seed=2),
+            rate=0.5,
+            amplitude=0,
+            like_rate=0.5,
+            seed=2,
+        )
+
+        summary = simulator.run(ticks=1, tick_seconds=60, start=self.noon)
+
+        views, likes = self.totals()
+        self.assertEqual(summary["errors"], 0)
+        self.assertGreater(summary["events"], 0)
+        self.assertEqual(views + likes - sum(before), summary["events"])
+
+    def test_command_writes_results(self):
+        """Test simulate_engagement stores per-tick JSON results."""
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+
+            call_command(
+                "simulate_engagement",
+                rate=5,
+                ticks=2,
+                seed=1,
+                output=str(output),
+                stdout=StringIO(),
+            )
+
+            results = json.loads(output.read_text())
+
+        self.assertEqual(results["meta"]["benchmark"], "engagement")
+        self.assertEqual(len(results["ticks"]), 2)
+        self.assertIn("events_per_second", results["summary"])
+
+
+class StartupBenchmarkTest(TestCase):
+    # Import time budget for the web process: about 0.7s locally, and 1.7s
+    # while the services package still loaded openai and pydantic. The
+    # default leaves room for slow CI runners; STARTUP_IMPORT_BUDGET_MS
+    # overrides it, e.g. 1200 on a quiet machine.
+    WEB_IMPORT_BUDGET_MS = float(os.environ.get("STARTUP_IMPORT_BUDGET_MS", 3000))
+
+    def test_parse_importtime(self):
+        """Test -X importtime output is parsed into per-module self times."""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:        80 |        200 | json\n"
+        )
+
+        self.assertEqual(parse_importtime(output), {"json.decoder": 120, "json": 80})
+
+    def test_startup_skips_llm_stack(self):
+        """Test web and worker processes start without loading LLM modules."""
+        results = run_startup_benchmarks(["web", "worker"], repeat=1)
+
+        self.assertEqual(results["web"]["llm_modules"], [])
+        self.assertEqual(results["worker"]["llm_modules"], [])
+
+    def test_web_import_time_within_budget(self):
+        """Test the median web import time stays within the budget."""
+        results = run_startup_benchmarks(["web"], repeat=3)
+
+        self.assertLess(results["web"]["import_ms"], self.WEB_IMPORT_BUDGET_MS)
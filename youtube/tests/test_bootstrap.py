@@ -0,0 +1,112 @@
+"""
+Tests for the once-only bootstrap command and startup without database work.
+"""
+
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.apps import apps
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError
+from django.test import TestCase
+
+from youtube.models import BootstrapStep, Video
+from youtube.services import BootstrapService
+
+
+class BootstrapServiceTest(TestCase):
+    def setUp(self):
+        self.service = BootstrapService()
+
+    def test_step_runs_once(self):
+        """Test a step runs on the first call and is skipped afterwards."""
+        step = MagicMock(return_value={"done": True})
+
+        first = self.service.run_once("step", step)
+        second = self.service.run_once("step", step)
+
+        self.assertEqual(first, {"done": True})
+        self.assertIsNone(second)
+        step.assert_called_once()
+        self.assertEqual(BootstrapStep.objects.get(name="step").result, first)
+
+    def test_failed_step_is_retried(self):
+        """Test a step that raises leaves no marker behind."""
+        with self.assertRaises(RuntimeError):
+            self.service.run_once("step", MagicMock(side_effect=RuntimeError))
+
+        self.assertFalse(BootstrapStep.objects.exists())
+        self.assertEqual(self.service.run_once("step", lambda: {"ok": 1}), {"ok": 1})
+
+    def test_database_is_ready_when_migrated(self):
+        """Test readiness reports no reason once migrations are applied."""
+        self.assertIsNone(self.service.readiness())
+
+
+@patch("youtube.management.commands.bootstrap.populate_initial_content")
+class BootstrapCommandTest(TestCase):
+    def test_queues_population_once(self, populate):
+        """Test an empty database is populated by the first bootstrap only."""
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("bootstrap", target=20, stdout=StringIO())
+        stdout = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("bootstrap", stdout=stdout)
+
+        populate.apply_async.assert_called_once()
+        call = populate.apply_async.call_args.kwargs
+        self.assertEqual(call["kwargs"], {"target": 20, "batch_size": None})
+        self.assertIn("initial_content: already done", stdout.getvalue())
+        self.assertEqual(
+            BootstrapStep.objects.get(name="initial_content").result,
+            {"queued": True, "task_id": call["task_id"]},
+        )
+
+    def test_population_is_not_queued_when_the_marker_rolls_back(self, populate):
+        """Test a failed marker write queues nothing, so a retry queues once."""
+        with (
+            patch.object(BootstrapStep, "save", side_effect=DatabaseError("down")),
+            self.captureOnCommitCallbacks(execute=True),
+            self.assertRaises(DatabaseError),
+        ):
+            call_command("bootstrap", stdout=StringIO())
+
+        populate.apply_async.assert_not_called()
+        self.assertFalse(BootstrapStep.objects.exists())
+
+    def test_existing_videos_are_not_repopulated(self, populate):
+        """Test bootstrap records the step without queueing when videos exist."""
+        Video.objects.create(title="Existing", url="https://youtube.com/watch?v=boot")
+
+        call_command("bootstrap", stdout=StringIO())
+
+        populate.apply_async.assert_not_called()
+        self.assertFalse(
+            BootstrapStep.objects.get(name="initial_content").result["queued"]
+        )
+
+    def test_reset_runs_step_again(self, populate):
+        """Test --reset forgets a completed step."""
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("bootstrap", stdout=StringIO())
+            call_command("bootstrap", reset=["initial_content"], stdout=StringIO())
+
+        self.assertEqual(populate.apply_async.call_count, 2)
+        with self.assertRaises(CommandError):
+            call_command("bootstrap", reset=["unknown"], stdout=StringIO())
+
+
+class StartupTest(TestCase):
+    def test_app_ready_does_no_database_work(self):
+        """Test runserver startup no longer queries or schedules anything."""
+        config = apps.get_app_config("youtube")
+
+        with (
+            patch.dict("os.environ", {"RUN_MAIN": "true"}),
+            patch("sys.argv", ["manage.py", "runserver"]),
+            patch("threading.Timer") as timer,
+            self.assertNumQueries(0),
+        ):
+            config.ready()
+
+        timer.assert_not_called()
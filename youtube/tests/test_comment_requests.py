@@ -0,0 +1,98 @@
+"""
+Tests for coalescing comment generation requests per video.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+from youtube.services import CommentRequestService
+from youtube.tasks import ContentGenerationTasks, flush_comment_requests
+
+
+class CommentRequestServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = CommentRequestService()
+
+    def test_only_first_request_in_window_schedules_a_flush(self):
+        """Test later requests only add to the pending count."""
+        scheduled = [
+            self.service.request(video_id=1, comment_count=count) for count in (1, 2, 3)
+        ]
+
+        self.assertEqual(scheduled, [True, False, False])
+        self.assertEqual(self.service.claim(video_id=1), 6)
+        self.assertEqual(self.service.claim(video_id=1), 0)
+
+    def test_requests_are_keyed_by_video(self):
+        """Test videos are coalesced independently."""
+        self.assertTrue(self.service.request(video_id=1, comment_count=1))
+        self.assertTrue(self.service.request(video_id=2, comment_count=4))
+
+        self.assertEqual(self.service.claim(video_id=2), 4)
+        self.assertEqual(self.service.claim(video_id=1), 1)
+
+    def test_request_after_claim_schedules_the_next_flush(self):
+        """Test a request arriving after a claim is not left pending."""
+        self.service.request(video_id=1, comment_count=1)
+        self.service.claim(video_id=1)
+
+        self.assertTrue(self.service.request(video_id=1, comment_count=2))
+        self.assertEqual(self.service.claim(video_id=1), 2)
+
+    def test_request_near_expiry_extends_the_pending_count(self):
+        """Test a request just before the count expires survives to its flush."""
+        timeout = self.service.pending_timeout()
+        with patch("time.time", return_value=1000.0) as now:
+            self.service.request(video_id=1, comment_count=1)
+            now.return_value = 1000.0 + timeout - 1
+            self.service.request(video_id=1, comment_count=2)
+            now.return_value = 1000.0 + timeout + 60
+
+            self.assertEqual(self.service.claim(video_id=1), 3)
+
+    @override_settings(REQUIRE_SHARED_CACHE=True)
+    def test_requests_refuse_a_per_process_cache(self):
+        """Test coalescing refuses a cache other workers cannot see."""
+        with self.assertLogs("youtube.checks", "ERROR"):
+            with self.assertRaises(ImproperlyConfigured):
+                self.service.request(video_id=1, comment_count=1)
+
+
+@override_settings(COMMENT_COALESCE_SECONDS=30)
+@patch.object(ContentGenerationTasks.generate_comments_for_video, "delay")
+@patch.object(ContentGenerationTasks.flush_comment_requests, "apply_async")
+class CoalescedCommentTasksTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_requests_merge_into_one_generation_task(self, apply_async, delay):
+        """Test repeated requests become one task with the summed count."""
+        for _ in range(4):
+            ContentGenerationTasks.request_comments(7, 1)
+        ContentGenerationTasks.request_comments(7, 5)
+
+        apply_async.assert_called_once_with((7,), countdown=30)
+        delay.assert_not_called()
+
+        result = flush_comment_requests.apply(args=(7,)).get()
+
+        self.assertEqual(result["comment_count"], 9)
+        delay.assert_called_once_with(7, comment_count=9)
+
+    def test_empty_flush_does_nothing(self, apply_async, delay):
+        """Test a flush with nothing pending enqueues no generation."""
+        flush_comment_requests.apply(args=(7,))
+
+        delay.assert_not_called()
+
+    @override_settings(COMMENT_COALESCE_SECONDS=0)
+    def test_zero_window_disables_coalescing(self, apply_async, delay):
+        """Test requests go straight to generation without a window."""
+        ContentGenerationTasks.request_comments(7, 2)
+
+        delay.assert_called_once_with(7, comment_count=2)
+        apply_async.assert_not_called()
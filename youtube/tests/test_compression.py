@@ -0,0 +1,152 @@
+"""
+Tests for response compression negotiation and CompressionMiddleware.
+"""
+
+import gzip
+from unittest import skipIf
+
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from youtube import compression
+from youtube.compression import compress_stream, decompress, negotiate
+from youtube.middleware import CompressionMiddleware
+from youtube.models import Video
+
+
+class NegotiationTest(TestCase):
+    def test_picks_highest_quality_then_server_preference(self):
+        """Test q-values win and ties go to the server's preference."""
+        encodings = ["zstd", "br", "gzip"]
+
+        self.assertEqual(negotiate("gzip, br", encodings), "br")
+        self.assertEqual(negotiate("gzip;q=1.0, br;q=0.5", encodings), "gzip")
+        self.assertEqual(negotiate("*", encodings), "zstd")
+        self.assertEqual(negotiate("*;q=0.2, gzip;q=0.1", encodings), "zstd")
+
+    def test_identity_when_nothing_acceptable(self):
+        """Test missing, identity-only and q=0 headers disable compression."""
+        self.assertIsNone(negotiate("", ["gzip"]))
+        self.assertIsNone(negotiate("identity", ["gzip"]))
+        self.assertIsNone(negotiate("gzip;q=0", ["gzip"]))
+        self.assertIsNone(negotiate("br", ["gzip"]))
+
+    def test_stream_flushes_decodable_chunks(self):
+        """Test every streamed chunk is emitted before the stream ends."""
+        chunks = list(compress_stream([b"a" * 100, b"b" * 100], "gzip"))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(decompress(b"".join(chunks), "gzip"), b"a" * 100 + b"b" * 100)
+
+
+@override_settings(COMPRESSION_MIN_SIZE=200)
+class CompressionMiddlewareTest(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def process(self, response, accept="gzip"):
+        request = self.factory.get("/", HTTP_ACCEPT_ENCODING=accept)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, size=1000, **kwargs):
+        return HttpResponse(
+            b'{"data": "' + b"x" * size + b'"}',
+            content_type="application/json",
+            **kwargs,
+        )
+
+    def test_compresses_json_above_threshold(self):
+        """Test large JSON is gzipped with length, Vary and weak ETag."""
+        response = self.json_response()
+        response["ETag"] = '"abc"'
+        original = response.content
+
+        response = self.process(response)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), original)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response["ETag"], 'W/"abc"')
+
+    def test_small_responses_are_not_compressed(self):
+        """Test bodies below COMPRESSION_MIN_SIZE are sent as-is."""
+        response = self.process(self.json_response(size=10))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+
+    def test_bodiless_statuses_are_not_compressed(self):
+        """Test 204 and 304 responses are never compressed."""
+        for status in (204, 304):
+            response = self.process(self.json_response(status=status))
+
+            self.assertFalse(response.has_header("Content-Encoding"))
+            self.assertFalse(response.has_header("Vary"))
+
+    def test_other_content_types_are_not_compressed(self):
+        """Test binary content types are left alone."""
+        response = self.process(HttpResponse(b"x" * 1000, content_type="image/png"))
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_identity_client(self):
+        """Test clients without Accept-Encoding get the plain body."""
+        response = self.process(self.json_response(), accept="")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+
+    def test_streaming_response(self):
+        """Test streaming bodies are compressed and lose Content-Length."""
+        response = StreamingHttpResponse(
+            iter([b"line\n"] * 50), content_type="application/x-ndjson"
+        )
+        response["Content-Length"] = "250"
+
+        response = self.process(response)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        body = gzip.decompress(b"".join(response.streaming_content))
+        self.assertEqual(body, b"line\n" * 50)
+
+    @skipIf(compression.brotli is None, "brotli is not installed")
+    def test_brotli(self):
+        """Test br is used when preferred and installed."""
+        original = self.json_response().content
+
+        response = self.process(self.json_response(), accept="gzip;q=0.5, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(decompress(response.content, "br"), original)
+
+    @skipIf(compression.zstandard is None, "zstandard is not installed")
+    def test_zstd(self):
+        """Test zstd is used when preferred and installed."""
+        original = self.json_response().content
+
+        response = self.process(self.json_response(), accept="zstd, gzip;q=0.5")
+
+        self.assertEqual(response["Content-Encoding"], "zstd")
+        self.assertEqual(decompress(response.content, "zstd"), original)
+
+
+class CompressedEndpointsTest(TestCase):
+    def test_video_list_is_compressed(self):
+        """Test the JSON list endpoint honours Accept-Encoding."""
+        for index in range(20):
+            Video.objects.create(
+                title=f"Compressed {index}",
+                url=f"https://youtube.com/watch?v=compressed{index}",
+            )
+
+        plain = self.client.get(reverse("video-list"), {"page_size": 20})
+        compressed = self.client.get(
+            reverse("video-list"), {"page_size": 20}, HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
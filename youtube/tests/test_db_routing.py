@@ -0,0 +1,106 @@
+"""
+Tests for read-replica routing.
+
+The test settings define a second, separate SQLite database ("replica").
+Rows are only written to the primary, so a read that returns nothing shows
+it was served by the replica.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..db_router import ReplicaRouter, read_from_replica
+from ..models import Video
+from ..services import StatisticsService, VideoService
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingTest(TransactionTestCase):
+    """Test suite for ReplicaRouter and ReplicaRoutingMiddleware."""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.video = VideoService().create(
+            title="Primary only", url="https://youtube.com/watch?v=primary"
+        )
+
+    def test_list_and_detail_reads_go_to_replica(self):
+        """Test GET list/detail are served from the replica."""
+        with CaptureQueriesContext(connections["replica"]) as replica_queries:
+            list_response = self.client.get(reverse("video-list"))
+            detail_response = self.client.get(
+                reverse("video-detail", args=[self.video.id])
+            )
+
+        self.assertEqual(list_response.json()["count"], 0)
+        self.assertEqual(detail_response.status_code, 400)
+        self.assertTrue(replica_queries.captured_queries)
+
+    def test_async_list_reads_go_to_replica(self):
+        """Test the async list view is routed the same way."""
+        response = self.client.get(reverse("async-video-list"), {"page_size": 5})
+
+        self.assertEqual(response.json()["count"], 0)
+
+    async def test_asgi_requests_are_routed(self):
+        """Test routing works when the middleware runs under ASGI."""
+        for name in ("video-list", "async-video-list"):
+            response = await self.async_client.get(reverse(name))
+
+            self.assertEqual(response.status_code, 200, name)
+            self.assertEqual(response.json()["count"], 0, name)
+
+    def test_writes_pin_following_reads_to_primary(self):
+        """Test a successful write sets the pin cookie and reads see it."""
+        response = self.client.post(
+            reverse("video-list"),
+            {"title": "New", "description": "", "url": "https://youtube.com/watch?v=w"},
+            content_type="application/json",
+        )
+
+        self.assertIn(settings.READ_YOUR_WRITES_COOKIE, response.cookies)
+        self.assertEqual(
+            response.cookies[settings.READ_YOUR_WRITES_COOKIE]["max-age"],
+            settings.READ_YOUR_WRITES_SECONDS,
+        )
+        list_response = self.client.get(reverse("video-list"))
+        self.assertEqual(list_response.json()["count"], 2)
+
+    def test_unflagged_views_and_writes_use_primary(self):
+        """Test views without read_replica and all writes use the primary."""
+        response = self.client.post(
+            reverse("video-increment-views", args=[self.video.id])
+        )
+
+        self.assertEqual(response.json()["view_count"], 1)
+        self.assertEqual(ReplicaRouter().db_for_write(Video), "default")
+
+    def test_reads_inside_transaction_stay_on_primary(self):
+        """Test read-your-writes inside a transaction."""
+        router = ReplicaRouter()
+
+        with read_from_replica():
+            self.assertEqual(router.db_for_read(Video), "replica")
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Video), "default")
+                self.assertTrue(Video.objects.filter(pk=self.video.pk).exists())
+
+    def test_statistics_read_from_replica(self):
+        """Test stats computations are served from the replica."""
+        stats = StatisticsService().get_statistics()
+
+        self.assertEqual(stats["video_stats"]["total_videos"], 0)
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas_configured(self):
+        """Test everything uses the primary without replicas."""
+        response = self.client.get(reverse("video-list"))
+
+        self.assertEqual(response.json()["count"], 1)
+        self.assertNotIn(settings.READ_YOUR_WRITES_COOKIE, response.cookies)
@@ -0,0 +1,164 @@
+"""
+Tests for time-bucketed engagement history.
+"""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import MagicMock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import EngagementBucket, Video
+from ..services import ContentPopulationService
+from ..services.engagement_service import EngagementService
+
+
+class EngagementServiceTest(TestCase):
+    """Test suite for EngagementService."""
+
+    def setUp(self):
+        self.service = EngagementService()
+        self.video = Video.objects.create(
+            title="Bucketed", url="https://youtube.com/watch?v=buckets"
+        )
+        self.t0 = datetime(2025, 8, 14, 10, 0, tzinfo=dt_timezone.utc)
+
+    def test_record_accumulates_into_minute_bucket(self):
+        """Test events in the same minute share one row."""
+        self.service.record(video_id=self.video.id, views=1, at=self.t0)
+        self.service.record(
+            video_id=self.video.id, views=2, likes=1, at=self.t0 + timedelta(seconds=30)
+        )
+        self.service.record(
+            video_id=self.video.id, views=1, at=self.t0 + timedelta(minutes=1)
+        )
+
+        buckets = EngagementBucket.objects.order_by("bucket_start")
+        self.assertEqual([(b.views, b.likes) for b in buckets], [(3, 1), (1, 0)])
+
+    def test_record_many_adds_deltas_to_minute_buckets(self):
+        """Test bulk deltas create missing buckets and add to existing ones."""
+        other = Video.objects.create(
+            title="Other", url="https://youtube.com/watch?v=buckets2"
+        )
+        self.service.record(video_id=self.video.id, views=1, at=self.t0)
+
+        self.service.record_many(
+            deltas={self.video.id: (2, 1), other.id: (2, 1)}, at=self.t0
+        )
+        self.service.record_many(deltas={other.id: (0, 0)}, at=self.t0)
+
+        buckets = EngagementBucket.objects.order_by("video_id")
+        self.assertEqual([(b.views, b.likes) for b in buckets], [(3, 1), (2, 1)])
+
+    def test_compact_rolls_minutes_into_hours_and_hours_into_days(self):
+        """Test compaction preserves totals at coarser granularity."""
+        for minute in range(0, 120, 15):
+            self.service.record(
+                video_id=self.video.id, views=2, at=self.t0 + timedelta(minutes=minute)
+            )
+        recent = self.t0 + timedelta(days=3)
+        self.service.record(video_id=self.video.id, views=5, at=recent)
+
+        result = self.service.compact(now=recent + timedelta(minutes=5))
+
+        self.assertEqual(result["minute_buckets_compacted"], 8)
+        hours = EngagementBucket.objects.filter(granularity="hour")
+        self.assertEqual(sorted(b.views for b in hours), [8, 8])
+        self.assertEqual(
+            EngagementBucket.objects.filter(granularity="minute").count(), 1
+        )
+
+        result = self.service.compact(now=recent + timedelta(days=40))
+
+        self.assertEqual(result["minute_buckets_compacted"], 1)
+        self.assertEqual(result["hour_buckets_compacted"], 3)
+        days = EngagementBucket.objects.filter(granularity="day").order_by(
+            "bucket_start"
+        )
+        self.assertEqual([d.views for d in days], [16, 5])
+        self.assertEqual(days[0].bucket_start, self.t0.replace(hour=0))
+
+    def test_history_folds_in_uncompacted_buckets(self):
+        """Test hourly history combines hour and minute buckets."""
+        self.service.record(video_id=self.video.id, views=4, at=self.t0)
+        self.service.compact(now=self.t0 + timedelta(days=2))
+        self.service.record(
+            video_id=self.video.id, views=1, at=self.t0 + timedelta(minutes=10)
+        )
+
+        history = self.service.get_history(
+            video_id=self.video.id,
+            start=self.t0,
+            end=self.t0 + timedelta(hours=2),
+            bucket="hour",
+        )
+
+        self.assertEqual(history["totals"], {"views": 5, "likes": 0})
+        self.assertEqual(len(history["results"]), 1)
+
+    def test_simulated_engagement_is_recorded(self):
+        """Test simulate_engagement_for_videos emits bucket events."""
+        service = ContentPopulationService(openai_client=MagicMock())
+
+        result = service.simulate_engagement_for_videos(video_count=1)
+
+        total = sum(EngagementBucket.objects.values_list("views", flat=True)) + sum(
+            EngagementBucket.objects.values_list("likes", flat=True)
+        )
+        self.video.refresh_from_db()
+        self.assertEqual(result["videos_engaged"], 1)
+        self.assertEqual(total, self.video.view_count + self.video.like_count)
+
+
+class VideoStatsAPITest(TestCase):
+    """Test suite for the video stats endpoint."""
+
+    def setUp(self):
+        self.video = Video.objects.create(
+            title="Stats", url="https://youtube.com/watch?v=stats"
+        )
+
+    def test_counter_endpoints_feed_stats(self):
+        """Test views and likes from the API show up in the history."""
+        self.client.post(reverse("video-increment-views", args=[self.video.id]))
+        self.client.post(reverse("video-increment-views", args=[self.video.id]))
+        self.client.post(reverse("video-like", args=[self.video.id]))
+        self.client.post(reverse("async-video-like", args=[self.video.id]))
+
+        response = self.client.get(
+            reverse("video-stats", args=[self.video.id]), {"bucket": "minute"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["totals"], {"views": 2, "likes": 2})
+        self.assertEqual(data["bucket"], "minute")
+        self.assertIn("from", data)
+
+    def test_stats_range_validation(self):
+        """Test inverted and oversized ranges are rejected."""
+        url = reverse("video-stats", args=[self.video.id])
+
+        inverted = self.client.get(
+            url, {"from": "2025-08-14T10:00:00Z", "to": "2025-08-14T09:00:00Z"}
+        )
+        oversized = self.client.get(
+            url,
+            {
+                "from": "2025-01-01T00:00:00Z",
+                "to": "2025-08-14T00:00:00Z",
+                "bucket": "minute",
+            },
+        )
+
+        self.assertEqual(inverted.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(oversized.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stats_unknown_video(self):
+        """Test stats for a missing video returns 400."""
+        response = self.client.get(reverse("video-stats", args=[999]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
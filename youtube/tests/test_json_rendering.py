@@ -0,0 +1,85 @@
+"""
+Tests for the orjson renderer and parser.
+"""
+
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from youtube.parsers import ORJSONParser
+from youtube.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(TestCase):
+    DATA = {
+        "id": 1,
+        "title": "Caf\u00e9 \u2028 line",
+        "created_at": datetime(2025, 8, 14, 11, 48, 0, 123456, tzinfo=timezone.utc),
+        "updated_at": datetime(2025, 8, 14, 11, 48, tzinfo=timezone.utc),
+        "items": [None, True, 1.5],
+    }
+
+    def test_output_matches_drf_json_renderer(self):
+        """Test orjson output is byte-identical to DRF's JSONRenderer."""
+        self.assertEqual(
+            ORJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA)
+        )
+
+    def test_falls_back_without_orjson(self):
+        """Test the renderer works when orjson is not installed."""
+        with mock.patch("youtube.renderers.orjson", None):
+            self.assertEqual(
+                ORJSONRenderer().render(self.DATA), JSONRenderer().render(self.DATA)
+            )
+
+    def test_non_finite_floats_are_rejected_like_drf(self):
+        """Test NaN and Infinity raise instead of rendering as null."""
+        for value in (float("nan"), float("inf"), Decimal("NaN")):
+            data = {"items": [{"score": value}], "missing": None}
+            with self.assertRaises(ValueError):
+                JSONRenderer().render(data)
+            with self.assertRaises(ValueError):
+                ORJSONRenderer().render(data)
+
+    def test_indent_is_honoured(self):
+        """Test ``; indent=2`` in the accepted media type pretty-prints."""
+        rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=2")
+
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+
+class ORJSONParserTest(TestCase):
+    def test_parses_like_json_parser(self):
+        """Test parsed data matches DRF's JSONParser."""
+        body = '{"title": "Café", "tags": [1, 2]}'.encode()
+
+        self.assertEqual(
+            ORJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        """Test malformed bodies produce a 400 ParseError."""
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{not json"))
+
+    def test_api_accepts_json_body(self):
+        """Test the default parser handles JSON request bodies."""
+        response = self.client.post(
+            reverse("video-list"),
+            {
+                "title": "Parsed",
+                "description": "",
+                "url": "https://youtube.com/watch?v=p",
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 201)
@@ -0,0 +1,102 @@
+"""
+Tests for the chord-based initial content population.
+"""
+
+from unittest.mock import patch
+
+from celery.backends.cache import CacheBackend
+from celery.result import AsyncResult
+from django.core.cache import cache
+from django.test import TestCase
+
+from youtube.benchmarks.stubs import StubOpenAIClient
+from youtube.models import Comment, TaskLog, Video
+from youtube.services import ContentPopulationService
+from youtube.tasks import (
+    finish_initial_population,
+    populate_initial_content,
+    populate_videos,
+)
+from youtube_api.celery import app
+
+
+def stub_population_service():
+    return ContentPopulationService(openai_client=StubOpenAIClient())
+
+
+@patch(
+    "youtube.tasks.content_generation_tasks.ContentPopulationService",
+    stub_population_service,
+)
+class PopulateInitialContentTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_target_is_split_into_batches_with_one_task_log(self):
+        """Test the chord creates the target and logs once for the parent."""
+        result = populate_initial_content.apply(
+            kwargs={"target": 7, "batch_size": 3}
+        ).get()
+
+        self.assertEqual(result["videos_created"], 7)
+        self.assertEqual(result["batches"], 3)
+        self.assertEqual(Video.objects.count(), 7)
+        self.assertEqual(Comment.objects.count(), result["comments_generated"])
+        self.assertEqual(
+            set(result["video_ids"]), set(Video.objects.values_list("id", flat=True))
+        )
+
+        [log] = TaskLog.objects.all()
+        self.assertEqual(log.task_name, "populate_initial_content")
+        self.assertEqual(log.status, "SUCCESS")
+        self.assertEqual(log.kwargs, {"target": 7, "batch_size": 3})
+        self.assertEqual(log.result["videos_created"], 7)
+
+    def test_default_target_uses_one_video_per_subtask(self):
+        """Test the startup default stays at 5-10 single-video subtasks."""
+        result = populate_initial_content.apply().get()
+
+        self.assertIn(result["videos_created"], range(5, 11))
+        self.assertEqual(result["batches"], result["videos_created"])
+
+    def test_batches_report_progress(self):
+        """Test each batch adds its videos to the parent's progress counter."""
+        populate_videos.apply(args=(2, "parent", 5))
+        populate_videos.apply(args=(3, "parent", 5))
+
+        self.assertEqual(cache.get("populate-progress:parent"), 5)
+
+    def test_failed_batches_do_not_stop_the_callback(self):
+        """Test the callback records failure only when nothing was created."""
+        TaskLog.objects.create(task_name="populate_initial_content", task_id="parent")
+        failed = {"video_ids": [], "comments_generated": 0, "errors": ["boom"]}
+
+        result = finish_initial_population.apply(
+            args=([failed, failed], "parent", 2)
+        ).get()
+
+        log = TaskLog.objects.get(task_id="parent")
+        self.assertEqual(result["videos_created"], 0)
+        self.assertEqual(log.status, "FAILURE")
+        self.assertEqual(log.error_message, "boom")
+
+    def test_failed_population_is_readable_from_the_result_backend(self):
+        """Test a non-eager failed callback stores an exception for the parent."""
+        backend = CacheBackend(app=app, backend="memory")
+        failed = {"video_ids": [], "comments_generated": 0, "errors": ["boom"]}
+
+        # Called directly rather than with apply(), so the request is not eager
+        self.addCleanup(
+            setattr,
+            finish_initial_population,
+            "backend",
+            finish_initial_population.backend,
+        )
+        finish_initial_population.backend = backend
+        finish_initial_population([failed], "parent", 1)
+
+        parent = AsyncResult("parent", backend=backend)
+        self.assertEqual(parent.state, "FAILURE")
+        self.assertIsInstance(parent.result, RuntimeError)
+        with self.assertRaisesMessage(RuntimeError, "boom"):
+            parent.get(timeout=1)
@@ -0,0 +1,142 @@
+"""
+Tests for full-text search over videos and comments.
+
+The test database is SQLite, so these exercise the FTS5 fallback.
+"""
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Comment, Video
+from ..services.search_service import SearchService
+
+
+class SearchServiceTest(TestCase):
+    """Test suite for SearchService."""
+
+    def setUp(self):
+        self.service = SearchService()
+        self.title_match = Video.objects.create(
+            title="Python tutorial",
+            description="Learn the basics",
+            url="https://youtube.com/watch?v=search1",
+        )
+        self.description_match = Video.objects.create(
+            title="Cooking pasta",
+            description="No python here, only pasta",
+            url="https://youtube.com/watch?v=search2",
+        )
+        Video.objects.create(
+            title="Unrelated", url="https://youtube.com/watch?v=search3"
+        )
+
+    def test_title_matches_rank_above_description_matches(self):
+        """Test title hits are weighted higher than description hits."""
+        results = list(self.service.search(query="python").order_by("-rank", "-id"))
+
+        self.assertEqual(results, [self.title_match, self.description_match])
+        self.assertGreater(results[0].rank, results[1].rank)
+
+    def test_stemming(self):
+        """Test word forms match their stem."""
+        results = self.service.search(query="tutorials")
+
+        self.assertEqual(list(results), [self.title_match])
+
+    def test_index_is_maintained_on_update_and_delete(self):
+        """Test edits and deletes are reflected without a rebuild."""
+        self.title_match.title = "Rust tutorial"
+        self.title_match.save()
+
+        self.assertEqual(list(self.service.search(query="rust")), [self.title_match])
+        self.assertNotIn(self.title_match, self.service.search(query="python"))
+
+        self.description_match.delete()
+        self.assertFalse(self.service.search(query="pasta").exists())
+
+    def test_query_syntax_is_escaped(self):
+        """Test FTS operators in user input do not raise."""
+        results = self.service.search(query='python" OR title:* NEAR(')
+
+        self.assertEqual(list(results), [])
+        self.assertFalse(self.service.search(query="!!!").exists())
+
+    def test_search_comments(self):
+        """Test comment content and author are searchable."""
+        comment = Comment.objects.create(
+            video=self.title_match, author="guido", content="Great explanation"
+        )
+
+        self.assertEqual(
+            list(self.service.search(query="explanation", search_type="comment")),
+            [comment],
+        )
+        self.assertEqual(
+            list(self.service.search(query="guido", search_type="comment")),
+            [comment],
+        )
+
+
+class SearchAPITest(TestCase):
+    """Test suite for the search endpoint."""
+
+    def setUp(self):
+        for i in range(15):
+            Video.objects.create(
+                title=f"Django tips {i}",
+                description="django " * (i % 3),
+                url=f"https://youtube.com/watch?v=api{i}",
+            )
+
+    def test_cursor_pagination_walks_all_results(self):
+        """Test following next links returns each match exactly once."""
+        url = reverse("search")
+        response = self.client.get(url, {"q": "django", "page_size": 4})
+        seen = []
+        ranks = []
+
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            data = response.json()
+            seen += [row["id"] for row in data["results"]]
+            ranks += [row["rank"] for row in data["results"]]
+            if not data["next"]:
+                break
+            response = self.client.get(data["next"])
+
+        self.assertEqual(len(seen), 15)
+        self.assertEqual(len(set(seen)), 15)
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_comment_search(self):
+        """Test type=comment returns comment results."""
+        video = Video.objects.first()
+        Comment.objects.create(video=video, author="A", content="Loved the tips")
+
+        response = self.client.get(reverse("search"), {"q": "tips", "type": "comment"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        result = response.json()["results"][0]
+        self.assertEqual(result["video"], video.id)
+        self.assertIn("rank", result)
+
+    def test_missing_query_returns_400(self):
+        """Test q is required."""
+        response = self.client.get(reverse("search"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_admin_search_uses_index(self):
+        """Test the admin changelist search box goes through SearchService."""
+        user = User.objects.create_superuser("searcher", "searcher@example.com", "pw")
+        self.client.force_login(user)
+
+        response = self.client.get(
+            reverse("admin:youtube_video_changelist"), {"q": "tips 3"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, "Django tips 3")
+        self.assertNotContains(response, "Django tips 4")
@@ -0,0 +1,101 @@
+"""
+Parity tests for the compiled read serializers.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from django.db.models import Count
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from youtube.models import Comment, Video
+from youtube.serializers import CompiledSerializer
+from youtube.views.comment_list_create import CommentListCreateAPI
+from youtube.views.video_list_create import VideoListCreateAPI
+
+
+class CompiledSerializerParityTest(TestCase):
+    def setUp(self):
+        self.videos = [
+            Video.objects.create(
+                title=f"Vidéo {i}  ",
+                description="" if i % 2 else "Described",
+                url=f"https://youtube.com/watch?v=parity{i}",
+                thumbnail_url="" if i % 2 else "https://img.youtube.com/p.jpg",
+                duration=i * 60,
+                view_count=i * 1000,
+                like_count=i,
+            )
+            for i in range(3)
+        ]
+        for i, video in enumerate(self.videos):
+            for j in range(i):
+                Comment.objects.create(
+                    video=video, author=f"Author {j}", content="Nice", like_count=j
+                )
+        # Whole-second timestamps render without microseconds
+        Video.objects.filter(pk=self.videos[0].pk).update(
+            created_at=datetime(2025, 8, 14, 11, 48, tzinfo=dt_timezone.utc)
+        )
+
+    def assertParity(self, view_class, queryset):
+        compiled = view_class.compiled_output
+        expected = [dict(view_class.OutputSerializer(obj).data) for obj in queryset]
+
+        actual = compiled.serialize(compiled.values(queryset))
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
+
+    def test_video_output_matches_serializer(self):
+        """Test compiled video rows equal OutputSerializer data."""
+        queryset = Video.objects.annotate(comments_count=Count("comments")).order_by(
+            "id"
+        )
+
+        self.assertParity(VideoListCreateAPI, queryset)
+
+    def test_comment_output_matches_serializer(self):
+        """Test compiled comment rows equal OutputSerializer data."""
+        self.assertParity(CommentListCreateAPI, Comment.objects.order_by("id"))
+
+    def test_datetimes_follow_active_timezone(self):
+        """Test datetimes are converted like DateTimeField does."""
+        with timezone.override("Europe/Berlin"):
+            self.assertParity(CommentListCreateAPI, Comment.objects.order_by("id"))
+
+    def test_none_values_are_not_converted(self):
+        """Test None skips to_representation, as in Serializer."""
+
+        class NullableSerializer(serializers.Serializer):
+            id = serializers.IntegerField()
+            created_at = serializers.DateTimeField()
+
+        compiled = CompiledSerializer(NullableSerializer)
+
+        self.assertEqual(
+            compiled.serialize_row({"id": None, "created_at": None}),
+            {"id": None, "created_at": None},
+        )
+
+    def test_list_endpoints_return_serializer_payloads(self):
+        """Test list pages carry the same JSON as serializing instances."""
+        video_response = self.client.get(reverse("video-list"), {"page_size": 100})
+        comment_response = self.client.get(reverse("comment-list"), {"page_size": 100})
+
+        videos = {
+            video.id: dict(VideoListCreateAPI.OutputSerializer(video).data)
+            for video in Video.objects.annotate(comments_count=Count("comments"))
+        }
+        comments = {
+            comment.id: dict(CommentListCreateAPI.OutputSerializer(comment).data)
+            for comment in Comment.objects.all()
+        }
+        for row in video_response.json()["results"]:
+            self.assertEqual(row, videos[row["id"]])
+        for row in comment_response.json()["results"]:
+            self.assertEqual(row, comments[row["id"]])
+        self.assertEqual(len(comment_response.json()["results"]), 3)
@@ -0,0 +1,50 @@
+"""
+Tests for the environment-driven gunicorn configuration.
+"""
+
+import runpy
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+CONFIG = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+
+
+class GunicornConfigTest(SimpleTestCase):
+    def load(self, **env):
+        with patch.dict("os.environ", env):
+            return runpy.run_path(str(CONFIG))
+
+    def test_defaults_serve_wsgi_with_threads_and_recycling(self):
+        """Test the default config runs gthread workers on the WSGI app."""
+        config = self.load()
+
+        self.assertEqual(config["wsgi_app"], "youtube_api.wsgi:application")
+        self.assertEqual(config["worker_class"], "gthread")
+        self.assertGreaterEqual(config["workers"], 3)
+        self.assertEqual(config["max_requests"], 1000)
+        self.assertTrue(config["preload_app"])
+
+    def test_environment_overrides(self):
+        """Test worker tuning comes from GUNICORN_* variables."""
+        config = self.load(
+            GUNICORN_WORKERS="3",
+            GUNICORN_THREADS="8",
+            GUNICORN_KEEPALIVE="75",
+            GUNICORN_MAX_REQUESTS="0",
+            GUNICORN_PRELOAD="0",
+        )
+
+        self.assertEqual(
+            (config["workers"], config["threads"], config["keepalive"]), (3, 8, 75)
+        )
+        self.assertEqual(config["max_requests"], 0)
+        self.assertFalse(config["preload_app"])
+
+    def test_uvicorn_workers_serve_the_asgi_app(self):
+        """Test choosing uvicorn workers switches to the ASGI application."""
+        config = self.load(GUNICORN_WORKER_CLASS="uvicorn.workers.UvicornWorker")
+
+        self.assertEqual(config["wsgi_app"], "youtube_api.asgi:application")
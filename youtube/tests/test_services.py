@@ -5,10 +5,17 @@ Tests focus on business logic, validation, and service behavior.
 Following Django styleguide patterns for testing services.
 """
 
+from unittest.mock import MagicMock
+
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from ..models import Video, Comment
-from ..services import VideoService, CommentService
+from ..services import (
+    VideoService,
+    CommentService,
+    ContentPopulationService,
+    VideoIdService,
+)
 
 
 class VideoServiceTests(TestCase):
@@ -167,3 +174,36 @@ class CommentServiceTests(TestCase):
         result = self.service.get_by_video(video_id=None)
 
         self.assertEqual(result.count(), 2)
+
+
+class VideoIdServiceTests(TestCase):
+    """Test suite for collision-free video id generation."""
+
+    def setUp(self):
+        self.service = VideoIdService()
+
+    def test_ids_are_eleven_base64url_characters(self):
+        """Test ids look like YouTube video ids."""
+        for video_id in self.service.allocate(50):
+            self.assertRegex(video_id, r"^[A-Za-z0-9_-]{11}$")
+
+    def test_blocks_never_overlap(self):
+        """Test consecutive reservations hand out distinct values and ids."""
+        first = self.service.reserve(100)
+        second = self.service.reserve(100)
+
+        self.assertEqual(first.stop, second.start)
+        ids = [self.service.encode(value) for value in [*first, *second]]
+        self.assertEqual(len(set(ids)), 200)
+
+    def test_generate_videos_inserts_a_block(self):
+        """Test bulk generation creates videos with unique URLs in one go."""
+        service = ContentPopulationService(openai_client=MagicMock())
+
+        videos = service.generate_videos(20)
+        service.generate_video()
+
+        self.assertEqual(Video.objects.count(), 21)
+        self.assertEqual(Video.objects.values("url").distinct().count(), 21)
+        self.assertEqual(len(videos), 20)
+        self.assertTrue(videos[0]["url"].startswith("https://youtube.com/watch?v="))
@@ -0,0 +1,144 @@
+"""
+Tests for ?fields= and ?expand= on the video and comment endpoints.
+"""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from youtube.models import Comment, Video
+
+
+class SparseFieldsTest(TestCase):
+    def setUp(self):
+        self.video = Video.objects.create(
+            title="Sparse",
+            description="Long description",
+            url="https://youtube.com/watch?v=sparse",
+            view_count=42,
+        )
+        self.other = Video.objects.create(
+            title="Other", url="https://youtube.com/watch?v=other"
+        )
+        self.comments = [
+            Comment.objects.create(video=self.video, author=f"A{i}", content="Hi")
+            for i in range(2)
+        ]
+
+    def get(self, name, params, *args):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(name, args=args), params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json(), [query["sql"] for query in queries]
+
+    def test_video_list_fields_narrow_projection(self):
+        """Test ?fields= limits keys, columns, and skips the comment count."""
+        data, queries = self.get("video-list", {"fields": "id,title,view_count"})
+
+        self.assertEqual(
+            data["results"][0], {"id": self.other.id, "title": "Other", "view_count": 0}
+        )
+        page_query = queries[-1]
+        self.assertNotIn("description", page_query)
+        self.assertNotIn("youtube_comment", page_query)
+
+    def test_video_list_expand_comments(self):
+        """Test ?expand=comments nests comments with one extra query."""
+        data, queries = self.get(
+            "video-list", {"fields": "id,title", "expand": "comments"}
+        )
+
+        by_id = {row["id"]: row for row in data["results"]}
+        self.assertEqual(len(by_id[self.video.id]["comments"]), 2)
+        self.assertEqual(by_id[self.other.id]["comments"], [])
+        self.assertEqual(
+            set(by_id[self.video.id]["comments"][0]),
+            {
+                "id",
+                "video",
+                "author",
+                "content",
+                "like_count",
+                "created_at",
+                "updated_at",
+            },
+        )
+        self.assertEqual(set(by_id[self.video.id]), {"id", "title", "comments"})
+        # COUNT, page, comments
+        self.assertEqual(len(queries), 3)
+
+    def test_video_list_default_is_unchanged(self):
+        """Test the list without parameters returns every list field."""
+        data, _ = self.get("video-list", {})
+
+        self.assertIn("comments_count", data["results"][0])
+        self.assertNotIn("comments", data["results"][0])
+
+    def test_video_detail_fields_skip_comments(self):
+        """Test detail ?fields= skips the prefetch and count."""
+        data, queries = self.get(
+            "video-detail", {"fields": "id,title,view_count"}, self.video.id
+        )
+
+        self.assertEqual(
+            data, {"id": self.video.id, "title": "Sparse", "view_count": 42}
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("description", queries[0])
+        self.assertNotIn("COUNT", queries[0])
+
+    def test_video_detail_expand_comments(self):
+        """Test ?expand=comments adds comments to a sparse detail."""
+        data, queries = self.get(
+            "video-detail", {"fields": "id", "expand": "comments"}, self.video.id
+        )
+
+        self.assertEqual(set(data), {"id", "comments"})
+        self.assertEqual(len(data["comments"]), 2)
+        self.assertEqual(len(queries), 2)
+
+    def test_video_detail_default_includes_comments(self):
+        """Test detail without parameters keeps comments and count."""
+        data, _ = self.get("video-detail", {}, self.video.id)
+
+        self.assertEqual(data["comments_count"], 2)
+        self.assertEqual(len(data["comments"]), 2)
+
+    def test_comment_list_and_detail_fields(self):
+        """Test ?fields= on the comment endpoints."""
+        list_data, _ = self.get(
+            "comment-list", {"video": self.video.id, "fields": "id,author"}
+        )
+        detail_data, queries = self.get(
+            "comment-detail", {"fields": "video,content"}, self.comments[0].id
+        )
+
+        self.assertEqual(set(list_data["results"][0]), {"id", "author"})
+        self.assertEqual(detail_data, {"video": self.video.id, "content": "Hi"})
+        self.assertEqual(len(queries), 1)
+
+    def test_unknown_fields_are_rejected(self):
+        """Test unknown ?fields= and ?expand= names return 400."""
+        response = self.client.get(reverse("video-list"), {"fields": "id,secret"})
+        expand_response = self.client.get(
+            reverse("comment-list"), {"expand": "comments"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("secret", str(response.json()))
+        self.assertEqual(expand_response.status_code, 400)
+
+    def test_async_views_match_sync_views(self):
+        """Test the async list and detail honour the same parameters."""
+        params = {"fields": "id,title", "expand": "comments"}
+
+        for sync_name, async_name, args in [
+            ("video-list", "async-video-list", ()),
+            ("video-detail", "async-video-detail", (self.video.id,)),
+        ]:
+            sync_data, _ = self.get(sync_name, params, *args)
+            async_data, _ = self.get(async_name, params, *args)
+            if "results" in sync_data:
+                sync_data, async_data = sync_data["results"], async_data["results"]
+            self.assertEqual(async_data, sync_data)
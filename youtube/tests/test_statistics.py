@@ -0,0 +1,184 @@
+"""
+Tests for running engagement statistics.
+
+Every write path should keep the running totals equal to a full-table
+aggregate, which is what rebuild_statistics recomputes.
+"""
+
+from io import StringIO
+from unittest.mock import MagicMock
+
+from django.core.management import call_command
+from django.db.models import Avg, Count, Max
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+
+from ..models import Comment, EngagementAggregate, Video
+from ..services import (
+    CommentService,
+    ContentPopulationService,
+    StatisticsService,
+    VideoService,
+)
+
+
+def full_table_statistics():
+    """The statistics computed the old way, with full-table aggregates."""
+    video_stats = Video.objects.aggregate(
+        total_videos=Count("id"),
+        avg_views=Avg("view_count"),
+        avg_likes=Avg("like_count"),
+        max_views=Max("view_count"),
+        max_likes=Max("like_count"),
+    )
+    comment_stats = Comment.objects.aggregate(
+        total_comments=Count("id"), avg_likes=Avg("like_count")
+    )
+    return {"video_stats": video_stats, "comment_stats": comment_stats}
+
+
+class StatisticsServiceTest(TestCase):
+    """Test suite for StatisticsService."""
+
+    def setUp(self):
+        self.service = StatisticsService()
+        self.video_service = VideoService()
+        self.comment_service = CommentService()
+
+    def assertInSync(self):
+        stats = self.service.get_statistics()
+        expected = full_table_statistics()
+        for section in ("video_stats", "comment_stats"):
+            for key, value in expected[section].items():
+                self.assertAlmostEqual(stats[section][key], value, msg=key)
+
+    @override_settings(STATS_SHARDS=4)
+    def test_write_paths_keep_totals_in_sync(self):
+        """Test creates, counters, bulk writes and deletes update the totals."""
+        first = self.video_service.create(
+            title="First", url="https://youtube.com/watch?v=stat1"
+        )
+        second = self.video_service.create(
+            title="Second", url="https://youtube.com/watch?v=stat2"
+        )
+        for _ in range(3):
+            self.video_service.increment_views(video_id=first.id)
+        self.video_service.increment_likes(video_id=second.id)
+        comment = self.comment_service.create(
+            video_id=first.id, author="A", content="Hello"
+        )
+        self.comment_service.increment_likes(comment_id=comment.id)
+        self.video_service.bulk_create(
+            items=[
+                {"title": "Bulk", "url": "https://youtube.com/watch?v=stat3"},
+                {"title": "First v2", "url": "https://youtube.com/watch?v=stat1"},
+            ],
+            upsert=True,
+        )
+        self.comment_service.bulk_create(
+            items=[
+                {"video_id": second.id, "author": "B", "content": "One"},
+                {"video_id": second.id, "author": "C", "content": "Two"},
+            ]
+        )
+        self.assertInSync()
+
+        self.comment_service.delete(comment_id=comment.id)
+        self.video_service.delete(video_id=second.id)
+        stats = self.service.get_statistics()
+
+        self.assertEqual(stats["video_stats"]["total_videos"], 2)
+        self.assertEqual(stats["comment_stats"]["total_comments"], 0)
+        self.assertLessEqual(EngagementAggregate.objects.count(), 4)
+
+    def test_add_engagement_keeps_totals_in_sync(self):
+        """Test bulk counter deltas update videos and totals, skipping unknown ids."""
+        videos = [
+            self.video_service.create(
+                title=f"E{i}", url=f"https://youtube.com/watch?v=eng{i}"
+            )
+            for i in range(3)
+        ]
+
+        applied = self.video_service.add_engagement(
+            deltas={
+                videos[0].id: (5, 1),
+                videos[1].id: (5, 1),
+                videos[2].id: (40, 0),
+                999999: (7, 7),
+            }
+        )
+
+        self.assertEqual(applied, {"views": 50, "likes": 2})
+        videos[2].refresh_from_db()
+        self.assertEqual(videos[2].view_count, 40)
+        self.assertInSync()
+
+    def test_content_population_keeps_totals_in_sync(self):
+        """Test generated videos and comments with random likes are counted."""
+        service = ContentPopulationService(openai_client=MagicMock())
+
+        video = service.generate_video()
+        service.generate_comments_for_video(video["video_id"], 3)
+
+        self.assertInSync()
+
+    def test_most_commented_uses_tallies(self):
+        """Test most commented videos come from the tally table."""
+        videos = [
+            self.video_service.create(
+                title=f"V{i}", url=f"https://youtube.com/watch?v=top{i}"
+            )
+            for i in range(3)
+        ]
+        for i, video in enumerate(videos):
+            for _ in range(i):
+                self.comment_service.create(video_id=video.id, author="A", content="x")
+
+        top = self.service.get_most_commented()
+
+        self.assertEqual(
+            [(row["id"], row["comment_count"]) for row in top],
+            [(videos[2].id, 2), (videos[1].id, 1), (videos[0].id, 0)],
+        )
+
+    def test_statistics_read_in_constant_queries(self):
+        """Test reading statistics does not scan the video table."""
+        for i in range(20):
+            self.video_service.create(
+                title=f"V{i}", url=f"https://youtube.com/watch?v=q{i}"
+            )
+
+        # Totals, top tallies, and padding with uncommented videos
+        with self.assertNumQueries(3):
+            self.service.get_statistics()
+
+    def test_rebuild_corrects_drift(self):
+        """Test rebuild_statistics recomputes totals from the base tables."""
+        Video.objects.create(title="Bypass", url="https://youtube.com/watch?v=raw")
+        out = StringIO()
+
+        call_command("rebuild_statistics", stdout=out)
+
+        self.assertIn("total_videos: 0 -> 1", out.getvalue())
+        self.assertInSync()
+
+
+class StatsAPITest(TestCase):
+    """Test suite for the stats endpoint."""
+
+    def test_stats_endpoint(self):
+        """Test the endpoint returns totals and most commented videos."""
+        video = VideoService().create(
+            title="Stats", url="https://youtube.com/watch?v=statsapi"
+        )
+        CommentService().create(video_id=video.id, author="A", content="Hi")
+
+        response = self.client.get(reverse("stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["video_stats"]["total_videos"], 1)
+        self.assertEqual(data["comment_stats"]["total_comments"], 1)
+        self.assertEqual(data["most_commented_videos"][0]["comment_count"], 1)
@@ -2,13 +2,19 @@
 Tests for task logging functionality.
 """
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
 from unittest.mock import patch
+import pickle
 import uuid
 
+from youtube.checks import check_shared_cache
 from youtube.models import TaskLog
+from youtube.services import LeaseService
 from youtube.services.task_logging_service import TaskLoggingService
-from youtube.tasks import generate_engagement_stats
+from youtube.tasks import generate_engagement_stats, update_trending_scores
 
 
 class TaskLogModelTest(TestCase):
@@ -76,9 +82,7 @@ class TaskLoggingServiceTest(TestCase):
 
 
 class TaskIntegrationTest(TestCase):
-    @patch(
-        "youtube.services.content_population_service.ContentPopulationService.get_engagement_statistics"
-    )
+    @patch("youtube.services.statistics_service.StatisticsService.get_statistics")
     @patch("celery.Task.request")
     def test_task_with_logging(self, mock_request, mock_stats):
         """Test that tasks properly log their execution."""
@@ -105,3 +109,106 @@ class TaskIntegrationTest(TestCase):
         self.assertEqual(log.task_name, "generate_engagement_stats")
         self.assertEqual(log.status, "SUCCESS")
         self.assertIsNotNone(log.result)
+
+    def test_stats_task_runs_without_an_openai_key(self):
+        """Test the stats task only reads aggregates and needs no LLM key."""
+        with patch.dict("os.environ", {"OPENAI_API_KEY": ""}):
+            stats = generate_engagement_stats.apply().get()
+
+        self.assertNotIn("error", stats)
+        self.assertEqual(stats["video_stats"]["total_videos"], 0)
+        self.assertEqual(TaskLog.objects.get().status, "SUCCESS")
+
+
+class LeasedTaskTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.lease = LeaseService()
+
+    def test_lease_is_exclusive_until_released(self):
+        """Test a second owner cannot take a held lease."""
+        self.assertTrue(self.lease.acquire("job", owner="a", timeout=60))
+        self.assertFalse(self.lease.acquire("job", owner="b", timeout=60))
+
+        self.lease.release("job", owner="b")
+        self.assertEqual(self.lease.holder("job"), "a")
+
+        self.lease.release("job", owner="a")
+        self.assertTrue(self.lease.acquire("job", owner="b", timeout=60))
+
+    def test_redis_release_is_an_atomic_compare_and_delete(self):
+        """Test releasing on Redis checks the owner inside one script."""
+        backend = RedisCache("redis://localhost:6379/0", {})
+        with (
+            patch("youtube.services.lease_service.caches", {"default": backend}),
+            patch.object(backend._cache, "get_client") as get_client,
+        ):
+            self.lease.release("job", owner="a")
+
+        get_client.return_value.eval.assert_called_once_with(
+            LeaseService.RELEASE_SCRIPT,
+            1,
+            backend.make_and_validate_key("lease:job"),
+            pickle.dumps("a", pickle.HIGHEST_PROTOCOL),
+        )
+
+    @override_settings(REQUIRE_SHARED_CACHE=True)
+    def test_lease_refuses_a_per_process_cache(self):
+        """Test leases fail loudly instead of holding a per-process lease."""
+        with self.assertLogs("youtube.checks", "ERROR"):
+            with self.assertRaises(ImproperlyConfigured):
+                self.lease.acquire("job", owner="a", timeout=60)
+
+        self.assertEqual(
+            [error.id for error in check_shared_cache(None)], ["youtube.E001"]
+        )
+
+    @override_settings(
+        REQUIRE_SHARED_CACHE=True,
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/1",
+            }
+        },
+    )
+    def test_shared_cache_passes_the_check(self):
+        """Test a Redis cache satisfies the shared cache check."""
+        self.assertEqual(check_shared_cache(None), [])
+
+    def test_overlapping_run_is_skipped_and_logged(self):
+        """Test a periodic run is skipped while another holds its lease."""
+        self.lease.acquire("update_trending_scores", owner="earlier-run", timeout=60)
+
+        result = update_trending_scores.apply().get()
+
+        self.assertTrue(result["skipped"])
+        log = TaskLog.objects.get(task_name="update_trending_scores")
+        self.assertEqual(log.status, "SKIPPED")
+        self.assertIn("earlier-run", log.result["reason"])
+
+    def test_retried_run_skip_updates_existing_log(self):
+        """Test a retry that finds the lease held reuses its task's log."""
+        TaskLoggingService.log_task_start("update_trending_scores", "retry-1")
+        TaskLoggingService.log_task_retry("retry-1", "Temporary failure")
+        self.lease.acquire("update_trending_scores", owner="other-run", timeout=60)
+
+        result = update_trending_scores.apply(task_id="retry-1").get()
+
+        self.assertTrue(result["skipped"])
+        log = TaskLog.objects.get(task_id="retry-1")
+        self.assertEqual(log.status, "SKIPPED")
+        self.assertIn("other-run", log.result["reason"])
+
+    def test_lease_is_released_after_each_run(self):
+        """Test consecutive runs both execute and leave no lease behind."""
+        first = update_trending_scores.apply().get()
+        second = update_trending_scores.apply().get()
+
+        self.assertNotIn("skipped", first)
+        self.assertNotIn("skipped", second)
+        self.assertIsNone(self.lease.holder("update_trending_scores"))
+        self.assertEqual(
+            set(TaskLog.objects.values_list("status", flat=True)), {"SUCCESS"}
+        )
@@ -0,0 +1,69 @@
+"""
+Tests for the Celery queue routing table.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django_celery_beat.models import IntervalSchedule, PeriodicTask
+
+import youtube.tasks  # noqa: F401  (registers the tasks)
+from youtube_api.celery import app
+
+EXPECTED_QUEUES = {
+    "youtube.tasks.content_generation_tasks.generate_video_content": "llm",
+    "youtube.tasks.content_generation_tasks.generate_comments_for_video": "llm",
+    "youtube.tasks.content_generation_tasks.populate_videos": "llm",
+    "youtube.tasks.content_generation_tasks.populate_initial_content": "db",
+    "youtube.tasks.content_generation_tasks.finish_initial_population": "db",
+    "youtube.tasks.engagement_tasks.simulate_user_engagement": "db",
+    "youtube.tasks.trending_tasks.update_trending_scores": "db",
+    "youtube.tasks.content_generation_tasks.flush_comment_requests": "housekeeping",
+    "youtube.tasks.engagement_tasks.generate_engagement_stats": "housekeeping",
+    "youtube.tasks.engagement_tasks.compact_engagement_buckets": "housekeeping",
+}
+
+
+class TaskRoutingTest(TestCase):
+    def route(self, name):
+        return app.amqp.router.route({}, name)["queue"].name
+
+    def test_every_task_has_its_queue(self):
+        """Test LLM, database and housekeeping tasks land on separate queues."""
+        registered = {name for name in app.tasks if name.startswith("youtube.tasks.")}
+
+        self.assertEqual(registered, set(EXPECTED_QUEUES))
+        for name, queue in EXPECTED_QUEUES.items():
+            self.assertEqual(self.route(name), queue, name)
+
+    def test_unrouted_tasks_fall_back_to_db_queue(self):
+        """Test new youtube tasks get a queue even before being routed."""
+        self.assertEqual(self.route("youtube.tasks.new_tasks.something"), "db")
+
+    def test_periodic_tasks_use_registered_names(self):
+        """Test beat schedules names the workers know, so they get routed."""
+        call_command("setup_periodic_tasks", stdout=StringIO())
+
+        for task in PeriodicTask.objects.filter(name__startswith="YouTube:"):
+            self.assertIn(task.task, EXPECTED_QUEUES)
+
+    def test_periodic_tasks_fix_stale_task_names(self):
+        """Test existing schedules are updated to the registered names."""
+        PeriodicTask.objects.create(
+            name="YouTube: Generate Video Content",
+            task="youtube.tasks.generate_video_content",
+            interval=IntervalSchedule.objects.create(
+                every=1, period=IntervalSchedule.DAYS
+            ),
+            enabled=False,
+        )
+
+        call_command("setup_periodic_tasks", stdout=StringIO())
+
+        task = PeriodicTask.objects.get(name="YouTube: Generate Video Content")
+        self.assertEqual(
+            task.task, "youtube.tasks.content_generation_tasks.generate_video_content"
+        )
+        self.assertEqual((task.interval.every, task.interval.period), (30, "minutes"))
+        self.assertFalse(task.enabled)
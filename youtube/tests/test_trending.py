@@ -0,0 +1,115 @@
+"""
+Tests for precomputed trending scores.
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from ..models import Comment, Video, VideoTrendingScore
+from ..services.trending_service import TrendingService
+from ..tasks import update_trending_scores
+
+
+class TrendingServiceTest(TestCase):
+    """Test suite for TrendingService."""
+
+    def setUp(self):
+        self.service = TrendingService()
+        self.now = timezone.now()
+        self.old_hit = Video.objects.create(
+            title="Old hit", url="https://youtube.com/watch?v=old", view_count=100
+        )
+
+    def test_scores_are_written_per_window(self):
+        """Test one score row is written per configured window."""
+        result = self.service.update_scores(now=self.now)
+
+        self.assertEqual(result["scores_updated"], 3)
+        self.assertEqual(
+            set(VideoTrendingScore.objects.values_list("window", flat=True)),
+            {"1h", "24h", "7d"},
+        )
+
+    def test_activity_is_not_counted_twice(self):
+        """Test re-running without new activity leaves scores unchanged."""
+        self.service.update_scores(now=self.now)
+        before = VideoTrendingScore.objects.get(video=self.old_hit, window="24h").score
+
+        result = self.service.update_scores(now=self.now + timedelta(minutes=5))
+
+        self.assertEqual(result["scores_updated"], 0)
+        after = VideoTrendingScore.objects.get(video=self.old_hit, window="24h").score
+        self.assertEqual(before, after)
+
+    def test_recent_activity_wins_in_short_window(self):
+        """Test decay favours fresh activity in 1h but not in 7d."""
+        self.service.update_scores(now=self.now)
+
+        later = self.now + timedelta(hours=2)
+        new_video = Video.objects.create(
+            title="New", url="https://youtube.com/watch?v=new", view_count=10
+        )
+        Comment.objects.create(video=new_video, author="A", content="First!")
+        self.service.update_scores(now=later)
+
+        short = self.service.get_trending(window="1h", now=later)
+        long = self.service.get_trending(window="7d", now=later)
+
+        self.assertEqual([row.video for row in short], [new_video, self.old_hit])
+        self.assertEqual([row.video for row in long], [self.old_hit, new_video])
+        self.assertAlmostEqual(short[0].current_score, 20.0)
+        self.assertAlmostEqual(short[1].current_score, 100 * 2.718281828**-2, 3)
+
+    def test_only_new_engagement_is_added(self):
+        """Test further views add to the existing score."""
+        self.service.update_scores(now=self.now)
+
+        self.old_hit.view_count += 50
+        self.old_hit.save()
+        self.service.update_scores(now=self.now)
+
+        [row] = self.service.get_trending(window="24h", now=self.now)
+        self.assertAlmostEqual(row.current_score, 150.0)
+        self.assertEqual(row.view_count, 150)
+
+    def test_task_logs_result(self):
+        """Test the beat task runs the update."""
+        result = update_trending_scores.apply().get()
+
+        self.assertEqual(result["scores_updated"], 3)
+
+
+class VideoTrendingAPITest(TestCase):
+    """Test suite for the trending endpoint."""
+
+    def setUp(self):
+        for i, views in enumerate([5, 50, 20]):
+            Video.objects.create(
+                title=f"Video {i}",
+                url=f"https://youtube.com/watch?v=trend{i}",
+                view_count=views,
+            )
+        TrendingService().update_scores()
+
+    def test_trending_returns_top_n(self):
+        """Test results are ordered by score and limited."""
+        response = self.client.get(
+            reverse("video-trending"), {"window": "1h", "limit": 2}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["window"], "1h")
+        self.assertEqual(
+            [row["title"] for row in data["results"]], ["Video 1", "Video 2"]
+        )
+
+    def test_invalid_window_returns_400(self):
+        """Test unknown windows are rejected."""
+        response = self.client.get(reverse("video-trending"), {"window": "30d"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
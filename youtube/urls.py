@@ -7,11 +7,29 @@ from .views import (
     CommentListCreateAPI,
     CommentDetailUpdateDeleteAPI,
     CommentLikeAPI,
+    VideoBulkCreateAPI,
+    CommentBulkCreateAPI,
+    VideoExportAPI,
+    CommentExportAPI,
+    SearchAPI,
+    VideoTrendingAPI,
+    VideoStatsAPI,
+    StatsAPI,
+    VideoListAsyncAPI,
+    VideoDetailAsyncAPI,
+    VideoIncrementViewsAsyncAPI,
+    VideoLikeAsyncAPI,
+    CommentLikeAsyncAPI,
+    HealthAPI,
 )
 
 urlpatterns = [
+    path("healthz/", HealthAPI.as_view(), name="healthz"),
     # Video URLs
     path("api/videos/", VideoListCreateAPI.as_view(), name="video-list"),
+    path("api/videos/bulk/", VideoBulkCreateAPI.as_view(), name="video-bulk-create"),
+    path("api/videos/export/", VideoExportAPI.as_view(), name="video-export"),
+    path("api/videos/trending/", VideoTrendingAPI.as_view(), name="video-trending"),
     path(
         "api/videos/<int:pk>/",
         VideoDetailUpdateDeleteAPI.as_view(),
@@ -23,12 +41,45 @@ urlpatterns = [
         name="video-increment-views",
     ),
     path("api/videos/<int:pk>/like/", VideoLikeAPI.as_view(), name="video-like"),
+    path("api/videos/<int:pk>/stats/", VideoStatsAPI.as_view(), name="video-stats"),
     # Comment URLs
     path("api/comments/", CommentListCreateAPI.as_view(), name="comment-list"),
+    path(
+        "api/comments/bulk/",
+        CommentBulkCreateAPI.as_view(),
+        name="comment-bulk-create",
+    ),
+    path("api/comments/export/", CommentExportAPI.as_view(), name="comment-export"),
     path(
         "api/comments/<int:pk>/",
         CommentDetailUpdateDeleteAPI.as_view(),
         name="comment-detail",
     ),
     path("api/comments/<int:pk>/like/", CommentLikeAPI.as_view(), name="comment-like"),
+    # Statistics URLs
+    path("api/stats/", StatsAPI.as_view(), name="stats"),
+    # Search URLs
+    path("api/search/", SearchAPI.as_view(), name="search"),
+    # Async (ASGI) read and counter URLs
+    path("api/async/videos/", VideoListAsyncAPI.as_view(), name="async-video-list"),
+    path(
+        "api/async/videos/<int:pk>/",
+        VideoDetailAsyncAPI.as_view(),
+        name="async-video-detail",
+    ),
+    path(
+        "api/async/videos/<int:pk>/increment_views/",
+        VideoIncrementViewsAsyncAPI.as_view(),
+        name="async-video-increment-views",
+    ),
+    path(
+        "api/async/videos/<int:pk>/like/",
+        VideoLikeAsyncAPI.as_view(),
+        name="async-video-like",
+    ),
+    path(
+        "api/async/comments/<int:pk>/like/",
+        CommentLikeAsyncAPI.as_view(),
+        name="async-comment-like",
+    ),
 ]
@@ -5,6 +5,20 @@ from .video_like import VideoLikeAPI
 from .comment_list_create import CommentListCreateAPI
 from .comment_detail_update_delete import CommentDetailUpdateDeleteAPI
 from .comment_like import CommentLikeAPI
+from .video_bulk_create import VideoBulkCreateAPI
+from .comment_bulk_create import CommentBulkCreateAPI
+from .video_export import VideoExportAPI
+from .comment_export import CommentExportAPI
+from .search import SearchAPI
+from .video_trending import VideoTrendingAPI
+from .video_stats import VideoStatsAPI
+from .stats import StatsAPI
+from .video_list_async import VideoListAsyncAPI
+from .video_detail_async import VideoDetailAsyncAPI
+from .video_increment_views_async import VideoIncrementViewsAsyncAPI
+from .video_like_async import VideoLikeAsyncAPI
+from .comment_like_async import CommentLikeAsyncAPI
+from .health import HealthAPI
 
 __all__ = [
     "VideoListCreateAPI",
@@ -14,4 +28,18 @@ __all__ = [
     "CommentListCreateAPI",
     "CommentDetailUpdateDeleteAPI",
     "CommentLikeAPI",
+    "VideoBulkCreateAPI",
+    "CommentBulkCreateAPI",
+    "VideoExportAPI",
+    "CommentExportAPI",
+    "SearchAPI",
+    "VideoTrendingAPI",
+    "VideoStatsAPI",
+    "StatsAPI",
+    "VideoListAsyncAPI",
+    "VideoDetailAsyncAPI",
+    "VideoIncrementViewsAsyncAPI",
+    "VideoLikeAsyncAPI",
+    "CommentLikeAsyncAPI",
+    "HealthAPI",
 ]
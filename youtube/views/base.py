@@ -1,7 +1,112 @@
-from rest_framework.pagination import PageNumberPagination
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import Http404, JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from youtube.exceptions import drf_default_with_modifications_exception_handler
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class SearchResultsCursorPagination(CursorPagination):
+    """Cursor pagination over search results, best match first."""
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-rank", "-id")
+
+
+class AsyncStandardResultsSetPagination(StandardResultsSetPagination):
+    """Async page-number pagination with a cached total count.
+
+    Produces the same ``count``/``next``/``previous``/``results`` payload as
+    ``StandardResultsSetPagination``. The COUNT query is cached for
+    ``LIST_COUNT_CACHE_SECONDS`` so repeated page loads skip it.
+    """
+
+    async def apaginate_queryset(self, queryset, request, *, count_cache_key: str):
+        self.request = Request(request)
+        page_size = self.get_page_size(self.request)
+
+        count = await cache.aget(count_cache_key)
+        if count is None:
+            count = await queryset.acount()
+            await cache.aset(count_cache_key, count, settings.LIST_COUNT_CACHE_SECONDS)
+
+        num_pages = max(1, math.ceil(count / page_size))
+        page_number = self.request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            page_number = num_pages
+        try:
+            page_number = int(page_number)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_page_message.format(page_number=page_number))
+        if page_number < 1 or page_number > num_pages:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number))
+
+        self.count = count
+        self.page_number = page_number
+        self.num_pages = num_pages
+
+        offset = (page_number - 1) * page_size
+        return [obj async for obj in queryset[offset : offset + page_size]]
+
+    def get_paginated_data(self, data):
+        url = self.request.build_absolute_uri()
+        next_link = None
+        previous_link = None
+
+        if self.page_number < self.num_pages:
+            next_link = replace_query_param(
+                url, self.page_query_param, self.page_number + 1
+            )
+        if self.page_number > 1:
+            if self.page_number - 1 == 1:
+                previous_link = remove_query_param(url, self.page_query_param)
+            else:
+                previous_link = replace_query_param(
+                    url, self.page_query_param, self.page_number - 1
+                )
+
+        return {
+            "count": self.count,
+            "next": next_link,
+            "previous": previous_link,
+            "results": data,
+        }
+
+
+class AsyncAPIView(View):
+    """Base class for async JSON views served natively under ASGI.
+
+    DRF's ``APIView`` is sync-only, so these views subclass Django's ``View``
+    and reuse the project exception handler to keep error payloads identical.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except (ValidationError, Http404, PermissionDenied, APIException) as exc:
+            response = drf_default_with_modifications_exception_handler(
+                exc, {"view": self, "request": request}
+            )
+            if response is None:
+                raise
+            return JsonResponse(response.data, status=response.status_code)
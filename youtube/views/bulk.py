@@ -0,0 +1,44 @@
+from django.conf import settings
+from rest_framework import exceptions, status
+
+
+def parse_bool_param(request, name: str) -> bool:
+    return request.query_params.get(name, "").lower() in ("1", "true", "yes")
+
+
+def validate_bulk_items(request, input_serializer_class):
+    """Validate each item of a bulk request body in a single pass.
+
+    Returns ``(valid_items, errors)`` where ``valid_items`` holds
+    ``(index, validated_data)`` pairs and ``errors`` holds per-item errors.
+    """
+    items = request.data
+    if not isinstance(items, list):
+        raise exceptions.ValidationError(
+            "Expected a JSON array or an application/x-ndjson stream of items."
+        )
+    if len(items) > settings.BULK_MAX_ITEMS:
+        raise exceptions.ValidationError(
+            f"Too many items: {len(items)} (maximum {settings.BULK_MAX_ITEMS})."
+        )
+
+    valid_items = []
+    errors = []
+    for index, item in enumerate(items):
+        serializer = input_serializer_class(data=item)
+        if serializer.is_valid():
+            valid_items.append((index, serializer.validated_data))
+        else:
+            errors.append({"index": index, "errors": serializer.errors})
+
+    return valid_items, errors
+
+
+def bulk_response_status(result, errors) -> int:
+    """201 when everything was written, 400 when nothing was, else 207."""
+    written = len(result.get("created_ids", [])) + len(result.get("updated_ids", []))
+    if not errors:
+        return status.HTTP_201_CREATED
+    if not written:
+        return status.HTTP_400_BAD_REQUEST
+    return status.HTTP_207_MULTI_STATUS
@@ -0,0 +1,45 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from youtube.parsers import NDJSONParser, ORJSONParser
+from youtube.services.comment_service import CommentService
+from .bulk import bulk_response_status, parse_bool_param, validate_bulk_items
+from .comment_list_create import CommentListCreateAPI
+
+
+class CommentBulkCreateAPI(APIView):
+    """Create many comments at once from a JSON array or an NDJSON stream.
+
+    Pass ``?atomic=true`` to write nothing unless every item is valid.
+    """
+
+    parser_classes = [ORJSONParser, NDJSONParser]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.comment_service = CommentService()
+
+    def post(self, request):
+        valid_items, errors = validate_bulk_items(
+            request, CommentListCreateAPI.InputSerializer
+        )
+        atomic = parse_bool_param(request, "atomic")
+
+        result = {"created_ids": [], "errors": []}
+        if valid_items and not (atomic and errors):
+            items = []
+            for _, data in valid_items:
+                item = dict(data)
+                item["video_id"] = item.pop("video")
+                items.append(item)
+            result = self.comment_service.bulk_create(items=items, atomic=atomic)
+
+        # Service errors are positions within valid_items; map them back
+        errors.extend(
+            {**error, "index": valid_items[error["index"]][0]}
+            for error in result["errors"]
+        )
+        errors.sort(key=lambda error: error["index"])
+
+        data = {"created_ids": result["created_ids"], "errors": errors}
+        return Response(data, status=bulk_response_status(result, errors))
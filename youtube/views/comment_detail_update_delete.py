@@ -1,15 +1,19 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
+from youtube.serializers import CompiledSerializer, SparseFieldsMixin
 from youtube.services.comment_service import CommentService
+from .fields import requested_fields
 
 
 class CommentDetailUpdateDeleteAPI(APIView):
+    read_replica = True
+
     class InputSerializer(serializers.Serializer):
         author = serializers.CharField(max_length=100, required=False)
         content = serializers.CharField(required=False)
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsMixin, serializers.Serializer):
         id = serializers.IntegerField()
         video = serializers.SerializerMethodField()
         author = serializers.CharField()
@@ -19,15 +23,20 @@ class CommentDetailUpdateDeleteAPI(APIView):
         updated_at = serializers.DateTimeField()
 
         def get_video(self, obj):
-            return obj.video.id
+            return obj.video_id
+
+    compiled_output = CompiledSerializer(OutputSerializer)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.comment_service = CommentService()
 
     def get(self, request, pk):
-        comment = self.comment_service.get_by_id(comment_id=pk)
-        serializer = self.OutputSerializer(comment)
+        fields = requested_fields(
+            request.query_params, default=list(self.compiled_output.fields)
+        )
+        comment = self.comment_service.get_by_id(comment_id=pk, only=fields)
+        serializer = self.OutputSerializer(comment, fields=fields)
         return Response(serializer.data)
 
     def put(self, request, pk):
@@ -0,0 +1,14 @@
+from django.http import JsonResponse
+
+from youtube.services.comment_service import CommentService
+from .base import AsyncAPIView
+
+
+class CommentLikeAsyncAPI(AsyncAPIView):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.comment_service = CommentService()
+
+    async def post(self, request, pk):
+        like_count = await self.comment_service.aincrement_likes(comment_id=pk)
+        return JsonResponse({"like_count": like_count})
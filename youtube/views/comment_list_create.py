@@ -2,10 +2,14 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
 from youtube.services.comment_service import CommentService
+from youtube.serializers import CompiledSerializer
 from .base import StandardResultsSetPagination
+from .fields import requested_fields
 
 
 class CommentListCreateAPI(APIView):
+    read_replica = True
+
     class InputSerializer(serializers.Serializer):
         video = serializers.IntegerField()
         author = serializers.CharField(max_length=100)
@@ -21,7 +25,9 @@ class CommentListCreateAPI(APIView):
         updated_at = serializers.DateTimeField()
 
         def get_video(self, obj):
-            return obj.video.id
+            return obj.video_id
+
+    compiled_output = CompiledSerializer(OutputSerializer)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -32,12 +38,15 @@ class CommentListCreateAPI(APIView):
         if video_id is not None:
             video_id = int(video_id)
 
-        comments = self.comment_service.get_by_video(video_id=video_id)
+        fields = requested_fields(
+            request.query_params, default=list(self.compiled_output.fields)
+        )
+        output = self.compiled_output.only(fields)
+        comments = output.values(self.comment_service.get_by_video(video_id=video_id))
 
         paginator = StandardResultsSetPagination()
         paginated_comments = paginator.paginate_queryset(comments, request)
-        serializer = self.OutputSerializer(paginated_comments, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(output.serialize(paginated_comments))
 
     def post(self, request):
         serializer = self.InputSerializer(data=request.data)
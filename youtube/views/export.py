@@ -0,0 +1,47 @@
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.views import APIView
+
+from youtube.renderers import CSVRenderer, NDJSONRenderer
+from youtube.services.export_service import ExportService
+
+
+class BaseExportAPI(APIView):
+    """Stream every row of ``resource`` as NDJSON (default) or CSV.
+
+    The format is picked by ``?format=ndjson|csv`` or the Accept header.
+    CompressionMiddleware compresses the stream chunk by chunk when the
+    client accepts an encoding.
+    """
+
+    resource = ""
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    class FilterSerializer(serializers.Serializer):
+        since = serializers.DateTimeField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.export_service = ExportService()
+
+    def get(self, request):
+        filters = self.FilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        renderer = request.accepted_renderer
+
+        response = StreamingHttpResponse(
+            self.export_service.stream(
+                resource=self.resource,
+                export_format=renderer.format,
+                since=filters.validated_data.get("since"),
+            ),
+            content_type=f"{renderer.media_type}; charset=utf-8",
+        )
+
+        stamp = timezone.now().strftime("%Y%m%dT%H%M%SZ")
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.resource}-{stamp}.{renderer.format}"'
+        )
+        return response
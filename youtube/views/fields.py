@@ -0,0 +1,35 @@
+from typing import List, Sequence
+
+from rest_framework import exceptions
+
+
+def parse_csv_param(query_params, name: str) -> List[str]:
+    value = query_params.get(name, "")
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def requested_fields(
+    query_params, *, default: Sequence[str], expandable: Sequence[str] = ()
+) -> List[str]:
+    """Resolve ``?fields=`` and ``?expand=`` into the output field names.
+
+    Without ``?fields=`` the ``default`` fields are returned. ``expandable``
+    fields are only included when named in ``?expand=`` (or ``?fields=``).
+    Unknown names are a 400; the result keeps declaration order.
+    """
+    available = [*default, *expandable]
+    fields = parse_csv_param(query_params, "fields")
+    expand = parse_csv_param(query_params, "expand")
+
+    errors = {}
+    unknown_fields = [name for name in fields if name not in available]
+    if unknown_fields:
+        errors["fields"] = [f"Unknown field(s): {', '.join(unknown_fields)}."]
+    unknown_expand = [name for name in expand if name not in available]
+    if unknown_expand:
+        errors["expand"] = [f"Cannot expand: {', '.join(unknown_expand)}."]
+    if errors:
+        raise exceptions.ValidationError(errors)
+
+    selected = set(fields or default) | set(expand)
+    return [name for name in available if name in selected]
@@ -0,0 +1,16 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class HealthAPI(APIView):
+    """Liveness check for load balancers and orchestrators.
+
+    Does no database or cache work, so it stays cheap at high probe rates
+    and reports the process as alive even while a dependency is down.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        return Response({"status": "ok"})
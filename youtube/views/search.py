@@ -0,0 +1,56 @@
+from rest_framework import serializers
+from rest_framework.views import APIView
+
+from youtube.services.search_service import SearchService
+from youtube.views.base import SearchResultsCursorPagination
+
+
+class SearchAPI(APIView):
+    read_replica = True
+
+    class FilterSerializer(serializers.Serializer):
+        q = serializers.CharField(max_length=200)
+        type = serializers.ChoiceField(
+            choices=list(SearchService.MODELS), default="video"
+        )
+
+    class VideoOutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        title = serializers.CharField()
+        description = serializers.CharField()
+        url = serializers.URLField()
+        thumbnail_url = serializers.URLField(allow_null=True)
+        view_count = serializers.IntegerField()
+        like_count = serializers.IntegerField()
+        created_at = serializers.DateTimeField()
+        rank = serializers.FloatField()
+
+    class CommentOutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        video = serializers.IntegerField(source="video_id")
+        author = serializers.CharField()
+        content = serializers.CharField()
+        like_count = serializers.IntegerField()
+        created_at = serializers.DateTimeField()
+        rank = serializers.FloatField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.search_service = SearchService()
+
+    def get(self, request):
+        filters = self.FilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        search_type = filters.validated_data["type"]
+
+        results = self.search_service.search(
+            query=filters.validated_data["q"], search_type=search_type
+        )
+
+        paginator = SearchResultsCursorPagination()
+        page = paginator.paginate_queryset(results, request)
+        if search_type == "comment":
+            serializer = self.CommentOutputSerializer(page, many=True)
+        else:
+            serializer = self.VideoOutputSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from youtube.services.statistics_service import StatisticsService
+
+
+class StatsAPI(APIView):
+    """Platform-wide engagement statistics from the running totals."""
+
+    read_replica = True
+
+    class OutputSerializer(serializers.Serializer):
+        class VideoStatsSerializer(serializers.Serializer):
+            total_videos = serializers.IntegerField()
+            avg_views = serializers.FloatField(allow_null=True)
+            avg_likes = serializers.FloatField(allow_null=True)
+            max_views = serializers.IntegerField(allow_null=True)
+            max_likes = serializers.IntegerField(allow_null=True)
+
+        class CommentStatsSerializer(serializers.Serializer):
+            total_comments = serializers.IntegerField()
+            avg_likes = serializers.FloatField(allow_null=True)
+
+        class MostCommentedSerializer(serializers.Serializer):
+            id = serializers.IntegerField()
+            title = serializers.CharField()
+            comment_count = serializers.IntegerField()
+            view_count = serializers.IntegerField()
+            like_count = serializers.IntegerField()
+
+        video_stats = VideoStatsSerializer()
+        comment_stats = CommentStatsSerializer()
+        most_commented_videos = MostCommentedSerializer(many=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics_service = StatisticsService()
+
+    def get(self, request):
+        stats = self.statistics_service.get_statistics()
+        serializer = self.OutputSerializer(stats)
+        return Response(serializer.data)
@@ -0,0 +1,49 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from youtube.parsers import NDJSONParser, ORJSONParser
+from youtube.services.video_service import VideoService
+from .bulk import bulk_response_status, parse_bool_param, validate_bulk_items
+from .video_list_create import VideoListCreateAPI
+
+
+class VideoBulkCreateAPI(APIView):
+    """Create (or with ``?upsert=true`` update by url) many videos at once.
+
+    Accepts a JSON array or an NDJSON stream. Pass ``?atomic=true`` to write
+    nothing unless every item is valid.
+    """
+
+    parser_classes = [ORJSONParser, NDJSONParser]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.video_service = VideoService()
+
+    def post(self, request):
+        valid_items, errors = validate_bulk_items(
+            request, VideoListCreateAPI.InputSerializer
+        )
+        atomic = parse_bool_param(request, "atomic")
+
+        result = {"created_ids": [], "updated_ids": [], "errors": []}
+        if valid_items and not (atomic and errors):
+            result = self.video_service.bulk_create(
+                items=[data for _, data in valid_items],
+                upsert=parse_bool_param(request, "upsert"),
+                atomic=atomic,
+            )
+
+        # Service errors are positions within valid_items; map them back
+        errors.extend(
+            {**error, "index": valid_items[error["index"]][0]}
+            for error in result["errors"]
+        )
+        errors.sort(key=lambda error: error["index"])
+
+        data = {
+            "created_ids": result["created_ids"],
+            "updated_ids": result["updated_ids"],
+            "errors": errors,
+        }
+        return Response(data, status=bulk_response_status(result, errors))
@@ -0,0 +1,21 @@
+from django.http import JsonResponse
+
+from youtube.services.video_service import VideoService
+from .base import AsyncAPIView
+from .video_detail_update_delete import VideoDetailUpdateDeleteAPI
+
+
+class VideoDetailAsyncAPI(AsyncAPIView):
+    read_replica = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.video_service = VideoService()
+
+    async def get(self, request, pk):
+        fields = VideoDetailUpdateDeleteAPI.get_fields(request.GET)
+        video = await self.video_service.aget_by_id(
+            video_id=pk, **VideoDetailUpdateDeleteAPI.get_options(fields)
+        )
+        serializer = VideoDetailUpdateDeleteAPI.OutputSerializer(video, fields=fields)
+        return JsonResponse(serializer.data)
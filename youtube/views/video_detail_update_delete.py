@@ -1,10 +1,15 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
+from youtube.serializers import SparseFieldsMixin
 from youtube.services.video_service import VideoService
+from .comment_detail_update_delete import CommentDetailUpdateDeleteAPI
+from .fields import requested_fields
 
 
 class VideoDetailUpdateDeleteAPI(APIView):
+    read_replica = True
+
     class InputSerializer(serializers.Serializer):
         title = serializers.CharField(max_length=200, required=False)
         description = serializers.CharField(required=False, allow_blank=True)
@@ -12,7 +17,7 @@ class VideoDetailUpdateDeleteAPI(APIView):
         thumbnail_url = serializers.URLField(required=False, allow_null=True)
         duration = serializers.IntegerField(required=False, allow_null=True)
 
-    class OutputSerializer(serializers.Serializer):
+    class OutputSerializer(SparseFieldsMixin, serializers.Serializer):
         id = serializers.IntegerField()
         title = serializers.CharField()
         description = serializers.CharField()
@@ -27,8 +32,6 @@ class VideoDetailUpdateDeleteAPI(APIView):
         comments_count = serializers.IntegerField()
 
         def get_comments(self, obj):
-            from .comment_detail_update_delete import CommentDetailUpdateDeleteAPI
-
             return CommentDetailUpdateDeleteAPI.OutputSerializer(
                 obj.comments.all(), many=True
             ).data
@@ -38,10 +41,28 @@ class VideoDetailUpdateDeleteAPI(APIView):
         self.video_service = VideoService()
 
     def get(self, request, pk):
-        video = self.video_service.get_by_id(video_id=pk)
-        serializer = self.OutputSerializer(video)
+        fields = self.get_fields(request.query_params)
+        video = self.video_service.get_by_id(video_id=pk, **self.get_options(fields))
+        serializer = self.OutputSerializer(video, fields=fields)
         return Response(serializer.data)
 
+    @classmethod
+    def get_fields(cls, query_params):
+        return requested_fields(
+            query_params, default=list(cls.OutputSerializer().fields)
+        )
+
+    @staticmethod
+    def get_options(fields):
+        """Load only the requested columns, comments and comment count."""
+        return {
+            "only": [
+                name for name in fields if name not in ("comments", "comments_count")
+            ],
+            "comments": "comments" in fields,
+            "comments_count": "comments_count" in fields,
+        }
+
     def put(self, request, pk):
         self.video_service.get_by_id(video_id=pk)
 
@@ -0,0 +1,5 @@
+from .export import BaseExportAPI
+
+
+class VideoExportAPI(BaseExportAPI):
+    resource = "videos"
@@ -0,0 +1,17 @@
+from django.http import JsonResponse
+
+from youtube.services.engagement_service import EngagementService
+from youtube.services.video_service import VideoService
+from .base import AsyncAPIView
+
+
+class VideoIncrementViewsAsyncAPI(AsyncAPIView):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.video_service = VideoService()
+        self.engagement_service = EngagementService()
+
+    async def post(self, request, pk):
+        view_count = await self.video_service.aincrement_views(video_id=pk)
+        await self.engagement_service.arecord(video_id=pk, views=1)
+        return JsonResponse({"view_count": view_count})
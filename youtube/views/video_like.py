@@ -1,6 +1,7 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers
+from youtube.services.engagement_service import EngagementService
 from youtube.services.video_service import VideoService
 
 
@@ -11,8 +12,10 @@ class VideoLikeAPI(APIView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.video_service = VideoService()
+        self.engagement_service = EngagementService()
 
     def post(self, request, pk):
         video = self.video_service.increment_likes(video_id=pk)
+        self.engagement_service.record(video_id=pk, likes=1)
         serializer = self.OutputSerializer({"like_count": video.like_count})
         return Response(serializer.data)
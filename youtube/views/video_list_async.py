@@ -0,0 +1,32 @@
+from django.http import HttpResponse
+
+from youtube.renderers import ORJSONRenderer
+from .base import AsyncAPIView, AsyncStandardResultsSetPagination
+from .video_list_create import VideoListCreateAPI
+
+
+class VideoListAsyncAPI(AsyncAPIView):
+    read_replica = True
+
+    COUNT_CACHE_KEY = "youtube:video-list:count"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.list_api = VideoListCreateAPI()
+
+    async def get(self, request):
+        fields = self.list_api.get_fields(request.GET)
+        videos = self.list_api.get_values(fields).order_by("-created_at")
+
+        paginator = AsyncStandardResultsSetPagination()
+        page = await paginator.apaginate_queryset(
+            videos, request, count_cache_key=self.COUNT_CACHE_KEY
+        )
+        data = self.list_api.serialize_page(fields, page)
+        if "comments" in fields:
+            comments = self.list_api.get_comment_values([row["id"] for row in page])
+            self.list_api.expand_comments(data, page, [row async for row in comments])
+        return HttpResponse(
+            ORJSONRenderer().render(paginator.get_paginated_data(data)),
+            content_type="application/json",
+        )
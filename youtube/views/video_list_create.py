@@ -1,12 +1,20 @@
+from collections import defaultdict
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import serializers, status
 
+from youtube.services.comment_service import CommentService
 from youtube.services.video_service import VideoService
+from youtube.serializers import CompiledSerializer
 from youtube.views.base import StandardResultsSetPagination
+from youtube.views.comment_detail_update_delete import CommentDetailUpdateDeleteAPI
+from youtube.views.fields import requested_fields
 
 
 class VideoListCreateAPI(APIView):
+    read_replica = True
+
     class InputSerializer(serializers.Serializer):
         title = serializers.CharField(max_length=200)
         description = serializers.CharField(allow_blank=True)
@@ -27,17 +35,25 @@ class VideoListCreateAPI(APIView):
         updated_at = serializers.DateTimeField()
         comments_count = serializers.IntegerField()
 
+    compiled_output = CompiledSerializer(OutputSerializer)
+    EXPANDABLE_FIELDS = ["comments"]
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.video_service = VideoService()
+        self.comment_service = CommentService()
 
     def get(self, request):
-        videos = self.video_service.get_all()
+        fields = self.get_fields(request.query_params)
+        videos = self.get_values(fields)
 
         paginator = StandardResultsSetPagination()
         paginated_videos = paginator.paginate_queryset(videos, request)
-        serializer = self.OutputSerializer(paginated_videos, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        data = self.serialize_page(fields, paginated_videos)
+        if "comments" in fields:
+            comments = self.get_comment_values([row["id"] for row in paginated_videos])
+            self.expand_comments(data, paginated_videos, list(comments))
+        return paginator.get_paginated_response(data)
 
     def post(self, request):
         serializer = self.InputSerializer(data=request.data)
@@ -47,3 +63,42 @@ class VideoListCreateAPI(APIView):
 
         output_serializer = self.OutputSerializer(video)
         return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+
+    @classmethod
+    def get_fields(cls, query_params):
+        return requested_fields(
+            query_params,
+            default=list(cls.compiled_output.fields),
+            expandable=cls.EXPANDABLE_FIELDS,
+        )
+
+    def get_values(self, fields):
+        """Select only the requested columns; ``id`` is always fetched so
+        comments can be attached to their video."""
+        output = self.compiled_output.only(self._column_fields(fields))
+        queryset = self.video_service.get_all(comments_count="comments_count" in fields)
+        return queryset.values(*dict.fromkeys(["id", *output.fields]))
+
+    def get_comment_values(self, video_ids):
+        return CommentDetailUpdateDeleteAPI.compiled_output.values(
+            self.comment_service.get_for_videos(video_ids=video_ids)
+        )
+
+    @classmethod
+    def serialize_page(cls, fields, rows):
+        return cls.compiled_output.only(cls._column_fields(fields)).serialize(rows)
+
+    @staticmethod
+    def expand_comments(data, rows, comment_rows):
+        """Attach each video's comments, serialized as on the detail view."""
+        by_video = defaultdict(list)
+        for comment in CommentDetailUpdateDeleteAPI.compiled_output.serialize(
+            comment_rows
+        ):
+            by_video[comment["video"]].append(comment)
+        for item, row in zip(data, rows):
+            item["comments"] = by_video[row["id"]]
+
+    @classmethod
+    def _column_fields(cls, fields):
+        return [name for name in fields if name not in cls.EXPANDABLE_FIELDS]
@@ -0,0 +1,68 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from youtube.services.engagement_service import EngagementService
+
+
+class VideoStatsAPI(APIView):
+    """Views and likes over time, served from the engagement buckets."""
+
+    read_replica = True
+
+    class FilterSerializer(serializers.Serializer):
+        to = serializers.DateTimeField(required=False)
+        bucket = serializers.ChoiceField(
+            choices=EngagementService.GRANULARITIES, default="hour"
+        )
+
+        def get_fields(self):
+            # "from" is a Python keyword, so it cannot be declared above
+            fields = super().get_fields()
+            fields["from"] = serializers.DateTimeField(required=False)
+            return fields
+
+    class OutputSerializer(serializers.Serializer):
+        class PointSerializer(serializers.Serializer):
+            start = serializers.DateTimeField()
+            views = serializers.IntegerField()
+            likes = serializers.IntegerField()
+
+        class TotalsSerializer(serializers.Serializer):
+            views = serializers.IntegerField()
+            likes = serializers.IntegerField()
+
+        video_id = serializers.IntegerField()
+        bucket = serializers.CharField()
+        to = serializers.DateTimeField()
+        totals = TotalsSerializer()
+        results = PointSerializer(many=True)
+
+        def get_fields(self):
+            fields = super().get_fields()
+            fields["from"] = serializers.DateTimeField()
+            return fields
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.engagement_service = EngagementService()
+
+    def get(self, request, pk):
+        filters = self.FilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        end = filters.validated_data.get("to") or timezone.now()
+        start = filters.validated_data.get("from") or end - timedelta(days=1)
+
+        history = self.engagement_service.get_history(
+            video_id=pk,
+            start=start,
+            end=end,
+            bucket=filters.validated_data["bucket"],
+        )
+
+        serializer = self.OutputSerializer(history)
+        return Response(serializer.data)
@@ -0,0 +1,47 @@
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from youtube.services.trending_service import TrendingService
+
+
+class VideoTrendingAPI(APIView):
+    """Top videos by precomputed time-decayed engagement for a window."""
+
+    read_replica = True
+
+    class FilterSerializer(serializers.Serializer):
+        window = serializers.ChoiceField(choices=[], default="24h")
+        limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.fields["window"].choices = list(settings.TRENDING_WINDOWS)
+
+    class OutputSerializer(serializers.Serializer):
+        id = serializers.IntegerField(source="video.id")
+        title = serializers.CharField(source="video.title")
+        url = serializers.URLField(source="video.url")
+        thumbnail_url = serializers.URLField(source="video.thumbnail_url")
+        view_count = serializers.IntegerField(source="video.view_count")
+        like_count = serializers.IntegerField(source="video.like_count")
+        created_at = serializers.DateTimeField(source="video.created_at")
+        score = serializers.FloatField(source="current_score")
+        computed_at = serializers.DateTimeField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.trending_service = TrendingService()
+
+    def get(self, request):
+        filters = self.FilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        window = filters.validated_data["window"]
+
+        rows = self.trending_service.get_trending(
+            window=window, limit=filters.validated_data["limit"]
+        )
+
+        serializer = self.OutputSerializer(rows, many=True)
+        return Response({"window": window, "results": serializer.data})
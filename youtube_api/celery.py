@@ -4,6 +4,7 @@ Celery configuration for youtube_api project.
 
 import os
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "youtube_api.settings")
@@ -20,6 +21,17 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 
+@task_prerun.connect
+@task_postrun.connect
+def close_old_db_connections(sender=None, **kwargs):
+    """Treat each task like a request: drop connections that have exceeded
+    CONN_MAX_AGE or are broken, and reuse the rest (CELERY_DB_REUSE_MAX)."""
+    from django.db import close_old_connections
+
+    if not getattr(sender.request, "is_eager", False):
+        close_old_connections()
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
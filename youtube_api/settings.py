@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 import os
 import sys
+from datetime import timedelta
 from pathlib import Path
 import environ
 
@@ -54,12 +55,14 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "youtube.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "youtube.middleware.ReplicaRoutingMiddleware",
 ]
 
 ROOT_URLCONF = "youtube_api.urls"
@@ -91,6 +94,20 @@ if "test" in sys.argv or "test_coverage" in sys.argv:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": ":memory:",
+        },
+        # Separate database so tests can tell replica reads from primary reads
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": ":memory:",
+        },
+    }
+elif env.bool("USE_SQLITE", default=False):
+    # File-backed SQLite for local benchmarking without Postgres
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": env("SQLITE_PATH", default=str(BASE_DIR / "db.sqlite3")),
+            "OPTIONS": {"transaction_mode": "IMMEDIATE", "timeout": 20},
         }
     }
 else:
@@ -102,9 +119,67 @@ else:
             "PASSWORD": env("POSTGRES_PASSWORD", default="youtube_password"),
             "HOST": env("POSTGRES_HOST", default="localhost"),
             "PORT": env("POSTGRES_PORT", default="5432"),
+            # Keep connections open between requests and Celery tasks;
+            # health checks replace connections the server has dropped
+            "CONN_MAX_AGE": env.int("DB_CONN_MAX_AGE", default=60),
+            "CONN_HEALTH_CHECKS": env.bool("DB_CONN_HEALTH_CHECKS", default=True),
         }
     }
 
+    if env.bool("DB_POOL", default=False):
+        # psycopg 3 connection pool (uv sync --extra pool). Django hands
+        # pooled connections back on close, so persistent connections are off.
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"] = {
+            "pool": {
+                "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+                "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+                "timeout": env.int("DB_POOL_TIMEOUT", default=10),
+            }
+        }
+
+    if env.bool("DB_PGBOUNCER", default=False):
+        # pgbouncer in transaction mode may run each transaction on a
+        # different server connection, which breaks named cursors
+        DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Read replicas, e.g. DATABASE_REPLICA_HOSTS=replica1,replica2. Each host gets
+# an alias that ``youtube.db_router.ReplicaRouter`` can send reads to.
+DATABASE_REPLICAS = []
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    for index, host in enumerate(env.list("DATABASE_REPLICA_HOSTS", default=[])):
+        alias = f"replica_{index + 1}"
+        DATABASES[alias] = {
+            **DATABASES["default"],
+            "HOST": host,
+            "TEST": {"MIRROR": "default"},
+        }
+        DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["youtube.db_router.ReplicaRouter"]
+
+# After a write, the client's reads stick to the primary for this long
+READ_YOUR_WRITES_SECONDS = env.int("READ_YOUR_WRITES_SECONDS", default=5)
+READ_YOUR_WRITES_COOKIE = "db_primary_pin"
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# e.g. CACHE_URL=redis://redis:6379/1 in production
+
+CACHES = {"default": env.cache("CACHE_URL", default="locmemcache://")}
+
+# Leases and comment request coalescing need a cache shared by every web and
+# worker process. When set, a per-process (locmem) cache fails the system
+# checks and those services refuse to run.
+REQUIRE_SHARED_CACHE = env.bool(
+    "REQUIRE_SHARED_CACHE",
+    default=not DEBUG and "test" not in sys.argv and "test_coverage" not in sys.argv,
+)
+
+# Seconds the async list endpoints reuse a cached COUNT(*)
+LIST_COUNT_CACHE_SECONDS = env.int("LIST_COUNT_CACHE_SECONDS", default=5)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -148,16 +223,60 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # REST Framework settings
+# The HTML browsable API is only offered in development; JSON is rendered
+# and parsed with orjson when it is installed (uv sync --extra fast-json)
+BROWSABLE_API = env.bool("BROWSABLE_API", default=DEBUG)
+
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
+        "youtube.renderers.ORJSONRenderer",
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if BROWSABLE_API else []),
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "youtube.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
     ],
     "EXCEPTION_HANDLER": "youtube.exceptions.drf_default_with_modifications_exception_handler",
 }
 
+# Response compression (zstd and br need the "compression" extra)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_LEVELS = {
+    "gzip": env.int("COMPRESSION_GZIP_LEVEL", default=6),
+    "br": env.int("COMPRESSION_BROTLI_LEVEL", default=4),
+    "zstd": env.int("COMPRESSION_ZSTD_LEVEL", default=3),
+}
+COMPRESSION_CONTENT_TYPES = [
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+]
+
+# Bulk create endpoints: maximum items per request and rows per INSERT
+BULK_MAX_ITEMS = env.int("BULK_MAX_ITEMS", default=5000)
+BULK_BATCH_SIZE = env.int("BULK_BATCH_SIZE", default=500)
+
+# Rows fetched per round trip by the streaming export endpoints
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", default=2000)
+
+# Trending windows: name -> decay time constant in seconds
+TRENDING_WINDOWS = {"1h": 3600, "24h": 86400, "7d": 604800}
+
+# Engagement history: how long minute and hour buckets are kept before
+# being compacted into the next coarser granularity
+ENGAGEMENT_MINUTE_RETENTION = timedelta(
+    hours=env.int("ENGAGEMENT_MINUTE_RETENTION_HOURS", default=24)
+)
+ENGAGEMENT_HOUR_RETENTION = timedelta(
+    days=env.int("ENGAGEMENT_HOUR_RETENTION_DAYS", default=30)
+)
+
+# Rows the running engagement totals are spread over to avoid a hot row
+STATS_SHARDS = env.int("STATS_SHARDS", default=8)
+
 # Celery Configuration
 CELERY_BROKER_URL = env("CELERY_BROKER_URL", default="redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = env("CELERY_RESULT_BACKEND", default="redis://localhost:6379/0")
@@ -174,12 +293,50 @@ CELERY_ENABLE_UTC = True
 # Celery beat configuration
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
-# Celery task routing
+# Celery task routing. Each queue has its own worker (see docker-compose.yml)
+# so a burst of slow LLM calls cannot starve the periodic tasks:
+# - llm: tasks waiting on OpenAI; many slots, prefetch 1 (long, uneven tasks)
+# - db: short database-bound work and fan-out; prefetch a few
+# - housekeeping: stats, compaction, coalescing flushes; small and cheap
 CELERY_TASK_ROUTES = {
-    "youtube.tasks.*": {"queue": "youtube_tasks"},
+    "youtube.tasks.content_generation_tasks.generate_video_content": {"queue": "llm"},
+    "youtube.tasks.content_generation_tasks.generate_comments_for_video": {
+        "queue": "llm"
+    },
+    "youtube.tasks.content_generation_tasks.populate_videos": {"queue": "llm"},
+    "youtube.tasks.content_generation_tasks.populate_initial_content": {"queue": "db"},
+    "youtube.tasks.content_generation_tasks.finish_initial_population": {"queue": "db"},
+    "youtube.tasks.engagement_tasks.simulate_user_engagement": {"queue": "db"},
+    "youtube.tasks.trending_tasks.update_trending_scores": {"queue": "db"},
+    "youtube.tasks.content_generation_tasks.flush_comment_requests": {
+        "queue": "housekeeping"
+    },
+    "youtube.tasks.engagement_tasks.generate_engagement_stats": {
+        "queue": "housekeeping"
+    },
+    "youtube.tasks.engagement_tasks.compact_engagement_buckets": {
+        "queue": "housekeeping"
+    },
+    # New tasks default to the db queue until routed explicitly
+    "youtube.tasks.*": {"queue": "db"},
 }
 
-# Celery worker configuration
+# Celery worker configuration; per-queue workers override concurrency and
+# prefetch on the command line (-c, --prefetch-multiplier)
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+
+# Celery closes every database connection around each task unless this is
+# set; connections are then only force-closed every N tasks and otherwise
+# follow CONN_MAX_AGE (see youtube_api/celery.py)
+CELERY_DB_REUSE_MAX = env.int("CELERY_DB_REUSE_MAX", default=100)
+
+# Comment generation requests for the same video within this many seconds
+# are merged into one LLM call (0 disables); see CommentRequestService
+COMMENT_COALESCE_SECONDS = env.int("COMMENT_COALESCE_SECONDS", default=30)
+
+# populate_initial_content: videos per subtask, and how long the shared
+# progress counter (in the cache) lives
+POPULATE_BATCH_SIZE = env.int("POPULATE_BATCH_SIZE", default=1)
+POPULATE_PROGRESS_TIMEOUT = env.int("POPULATE_PROGRESS_TIMEOUT", default=24 * 3600)
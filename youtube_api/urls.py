@@ -16,9 +16,14 @@ Including another URLconf
 """
 
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("", include("youtube.urls")),
 ]
+
+# Admin assets under gunicorn while DEBUG is on (runserver did this itself);
+# empty when DEBUG is off
+urlpatterns += staticfiles_urlpatterns()